@@ -0,0 +1,5 @@
+"""
+Benchmarks for the Emotion Recognition application.
+
+Run from the repository root, e.g. ``python -m benchmarks.bench_face_detectors <dir>``.
+"""
@@ -0,0 +1,145 @@
+"""
+Latency and recall benchmark for the face-detector backends.
+
+Usage:
+    python -m benchmarks.bench_face_detectors <image_dir> [--backends haar,dnn,mtcnn]
+                                             [--labels labels.json] [--repeat 3] [--output report.json]
+
+``labels.json`` maps image paths (relative to <image_dir>) to lists of
+ground-truth ``[x, y, w, h]`` boxes. Without labels, recall is replaced by
+the fraction of images in which at least one face was found.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import cv2
+import numpy as np
+
+from src.config import INFERENCE_SHORT_SIDE
+from src.features.batch_processor import iter_image_files, read_image
+from src.features.face_detectors import FACE_DETECTORS, create_face_detector
+
+
+def iou(box_a, box_b):
+    """Tỉ lệ giao trên hợp của hai box [x, y, w, h]"""
+    ax, ay, aw, ah = box_a
+    bx, by, bw, bh = box_b
+    inter_w = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    inter_h = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = inter_w * inter_h
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+
+def count_matches(predicted, truth, threshold=0.5):
+    """Số box thật được khớp với một box dự đoán (IoU >= threshold, khớp 1-1)"""
+    unused = list(predicted)
+    matched = 0
+    for gt in truth:
+        best = max(unused, key=lambda box: iou(box, gt), default=None)
+        if best is not None and iou(best, gt) >= threshold:
+            unused.remove(best)
+            matched += 1
+    return matched
+
+
+def load_images(image_dir, short_side):
+    """Đọc và thu nhỏ ảnh về độ phân giải suy luận, trả về (đường dẫn, ảnh, tỉ lệ)"""
+    images = []
+    for file_path in iter_image_files(image_dir):
+        img = read_image(file_path)
+        if img is None:
+            continue
+        scale = 1.0
+        if short_side and min(img.shape[:2]) > short_side:
+            scale = short_side / min(img.shape[:2])
+            img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        images.append((os.path.relpath(file_path, image_dir), img, scale))
+    return images
+
+
+def benchmark_backend(name, images, labels, repeat):
+    """Đo độ trễ và độ phủ của một backend trên tập ảnh"""
+    start = time.perf_counter()
+    detector = create_face_detector(name)
+    load_time = time.perf_counter() - start
+
+    # Chạy thử một lần để loại bỏ chi phí khởi động
+    detector.detect(images[0][1])
+
+    latencies = []
+    faces_found = images_with_faces = matched = total_truth = 0
+    for rel_path, img, scale in images:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            boxes = detector.detect(img)
+            latencies.append((time.perf_counter() - start) * 1000)
+        boxes = [[v / scale for v in box] for box in boxes]
+        faces_found += len(boxes)
+        images_with_faces += bool(boxes)
+        if labels is not None and rel_path in labels:
+            truth = labels[rel_path]
+            total_truth += len(truth)
+            matched += count_matches(boxes, truth)
+
+    report = {
+        'backend': name,
+        'images': len(images),
+        'load_s': round(load_time, 3),
+        'latency_ms': {
+            'mean': round(float(np.mean(latencies)), 2),
+            'p50': round(float(np.percentile(latencies, 50)), 2),
+            'p95': round(float(np.percentile(latencies, 95)), 2)
+        },
+        'faces_found': faces_found,
+        'images_with_faces': images_with_faces
+    }
+    if labels is not None:
+        report['recall'] = round(matched / total_truth, 4) if total_truth else None
+    else:
+        report['hit_rate'] = round(images_with_faces / len(images), 4)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark face-detector backends")
+    parser.add_argument("image_dir", help="directory of test images")
+    parser.add_argument("--backends", default=",".join(sorted(FACE_DETECTORS)),
+                        help="comma separated backends to run")
+    parser.add_argument("--labels", help="JSON file with ground-truth boxes per image")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per image")
+    parser.add_argument("--short-side", type=int, default=INFERENCE_SHORT_SIDE,
+                        help="detection resolution (short side in px, 0 keeps the original size)")
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    images = load_images(args.image_dir, args.short_side)
+    if not images:
+        print(f"No images found in '{args.image_dir}'", file=sys.stderr)
+        return 2
+    labels = None
+    if args.labels:
+        with open(args.labels, encoding='utf-8') as f:
+            labels = json.load(f)
+
+    reports = []
+    for name in args.backends.split(","):
+        name = name.strip()
+        try:
+            report = benchmark_backend(name, images, labels, args.repeat)
+        except (ImportError, FileNotFoundError, ValueError) as e:
+            report = {'backend': name, 'error': str(e)}
+        reports.append(report)
+        print(json.dumps(report), file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
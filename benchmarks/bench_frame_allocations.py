@@ -0,0 +1,128 @@
+"""
+Per-frame allocation benchmark for the camera/video display path.
+
+Compares the previous display path (``resize_image`` into a new array,
+``cvtColor`` into another, ``Image.fromarray`` copying into PIL) with the
+buffer-reusing one (``resize_image`` into a ``FrameBufferRing`` slot,
+annotations drawn in place, ``cvtColor`` into a persistent RGBA buffer
+and ``Image.frombuffer`` sharing that memory). The Tk ``paste`` is left
+out because it needs a display; it is the same single copy in both paths.
+
+NumPy/OpenCV arrays are tracked with tracemalloc; PIL keeps its pixels
+outside the Python allocator, so its copy is reported separately.
+
+Usage:
+    python -m benchmarks.bench_frame_allocations [--frames 200] [--height 720]
+                                                 [--output report.json]
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+import cv2
+import numpy as np
+from PIL import Image
+
+from benchmarks.common import run_metadata
+from src.utils.image_utils import resize_image, resized_shape, draw_emotion_results, FrameBufferRing
+
+RESOLUTIONS = ((1280, 720), (1920, 1080))
+
+# Hai khuôn mặt cố định để bước vẽ kết quả giống với khi chạy thật
+FACES = [
+    {'box': [200, 150, 180, 180], 'emotions': {'happy': 0.9, 'neutral': 0.1}},
+    {'box': [700, 200, 160, 160], 'emotions': {'sad': 0.6, 'neutral': 0.4}}
+]
+
+
+def pil_copy_bytes(img):
+    """Số byte PIL tự cấp phát cho ảnh (0 nếu ảnh dùng chung bộ nhớ với mảng NumPy)"""
+    if getattr(img, 'readonly', 0):
+        return 0
+    # PIL lưu RGB/RGBA 4 byte mỗi điểm ảnh
+    return img.size[0] * img.size[1] * 4
+
+
+def legacy_frame(frame, display_height, state):
+    """Đường hiển thị cũ: mỗi bước tạo một mảng mới"""
+    scale = display_height / frame.shape[0]
+    resized = resize_image(frame, display_height)
+    resized = draw_emotion_results(resized, FACES, scale)
+    rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+    return Image.fromarray(rgb)
+
+
+def buffered_frame(frame, display_height, state):
+    """Đường hiển thị mới: resize vào buffer vòng, vẽ tại chỗ, đổi màu vào buffer RGBA cố định"""
+    scale = display_height / frame.shape[0]
+    ring = state.setdefault('ring', FrameBufferRing())
+    resized = resize_image(frame, display_height, dst=ring.get(resized_shape(frame, display_height)))
+    draw_emotion_results(resized, FACES, scale)
+    height, width = resized.shape[:2]
+    rgba = state.get('rgba')
+    if rgba is None or rgba.shape[:2] != (height, width):
+        rgba = state['rgba'] = np.empty((height, width, 4), dtype=np.uint8)
+    cv2.cvtColor(resized, cv2.COLOR_BGR2RGBA, dst=rgba)
+    return Image.frombuffer('RGBA', (width, height), rgba, 'raw', 'RGBA', 0, 1)
+
+
+def measure_path(step, frame, display_height, frames, warmup=5):
+    """Số byte cấp phát trung bình mỗi frame của một đường hiển thị"""
+    state = {}
+    for _ in range(warmup):
+        step(frame, display_height, state)
+    tracked = 0
+    untracked = 0
+    tracemalloc.start()
+    try:
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            img = step(frame, display_height, state)
+            _, peak = tracemalloc.get_traced_memory()
+            tracked += peak - before
+            untracked += pil_copy_bytes(img)
+            del img
+    finally:
+        tracemalloc.stop()
+    return {
+        'numpy_bytes_per_frame': tracked // frames,
+        'pil_bytes_per_frame': untracked // frames,
+        'total_kb_per_frame': round((tracked + untracked) / frames / 1024, 1)
+    }
+
+
+def run(frames=200, display_height=720):
+    """Chạy so sánh cho mọi độ phân giải, trả về báo cáo dạng dict"""
+    cases = []
+    rng = np.random.default_rng(0)
+    for width, height in RESOLUTIONS:
+        frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        target = min(display_height, height)
+        cases.append({
+            'resolution': f"{width}x{height}",
+            'display_height': target,
+            'before': measure_path(legacy_frame, frame, target, frames),
+            'after': measure_path(buffered_frame, frame, target, frames)
+        })
+    return {'meta': run_metadata(), 'frames': frames, 'cases': cases}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure bytes allocated per displayed frame")
+    parser.add_argument("--frames", type=int, default=200, help="frames measured per case")
+    parser.add_argument("--height", type=int, default=720, help="display height")
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run(args.frames, args.height)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Offline throughput benchmark for the detection pipeline and the image view.
+
+Sections (all run on the bundled images in ``src/assets/img`` or on
+synthetic frames, so no camera or dataset is needed):
+
+* ``detect``   - ``EmotionDetector.detect_emotions`` / ``find_faces`` latency
+  for several resolutions and face counts;
+* ``classify`` - ``classify_faces`` latency vs. face count with known boxes;
+* ``process``  - end-to-end ``process_frame`` fps, with and without tracking,
+  on a synthetic moving sequence or a video file;
+* ``image``    - ``ImageHandler`` conversion costs (``resize_image``, PIL
+  conversion, ``add_box_shadow``) and the background resize (LANCZOS and
+  the fast preview used while a window is being resized).
+
+Usage:
+    python -m benchmarks.bench_pipeline [--sections detect,classify,process,image]
+                                        [--detector haar] [--engine keras] [--repeat 10]
+                                        [--video clip.mp4] [--output report.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import cv2
+import numpy as np
+
+from benchmarks.common import latency_stats, max_rss_mb, measure_allocations, run_metadata, time_call
+from src.config import IMG_DIR, FACE_DETECTOR_BACKEND, EMOTION_ENGINE, IMAGE_PREVIEW_MAX_SIZE
+from src.features.batch_processor import read_image
+
+SECTIONS = ('detect', 'classify', 'process', 'image')
+RESOLUTIONS = ((640, 480), (1280, 720), (1920, 1080))
+FACE_COUNTS = (0, 1, 2, 4, 8)
+DISPLAY_HEIGHTS = (360, 720, 1080)
+
+# Ảnh có khuôn mặt đi kèm ứng dụng, dùng để ghép frame thử nghiệm
+BUNDLED_FACE_IMAGES = (
+    'download.jpg',
+    '1726240069882.jfif',
+    'In an AI Driven World, Humans Are Still Irreplaceable_ Aquent.jpg'
+)
+
+
+def synthetic_face_tile(size=200):
+    """Vẽ một khuôn mặt giả (dùng khi không cắt được khuôn mặt thật)"""
+    tile = np.full((size, size, 3), 90, dtype=np.uint8)
+    center = (size // 2, size // 2)
+    cv2.ellipse(tile, center, (size * 3 // 8, size // 2 - 4), 0, 0, 360, (170, 190, 220), -1)
+    for dx in (-size // 7, size // 7):
+        cv2.circle(tile, (center[0] + dx, center[1] - size // 10), size // 18, (40, 40, 40), -1)
+    cv2.ellipse(tile, (center[0], center[1] + size // 6), (size // 7, size // 16), 0, 0, 180, (60, 60, 120), 3)
+    return tile
+
+
+def load_face_tile(detector):
+    """Cắt khuôn mặt lớn nhất (kèm viền) từ ảnh đi kèm, trả về (ảnh, nguồn)"""
+    for file_name in BUNDLED_FACE_IMAGES:
+        img = read_image(os.path.join(IMG_DIR, file_name))
+        if img is None:
+            continue
+        boxes = detector.find_faces(img)
+        if not boxes:
+            continue
+        x, y, w, h = max(boxes, key=lambda box: box[2] * box[3])
+        margin = w // 2
+        return img[max(0, y - margin):y + h + margin, max(0, x - margin):x + w + margin].copy(), file_name
+    return synthetic_face_tile(), 'synthetic'
+
+
+def compose_frame(tile, faces, width, height, seed=0, shift=(0, 0)):
+    """Ghép `faces` bản sao khuôn mặt lên nền nhiễu, trả về (frame, box của từng khuôn mặt)"""
+    rng = np.random.default_rng(seed)
+    frame = cv2.GaussianBlur(rng.integers(0, 255, (height, width, 3), dtype=np.uint8), (0, 0), 5)
+    boxes = []
+    if faces == 0:
+        return frame, boxes
+
+    cols = math.ceil(math.sqrt(faces))
+    rows = math.ceil(faces / cols)
+    cell_w, cell_h = width // cols, height // rows
+    side = int(min(cell_w, cell_h) * 0.8)
+    face = cv2.resize(tile, (side, side), interpolation=cv2.INTER_AREA)
+    for idx in range(faces):
+        row, col = divmod(idx, cols)
+        x = col * cell_w + (cell_w - side) // 2 + shift[0]
+        y = row * cell_h + (cell_h - side) // 2 + shift[1]
+        x, y = min(max(x, 0), width - side), min(max(y, 0), height - side)
+        frame[y:y + side, x:x + side] = face
+        boxes.append([x, y, side, side])
+    return frame, boxes
+
+
+def bench_detect(detector, tile, repeat):
+    """Độ trễ nhận diện theo độ phân giải và số khuôn mặt"""
+    report = {}
+    for width, height in RESOLUTIONS:
+        for faces in FACE_COUNTS:
+            frame, _ = compose_frame(tile, faces, width, height)
+            detected, peak_kb = measure_allocations(lambda: detector.detect_emotions(frame))
+            report[f"{width}x{height}/faces={faces}"] = {
+                'detected': len(detected),
+                'find_faces_ms': time_call(lambda: detector.find_faces(frame), repeat),
+                'detect_emotions_ms': time_call(lambda: detector.detect_emotions(frame), repeat),
+                'peak_alloc_kb': peak_kb
+            }
+    return report
+
+
+def bench_classify(detector, tile, repeat, width=1280, height=720):
+    """Độ trễ phân loại cảm xúc theo số khuôn mặt (box cho trước, không phụ thuộc bộ tìm khuôn mặt)"""
+    report = {}
+    for faces in FACE_COUNTS[1:]:
+        frame, boxes = compose_frame(tile, faces, width, height)
+        stats = time_call(lambda: detector.classify_faces(frame, boxes), repeat)
+        stats['per_face'] = round(stats['p50'] / faces, 3)
+        report[f"faces={faces}"] = {'classify_faces_ms': stats}
+    return report
+
+
+def iter_sequence(tile, count, width=1280, height=720, faces=2, video_path=None):
+    """Chuỗi frame: đọc từ video nếu có, nếu không thì khuôn mặt dịch chuyển dần trên nền cố định"""
+    if video_path:
+        cap = cv2.VideoCapture(video_path)
+        try:
+            for _ in range(count):
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                yield frame
+        finally:
+            cap.release()
+        return
+    for idx in range(count):
+        step = int(20 * math.sin(idx / 10))
+        yield compose_frame(tile, faces, width, height, shift=(step, step // 2))[0]
+
+
+def bench_process(detector, tile, frames, video_path=None):
+    """FPS đầu-cuối của process_frame, và của FaceTracker + draw_results"""
+    from src.features.face_tracker import FaceTracker
+
+    sequence = list(iter_sequence(tile, frames, video_path=video_path))
+    if not sequence:
+        return {'error': "no frames"}
+
+    def run(step):
+        samples = []
+        for frame in sequence:
+            frame = frame.copy()
+            start = time.perf_counter()
+            step(frame)
+            samples.append((time.perf_counter() - start) * 1000)
+        stats = latency_stats(samples)
+        stats['fps'] = round(1000 * len(samples) / sum(samples), 2)
+        return stats
+
+    tracker = FaceTracker(detector)
+    detector.process_frame(sequence[0].copy())
+    return {
+        'source': video_path or 'synthetic',
+        'resolution': f"{sequence[0].shape[1]}x{sequence[0].shape[0]}",
+        'process_frame': run(detector.process_frame),
+        'tracked': run(lambda frame: detector.draw_results(frame, tracker.update(frame)))
+    }
+
+
+def bench_image(repeat):
+    """Chi phí hiển thị ảnh: resize_image, chuyển sang PIL, add_box_shadow (có cache và khi tạo mới) và LANCZOS cho nền"""
+    from PIL import Image
+    from src.utils.image_utils import resize_image
+    from src.utils.render_utils import fit_size
+    from src.utils.style_utils import add_box_shadow, _build_shadow
+
+    photo = read_image(os.path.join(IMG_DIR, BUNDLED_FACE_IMAGES[0]))
+    if photo is None:
+        photo = compose_frame(synthetic_face_tile(), 1, 1920, 1080)[0]
+    # Cùng ảnh nền mà MainWindow hiển thị qua ScaledImageRenderer
+    background = Image.open(os.path.join(IMG_DIR, 'bg3.png'))
+    background.load()
+    # Nguồn nhỏ mà ScaledImageRenderer dùng cho bản xem nhanh khi đang kéo cửa sổ
+    preview_source = background.copy()
+    preview_source.thumbnail((IMAGE_PREVIEW_MAX_SIZE, IMAGE_PREVIEW_MAX_SIZE), Image.Resampling.BILINEAR)
+
+    report = {}
+    for height in DISPLAY_HEIGHTS:
+        resized = resize_image(photo, height)
+        pil_img = Image.fromarray(cv2.cvtColor(resized, cv2.COLOR_BGR2RGB))
+        width = int(height * 16 / 9)
+        # Renderer giữ tỉ lệ ảnh nền trong khung width x height
+        bg_size = fit_size(background.size, width, height)
+        _, shadow_peak_kb = measure_allocations(
+            lambda: add_box_shadow(pil_img, offset=(2, 2), blur_radius=4, shadow_color=(0, 0, 0, 77))
+        )
+        report[f"height={height}"] = {
+            'resize_image_ms': time_call(lambda: resize_image(photo, height), repeat),
+            'to_pil_ms': time_call(lambda: Image.fromarray(cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)), repeat),
+            'add_box_shadow_ms': time_call(
+                lambda: add_box_shadow(pil_img, offset=(2, 2), blur_radius=4, shadow_color=(0, 0, 0, 77)), repeat
+            ),
+            'add_box_shadow_peak_kb': shadow_peak_kb,
+            # Tạo nền bóng đổ khi chưa có trong cache (kích thước mới)
+            'shadow_build_ms': time_call(
+                lambda: _build_shadow(pil_img.size, (2, 2), 4, (0, 0, 0, 77)), repeat
+            ),
+            'background_lanczos_ms': time_call(
+                lambda: background.resize(bg_size, Image.Resampling.LANCZOS), repeat
+            ),
+            'background_preview_ms': time_call(
+                lambda: preview_source.resize(bg_size, Image.Resampling.NEAREST), repeat
+            )
+        }
+    return report
+
+
+def run(sections=SECTIONS, backend=FACE_DETECTOR_BACKEND, engine=EMOTION_ENGINE, repeat=10,
+        frames=120, video_path=None):
+    """Chạy các phần benchmark đã chọn, trả về báo cáo dạng dict"""
+    report = {'meta': run_metadata(), 'config': {'detector': backend, 'engine': engine, 'repeat': repeat}}
+    detector = tile = None
+    if set(sections) & {'detect', 'classify', 'process'}:
+        from src.features.emotion_detector import EmotionDetector
+
+        detector = EmotionDetector(backend=backend, engine=engine)
+        start = time.perf_counter()
+        detector.detector
+        detector.classifier
+        report['model_load_s'] = round(time.perf_counter() - start, 3)
+        tile, report['config']['face_source'] = load_face_tile(detector)
+
+    if 'detect' in sections:
+        report['detect'] = bench_detect(detector, tile, repeat)
+    if 'classify' in sections:
+        report['classify'] = bench_classify(detector, tile, repeat)
+    if 'process' in sections:
+        report['process'] = bench_process(detector, tile, frames, video_path)
+    if 'image' in sections:
+        report['image'] = bench_image(repeat)
+    report['max_rss_mb'] = max_rss_mb()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark detection, classification and display costs")
+    parser.add_argument("--sections", default=",".join(SECTIONS), help="comma separated sections to run")
+    parser.add_argument("--detector", default=FACE_DETECTOR_BACKEND, help="face detector backend")
+    parser.add_argument("--engine", default=EMOTION_ENGINE, help="emotion classifier engine")
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per case")
+    parser.add_argument("--frames", type=int, default=120, help="frames for the end-to-end section")
+    parser.add_argument("--video", help="use this video instead of a synthetic sequence")
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    sections = [name.strip() for name in args.sections.split(",") if name.strip()]
+    unknown = sorted(set(sections) - set(SECTIONS))
+    if unknown:
+        parser.error(f"unknown sections {unknown}, choose from {list(SECTIONS)}")
+
+    report = run(sections, args.detector, args.engine, args.repeat, args.frames, args.video)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Load test for the local inference service (``python -m src.cli serve``).
+
+Sends the same image from several client threads and reports latency,
+throughput, the number of 503 (backpressure) answers and the server's
+own batching metrics. Only the standard library is needed on the client.
+
+Usage:
+    python -m benchmarks.bench_service [image.jpg] [--url http://127.0.0.1:8765]
+                                       [--clients 16] [--requests 200] [--output report.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import latency_stats, run_metadata
+from src.config import IMG_DIR, SERVICE_HOST, SERVICE_PORT
+
+DEFAULT_IMAGE = os.path.join(IMG_DIR, 'download.jpg')
+
+
+def get_json(url, timeout=5):
+    """GET và đọc JSON, trả về (mã trạng thái, nội dung)"""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b'null')
+
+
+def wait_ready(base_url, timeout):
+    """Chờ tới khi /ready trả về 200"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if get_json(f"{base_url}/ready")[0] == 200:
+                return True
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.5)
+    return False
+
+
+def post_image(url, data, content_type):
+    """Gửi một ảnh, trả về (mã trạng thái, độ trễ ms)"""
+    request = urllib.request.Request(url, data=data, headers={'Content-Type': content_type}, method='POST')
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return status, (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the local emotion recognition service")
+    parser.add_argument("image", nargs="?", default=DEFAULT_IMAGE, help="JPEG/PNG image to send")
+    parser.add_argument("--url", default=f"http://{SERVICE_HOST}:{SERVICE_PORT}", help="service base URL")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent client threads")
+    parser.add_argument("--requests", type=int, default=200, help="total requests to send")
+    parser.add_argument("--ready-timeout", type=float, default=120, help="seconds to wait for /ready")
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    if not wait_ready(args.url, args.ready_timeout):
+        print(f"Service at {args.url} is not ready", file=sys.stderr)
+        return 2
+    with open(args.image, 'rb') as f:
+        data = f.read()
+    content_type = 'image/png' if args.image.lower().endswith('.png') else 'image/jpeg'
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.clients) as pool:
+        results = list(pool.map(lambda _: post_image(f"{args.url}/detect", data, content_type), range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    statuses = {}
+    for status, _ in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    ok_latencies = [latency for status, latency in results if status == 200]
+    report = {
+        'meta': run_metadata(),
+        'clients': args.clients,
+        'requests': args.requests,
+        'throughput_rps': round(len(ok_latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        'statuses': statuses,
+        'latency_ms': latency_stats(ok_latencies),
+        'server': get_json(f"{args.url}/metrics")[1]
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Cold-start benchmark: import cost and time to first paint of the main menu.
+
+Runs fresh interpreters so nothing is cached in-process:
+
+* ``python -X importtime -c "import main"`` to measure the import graph
+  of the entry point and check that no heavy dependency is loaded;
+* ``MainWindow`` creation up to the first ``update()`` to measure
+  time to first paint (skipped when no display is available).
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--budget-ms 1500] [--output report.json]
+
+Exits with status 1 when the median first paint exceeds the budget or a
+heavy module shows up in the startup import graph.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Các thư viện nặng không được phép nạp trước khi menu chính hiển thị
+HEAVY_MODULES = ('tensorflow', 'keras', 'fer', 'torch', 'facenet_pytorch', 'cv2', 'onnxruntime', 'moviepy')
+
+FIRST_PAINT_SNIPPET = """
+import time
+start = time.perf_counter()
+from src.gui import MainWindow
+window = MainWindow()
+window.update()
+print(f"FIRST_PAINT_MS={(time.perf_counter() - start) * 1000:.1f}")
+window.destroy()
+"""
+
+
+def parse_importtime(stderr):
+    """Đọc kết quả -X importtime, trả về {module: (self_us, cumulative_us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return modules
+
+
+def measure_imports():
+    """Đo thời gian import của điểm khởi đầu ứng dụng"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    modules = parse_importtime(result.stderr)
+    heavy = sorted({name.split(".")[0] for name in modules if name.split(".")[0] in HEAVY_MODULES})
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:15]
+    errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+    return {
+        'ok': result.returncode == 0,
+        'error': errors[-1] if result.returncode != 0 and errors else None,
+        'total_ms': round(modules.get('main', (0, 0))[1] / 1000, 1),
+        'module_count': len(modules),
+        'heavy_modules': heavy,
+        'slowest_self_ms': {name: round(self_us / 1000, 1) for name, (self_us, _) in slowest}
+    }
+
+
+def measure_first_paint(runs):
+    """Đo thời gian từ lúc khởi động tiến trình tới lần vẽ đầu tiên của MainWindow"""
+    process_ms, paint_ms = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", FIRST_PAINT_SNIPPET],
+            cwd=REPO_ROOT, capture_output=True, text=True
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        marker = [line for line in result.stdout.splitlines() if line.startswith("FIRST_PAINT_MS=")]
+        if result.returncode != 0 or not marker:
+            # Không có màn hình (TclError) hoặc lỗi khởi động
+            return {'error': result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "no output"}
+        paint_ms.append(float(marker[0].split("=")[1]))
+        process_ms.append(elapsed)
+    return {
+        'runs': runs,
+        'in_process_ms': round(statistics.median(paint_ms), 1),
+        'process_start_to_paint_ms': round(statistics.median(process_ms), 1)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold start time of the GUI")
+    parser.add_argument("--runs", type=int, default=5, help="first-paint runs (median is reported)")
+    parser.add_argument("--budget-ms", type=float, default=1500.0,
+                        help="maximum median process start to first paint time")
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = {
+        'imports': measure_imports(),
+        'first_paint': measure_first_paint(args.runs),
+        'budget_ms': args.budget_ms
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    failed = False
+    if not report['imports']['ok']:
+        print(f"Importing the entry point failed: {report['imports']['error']}", file=sys.stderr)
+        failed = True
+    if report['imports']['heavy_modules']:
+        print(f"Heavy modules imported at startup: {report['imports']['heavy_modules']}", file=sys.stderr)
+        failed = True
+    paint = report['first_paint'].get('process_start_to_paint_ms')
+    if paint is not None and paint > args.budget_ms:
+        print(f"First paint {paint} ms exceeds budget {args.budget_ms} ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Shared helpers for the benchmark scripts: timing statistics, memory
+measurement and run metadata (commit, platform) for JSON reports.
+"""
+
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:
+    # Không có trên Windows
+    resource = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def latency_stats(samples_ms):
+    """Thống kê độ trễ (ms) từ danh sách mẫu"""
+    samples = sorted(samples_ms)
+    if not samples:
+        return {}
+
+    def percentile(q):
+        return samples[min(len(samples) - 1, int(round(q / 100 * (len(samples) - 1))))]
+
+    return {
+        'runs': len(samples),
+        'mean': round(sum(samples) / len(samples), 3),
+        'p50': round(percentile(50), 3),
+        'p95': round(percentile(95), 3),
+        'min': round(samples[0], 3)
+    }
+
+
+def time_call(fn, repeat=10, warmup=1):
+    """Đo độ trễ của fn() qua nhiều lần chạy, bỏ qua các lần chạy khởi động"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return latency_stats(samples)
+
+
+def measure_allocations(fn):
+    """Chạy fn() một lần dưới tracemalloc, trả về (kết quả, đỉnh bộ nhớ Python/NumPy tính bằng KB)"""
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, round(peak / 1024, 1)
+
+
+def max_rss_mb():
+    """Bộ nhớ thường trú cao nhất của tiến trình (MB), None nếu không hỗ trợ"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux trả về KB, macOS trả về byte
+    return round(rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def git_commit():
+    """Commit hiện tại của repo (kèm hậu tố -dirty nếu có thay đổi chưa commit)"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def run_metadata():
+    """Thông tin môi trường chạy benchmark để so sánh giữa các commit"""
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count()
+    }
@@ -0,0 +1,98 @@
+"""
+Compare two emotion classifier engines on the same face crops.
+
+Reports top-1 agreement, the largest per-score difference and per-face
+latency of each engine. Exits with status 1 when the engines disagree by
+more than ``--tolerance``, so it doubles as the ONNX/Keras parity check.
+
+Usage:
+    python -m benchmarks.compare_emotion_engines [--images DIR] [--reference keras]
+                                                 [--candidate onnx] [--tolerance 0.01]
+"""
+
+import argparse
+import json
+import sys
+import time
+import numpy as np
+
+from src.features.batch_processor import collect_face_crops
+from src.features.emotion_classifier import EMOTION_CLASSIFIERS, create_emotion_classifier
+
+
+def synthetic_crops(target_size, count, seed=0):
+    """Crop ngẫu nhiên trong khoảng [-1, 1] khi không có ảnh thật"""
+    rng = np.random.default_rng(seed)
+    width, height = target_size
+    return list(rng.uniform(-1.0, 1.0, size=(count, height, width)).astype(np.float32))
+
+
+def time_engine(classifier, batch, batch_size, repeat):
+    """Chạy engine trên toàn bộ batch, trả về (dự đoán, ms trên mỗi khuôn mặt)"""
+    classifier.predict(batch[:batch_size])  # Khởi động
+    start = time.perf_counter()
+    for _ in range(repeat):
+        scores = np.concatenate([
+            classifier.predict(batch[i:i + batch_size]) for i in range(0, len(batch), batch_size)
+        ])
+    elapsed = time.perf_counter() - start
+    return scores, elapsed * 1000 / (repeat * len(batch))
+
+
+def compare(reference, candidate, crops, batch_size=1, repeat=3):
+    """So sánh hai engine trên cùng tập crop"""
+    batch = np.stack(crops)[..., np.newaxis].astype(np.float32)
+    ref_scores, ref_ms = time_engine(reference, batch, batch_size, repeat)
+    cand_scores, cand_ms = time_engine(candidate, batch, batch_size, repeat)
+    agreement = float(np.mean(ref_scores.argmax(axis=1) == cand_scores.argmax(axis=1)))
+    return {
+        'reference': reference.name,
+        'candidate': candidate.name,
+        'faces': len(crops),
+        'batch_size': batch_size,
+        'top1_agreement': round(agreement, 4),
+        'max_abs_diff': round(float(np.abs(ref_scores - cand_scores).max()), 6),
+        'latency_ms_per_face': {
+            reference.name: round(ref_ms, 3),
+            candidate.name: round(cand_ms, 3)
+        }
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare emotion classifier engines")
+    parser.add_argument("--images", help="directory of images to take face crops from (default: synthetic crops)")
+    parser.add_argument("--reference", default="keras", choices=sorted(EMOTION_CLASSIFIERS))
+    parser.add_argument("--candidate", default="onnx", choices=sorted(EMOTION_CLASSIFIERS))
+    parser.add_argument("--limit", type=int, default=256, help="maximum number of face crops")
+    parser.add_argument("--batch-size", type=int, default=1, help="faces per predict call when timing")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes over the crops")
+    parser.add_argument("--tolerance", type=float, default=0.01,
+                        help="maximum allowed absolute score difference (negative disables the check)")
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    reference = create_emotion_classifier(args.reference)
+    candidate = create_emotion_classifier(args.candidate)
+    if args.images:
+        crops = collect_face_crops(args.images, reference.target_size, args.limit)
+    else:
+        crops = synthetic_crops(reference.target_size, args.limit)
+    if not crops:
+        print("No face crops to compare", file=sys.stderr)
+        return 2
+
+    report = compare(reference, candidate, crops, args.batch_size, args.repeat)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.tolerance >= 0 and report['max_abs_diff'] > args.tolerance:
+        print(f"Engines differ by {report['max_abs_diff']} (> {args.tolerance})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Accuracy/latency report for the INT8 quantized emotion model.
+
+Compares the ``onnx-int8`` engine against a float engine (``onnx`` by
+default) on face crops from a local image set and prints top-1
+agreement, the largest score difference and per-face latency at several
+batch sizes, so each site can decide whether the speedup is worth it.
+
+Usage:
+    python -m benchmarks.eval_quantized_model --images DIR [--float-engine onnx|keras]
+                                              [--batch-sizes 1,8,32] [--output report.json]
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.compare_emotion_engines import compare, synthetic_crops
+from src.features.batch_processor import collect_face_crops
+from src.features.emotion_classifier import create_emotion_classifier
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate the INT8 emotion model against the float model")
+    parser.add_argument("--images", help="directory of evaluation images (default: synthetic crops)")
+    parser.add_argument("--float-engine", default="onnx", choices=["onnx", "keras"])
+    parser.add_argument("--limit", type=int, default=500, help="maximum number of face crops")
+    parser.add_argument("--batch-sizes", default="1,8,32", help="comma separated batch sizes to time")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes over the crops")
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    reference = create_emotion_classifier(args.float_engine)
+    candidate = create_emotion_classifier('onnx-int8')
+    if args.images:
+        crops = collect_face_crops(args.images, reference.target_size, args.limit)
+    else:
+        print("No --images given, agreement is measured on synthetic crops", file=sys.stderr)
+        crops = synthetic_crops(reference.target_size, args.limit)
+    if not crops:
+        print("No face crops to evaluate", file=sys.stderr)
+        return 2
+
+    reports = []
+    for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+        report = compare(reference, candidate, crops, batch_size, args.repeat)
+        latency = report['latency_ms_per_face']
+        report['speedup'] = round(latency[reference.name] / latency[candidate.name], 2)
+        reports.append(report)
+        print(
+            f"batch {batch_size:>3}: top-1 agreement {report['top1_agreement'] * 100:.1f}%, "
+            f"max diff {report['max_abs_diff']:.4f}, "
+            f"{latency[reference.name]:.3f} ms -> {latency[candidate.name]:.3f} ms per face "
+            f"(x{report['speedup']})"
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Run the benchmark suite and store a JSON report per commit.
+
+Reports are written to ``benchmarks/results/<commit>.json``. Passing
+``--compare`` with an earlier report prints the change of every latency
+(p50) and throughput (fps) metric and exits with status 1 when one of
+them regressed by more than ``--tolerance``.
+
+Usage:
+    python -m benchmarks.run_benchmarks [--quick] [--compare benchmarks/results/<old>.json]
+                                        [--tolerance 0.15] [--skip-startup]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from benchmarks import bench_pipeline, bench_startup
+from benchmarks.common import run_metadata
+from src.config import FACE_DETECTOR_BACKEND, EMOTION_ENGINE
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def flatten_metrics(report, prefix=""):
+    """Trải phẳng báo cáo thành {đường dẫn: giá trị} cho các chỉ số p50 và fps"""
+    metrics = {}
+    for key, value in report.items():
+        path = f"{prefix}/{key}" if prefix else key
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, path))
+        elif key in ('p50', 'fps', 'process_start_to_paint_ms') and isinstance(value, (int, float)):
+            metrics[path] = value
+    return metrics
+
+
+def compare_reports(baseline, current, tolerance):
+    """So sánh hai báo cáo, trả về (các dòng mô tả, danh sách chỉ số bị chậm đi)"""
+    old, new = flatten_metrics(baseline), flatten_metrics(current)
+    lines, regressions = [], []
+    for path in sorted(old.keys() & new.keys()):
+        before, after = old[path], new[path]
+        if not before:
+            continue
+        change = (after - before) / before
+        # fps càng cao càng tốt, các chỉ số còn lại là độ trễ
+        worse = -change if path.endswith('/fps') else change
+        lines.append(f"{path}: {before} -> {after} ({change:+.1%})")
+        if worse > tolerance:
+            regressions.append(path)
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and compare against a baseline")
+    parser.add_argument("--detector", default=FACE_DETECTOR_BACKEND, help="face detector backend")
+    parser.add_argument("--engine", default=EMOTION_ENGINE, help="emotion classifier engine")
+    parser.add_argument("--quick", action="store_true", help="fewer repetitions, for a fast sanity check")
+    parser.add_argument("--skip-startup", action="store_true", help="do not run the cold start benchmark")
+    parser.add_argument("--video", help="video file for the end-to-end section")
+    parser.add_argument("--output", help="report path (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed relative slowdown before a metric counts as a regression")
+    args = parser.parse_args(argv)
+
+    repeat, frames, runs = (3, 30, 1) if args.quick else (10, 120, 5)
+    report = {'meta': run_metadata()}
+    report['pipeline'] = bench_pipeline.run(
+        bench_pipeline.SECTIONS, args.detector, args.engine, repeat, frames, args.video
+    )
+    report['pipeline'].pop('meta', None)
+    if not args.skip_startup:
+        report['startup'] = {
+            'imports': bench_startup.measure_imports(),
+            'first_paint': bench_startup.measure_first_paint(runs)
+        }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['meta']['commit'] or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        lines, regressions = compare_reports(baseline, report, args.tolerance)
+        print(f"Compared with {baseline.get('meta', {}).get('commit')}:")
+        print("\n".join(lines))
+        if regressions:
+            print(f"Regressions beyond {args.tolerance:.0%}: {regressions}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""
+Command line entry point for headless emotion recognition.
+
+Usage:
+    python -m src.cli images <dir> [--output results.jsonl] [--format jsonl|csv]
+                                   [--workers N] [--annotate-dir DIR] [--no-cache]
+    python -m src.cli video <file> [--output timeline.jsonl] [--every K] [--batch-size N]
+    python -m src.cli export <file> <output.mp4> [--analyze-every K] [--audio]
+    python -m src.cli convert-model [--output emotion_model.onnx]
+    python -m src.cli quantize-model [--calibration-dir DIR] [--output emotion_model.int8.onnx]
+    python -m src.cli serve [--host 127.0.0.1] [--port 8765] [--grpc-port 8766] [--max-batch N] [--max-wait-ms MS]
+
+Analysis commands accept --detector haar|mtcnn|dnn to pick the face detector
+and --engine keras|onnx|onnx-int8 to pick the emotion classifier engine.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from src.config import (
+    VIDEO_ANALYSIS_BATCH_SIZE,
+    FACE_DETECTOR_BACKEND,
+    EMOTION_ENGINE,
+    EMOTION_ONNX_MODEL_PATH,
+    EMOTION_INT8_MODEL_PATH,
+    SERVICE_HOST,
+    SERVICE_PORT,
+    SERVICE_GRPC_PORT,
+    SERVICE_MAX_BATCH_SIZE,
+    SERVICE_MAX_WAIT_MS,
+    SERVICE_MAX_QUEUE,
+    SERVICE_MAX_INFLIGHT
+)
+from src.features.emotion_classifier import EMOTION_LABELS, EMOTION_CLASSIFIERS
+from src.features.face_detectors import FACE_DETECTORS
+
+CSV_FIELDS = ['path', 'face', 'x', 'y', 'w', 'h', 'top_emotion'] + EMOTION_LABELS + ['error']
+
+
+class JsonlWriter:
+    """Ghi mỗi bản ghi thành một dòng JSON"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+class CsvImageWriter:
+    """Ghi kết quả ảnh thành CSV, mỗi khuôn mặt một dòng"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, record):
+        if not record['faces']:
+            self.writer.writerow({'path': record['path'], 'error': record['error'] or ''})
+        for idx, face in enumerate(record['faces']):
+            x, y, w, h = face['box']
+            row = {
+                'path': record['path'], 'face': idx, 'x': x, 'y': y, 'w': w, 'h': h,
+                'top_emotion': max(face['emotions'], key=face['emotions'].get),
+                'error': ''
+            }
+            row.update(face['emotions'])
+            self.writer.writerow(row)
+        self.stream.flush()
+
+
+def _open_output(path):
+    if path in (None, '-'):
+        return sys.stdout
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def _output_format(args):
+    if args.format:
+        return args.format
+    if args.output and args.output.lower().endswith('.csv'):
+        return 'csv'
+    return 'jsonl'
+
+
+def run_images(args):
+    """Phân tích toàn bộ ảnh trong thư mục"""
+    from src.features.batch_processor import analyze_images
+
+    if not os.path.isdir(args.directory):
+        print(f"Error: '{args.directory}' is not a directory", file=sys.stderr)
+        return 2
+
+    stream = _open_output(args.output)
+    writer = CsvImageWriter(stream) if _output_format(args) == 'csv' else JsonlWriter(stream)
+    count = errors = 0
+    start = time.perf_counter()
+    try:
+        for record in analyze_images(args.directory, args.workers, args.annotate_dir, args.detector, args.engine,
+                                     use_cache=not args.no_cache):
+            writer.write(record)
+            count += 1
+            errors += record['error'] is not None
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Processed {count} images ({errors} errors) in {elapsed:.1f}s", file=sys.stderr)
+    return 0
+
+
+def run_video(args):
+    """Phân tích video nhanh nhất có thể, xuất dòng thời gian cảm xúc"""
+    from src.features.emotion_detector import EmotionDetector
+    from src.features.video_analyzer import analyze_video
+
+    stream = _open_output(args.output)
+    writer = JsonlWriter(stream)
+    count = 0
+    start = time.perf_counter()
+    try:
+        detector = EmotionDetector(backend=args.detector, engine=args.engine)
+        for entry in analyze_video(args.file, args.every, args.batch_size, detector):
+            writer.write(entry)
+            count += 1
+    except IOError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    elapsed = time.perf_counter() - start
+    fps = count / elapsed if elapsed > 0 else 0.0
+    print(f"Analysed {count} frames in {elapsed:.1f}s ({fps:.1f} frames/s)", file=sys.stderr)
+    return 0
+
+
+def run_export(args):
+    """Xuất video đã vẽ kết quả nhận diện"""
+    from src.features.emotion_detector import EmotionDetector
+    from src.features.video_exporter import export_annotated_video
+
+    def report(done, total):
+        if total:
+            print(f"\rExported {done}/{total} frames ({done * 100 // total}%)", end="", file=sys.stderr)
+
+    start = time.perf_counter()
+    try:
+        stats = export_annotated_video(
+            args.file, args.output,
+            detector=EmotionDetector(backend=args.detector, engine=args.engine),
+            analyze_every=args.analyze_every,
+            batch_size=args.batch_size,
+            keep_audio=args.audio,
+            progress_callback=report
+        )
+    except IOError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    elapsed = time.perf_counter() - start
+    print(f"\nWrote {stats['frames']} frames to {args.output} in {elapsed:.1f}s", file=sys.stderr)
+    return 0
+
+
+def run_convert_model(args):
+    """Chuyển model cảm xúc Keras sang ONNX"""
+    from src.features.emotion_classifier import export_onnx
+
+    output_path = export_onnx(args.output)
+    print(f"Wrote ONNX emotion model to {output_path}", file=sys.stderr)
+    return 0
+
+
+def run_quantize_model(args):
+    """Lượng tử hóa model ONNX sang INT8"""
+    from src.features.batch_processor import collect_face_crops
+    from src.features.emotion_classifier import create_emotion_classifier, quantize_onnx
+
+    crops = None
+    if args.calibration_dir:
+        target_size = create_emotion_classifier('onnx').target_size
+        crops = collect_face_crops(args.calibration_dir, target_size, args.calibration_size)
+        if not crops:
+            print(f"Error: no faces found in '{args.calibration_dir}'", file=sys.stderr)
+            return 2
+
+    output_path = quantize_onnx(args.input, args.output, crops)
+    mode = f"static, {len(crops)} calibration faces" if crops else "dynamic"
+    print(f"Wrote INT8 emotion model ({mode}) to {output_path}", file=sys.stderr)
+    return 0
+
+
+def run_serve(args):
+    """Chạy dịch vụ suy luận HTTP cục bộ"""
+    from src.server import serve
+
+    return serve(
+        args.host, args.port,
+        grpc_port=args.grpc_port,
+        backend=args.detector,
+        engine=args.engine,
+        max_batch_size=args.max_batch,
+        max_wait_ms=args.max_wait_ms,
+        max_queue=args.max_queue,
+        max_inflight=args.max_inflight
+    )
+
+
+def build_parser():
+    """Tạo parser cho các lệnh con"""
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Headless emotion recognition")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Tùy chọn dùng chung cho mọi lệnh con
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--detector", choices=sorted(FACE_DETECTORS), default=FACE_DETECTOR_BACKEND,
+                        help=f"face detector backend (default: {FACE_DETECTOR_BACKEND})")
+    common.add_argument("--engine", choices=sorted(EMOTION_CLASSIFIERS), default=EMOTION_ENGINE,
+                        help=f"emotion classifier engine (default: {EMOTION_ENGINE})")
+
+    images = subparsers.add_parser("images", parents=[common], help="analyse every image in a directory")
+    images.add_argument("directory", help="directory to scan recursively")
+    images.add_argument("-o", "--output", help="output file (default: stdout)")
+    images.add_argument("-f", "--format", choices=["jsonl", "csv"], help="output format (default: from extension, else jsonl)")
+    images.add_argument("-w", "--workers", type=int, help="number of worker processes (default: CPU count)")
+    images.add_argument("--annotate-dir", help="write annotated copies of the images here")
+    images.add_argument("--no-cache", action="store_true",
+                        help="ignore the on-disk result cache and re-analyse every image")
+    images.set_defaults(func=run_images)
+
+    video = subparsers.add_parser("video", parents=[common], help="analyse a video file as fast as possible")
+    video.add_argument("file", help="video file to analyse")
+    video.add_argument("-o", "--output", help="JSONL timeline output (default: stdout)")
+    video.add_argument("-k", "--every", type=int, default=1, help="analyse every k-th frame (default: 1)")
+    video.add_argument("-b", "--batch-size", type=int, default=VIDEO_ANALYSIS_BATCH_SIZE,
+                       help=f"frames per inference batch (default: {VIDEO_ANALYSIS_BATCH_SIZE})")
+    video.set_defaults(func=run_video)
+
+    export = subparsers.add_parser("export", parents=[common], help="write an annotated copy of a video")
+    export.add_argument("file", help="source video file")
+    export.add_argument("output", help="annotated MP4 to write")
+    export.add_argument("-k", "--analyze-every", type=int, default=1,
+                        help="run inference every k-th frame and reuse results in between (default: 1)")
+    export.add_argument("-b", "--batch-size", type=int, default=VIDEO_ANALYSIS_BATCH_SIZE,
+                        help=f"frames per inference batch (default: {VIDEO_ANALYSIS_BATCH_SIZE})")
+    export.add_argument("--audio", action="store_true", help="mux the source audio track back in (needs moviepy)")
+    export.set_defaults(func=run_export)
+
+    convert = subparsers.add_parser("convert-model", help="export the Keras emotion model to ONNX")
+    convert.add_argument("-o", "--output", default=EMOTION_ONNX_MODEL_PATH,
+                         help="ONNX file to write (default: the path used by the onnx engine)")
+    convert.set_defaults(func=run_convert_model)
+
+    quantize = subparsers.add_parser("quantize-model", help="quantize the ONNX emotion model to INT8")
+    quantize.add_argument("--input", default=EMOTION_ONNX_MODEL_PATH, help="float ONNX model")
+    quantize.add_argument("-o", "--output", default=EMOTION_INT8_MODEL_PATH,
+                          help="INT8 model to write (default: the path used by the onnx-int8 engine)")
+    quantize.add_argument("--calibration-dir",
+                          help="images to calibrate static quantization on (default: dynamic quantization)")
+    quantize.add_argument("--calibration-size", type=int, default=200, help="maximum calibration faces")
+    quantize.set_defaults(func=run_quantize_model)
+
+    serve = subparsers.add_parser("serve", parents=[common], help="run the local HTTP inference service")
+    serve.add_argument("--host", default=SERVICE_HOST, help=f"address to listen on (default: {SERVICE_HOST})")
+    serve.add_argument("--port", type=int, default=SERVICE_PORT, help=f"port to listen on (default: {SERVICE_PORT})")
+    serve.add_argument("--grpc-port", type=int, default=SERVICE_GRPC_PORT,
+                       help="also serve emotion.EmotionRecognition/Detect over gRPC on this port")
+    serve.add_argument("--max-batch", type=int, default=SERVICE_MAX_BATCH_SIZE,
+                       help=f"images per inference batch (default: {SERVICE_MAX_BATCH_SIZE})")
+    serve.add_argument("--max-wait-ms", type=float, default=SERVICE_MAX_WAIT_MS,
+                       help=f"how long to wait for a batch to fill (default: {SERVICE_MAX_WAIT_MS})")
+    serve.add_argument("--max-queue", type=int, default=SERVICE_MAX_QUEUE,
+                       help=f"queued requests before answering 503 (default: {SERVICE_MAX_QUEUE})")
+    serve.add_argument("--max-inflight", type=int, default=SERVICE_MAX_INFLIGHT,
+                       help=f"concurrent /detect requests before answering 503 (default: {SERVICE_MAX_INFLIGHT})")
+    serve.set_defaults(func=run_serve)
+
+    return parser
+
+
+def main(argv=None):
+    """Run the command line interface."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
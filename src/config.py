@@ -8,6 +8,7 @@ import os
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSETS_DIR = os.path.join(BASE_DIR, 'src', 'assets')
 IMG_DIR = os.path.join(ASSETS_DIR, 'img')
+MODELS_DIR = os.path.join(ASSETS_DIR, 'models')
 
 # Window settings
 WINDOW_TITLE = "Emotion Recognition"
@@ -40,4 +41,90 @@ FONTS = {
 
 # Allowed file extensions
 ALLOWED_IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
-ALLOWED_VIDEO_EXTENSIONS = ['.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv'] 
\ No newline at end of file
+ALLOWED_VIDEO_EXTENSIONS = ['.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv'] 
+
+# Camera pipeline settings
+CAMERA_DISPLAY_INTERVAL_MS = 15  # Chu kỳ giao diện lấy frame mới để hiển thị
+CAMERA_OVERLAY_MODE = True  # Hiển thị frame gốc và vẽ chồng kết quả nhận diện gần nhất
+OVERLAY_RESULT_MAX_AGE = 0.5  # Thời gian (giây) trước khi kết quả nhận diện hết hạn
+
+# Face tracking settings
+TRACKING_ENABLED = True  # Nhận diện mỗi N frame, theo dấu khuôn mặt ở các frame giữa
+TRACKING_DETECT_INTERVAL = 5  # Số frame giữa hai lần nhận diện đầy đủ
+TRACKING_CLASSIFY_INTERVAL = 3  # Số frame giữa hai lần phân loại cảm xúc của một track
+TRACKER_TYPE = 'kcf'  # kcf, csrt hoặc mosse (opencv-contrib)
+
+# Emotion classifier settings
+EMOTION_BATCH_SIZE = 32  # Số khuôn mặt tối đa trong một lần gọi model phân loại
+EMOTION_ENGINE = 'keras'  # keras (TensorFlow), onnx (onnxruntime / cv2.dnn) hoặc onnx-int8 (lượng tử hóa)
+EMOTION_ONNX_MODEL_PATH = os.path.join(MODELS_DIR, 'emotion_model.onnx')
+EMOTION_INT8_MODEL_PATH = os.path.join(MODELS_DIR, 'emotion_model.int8.onnx')
+
+# Offline video analysis settings
+VIDEO_ANALYSIS_BATCH_SIZE = 8  # Số frame được gom lại trước khi phân loại cảm xúc
+VIDEO_DECODE_QUEUE_SIZE = 32  # Số frame tối đa chờ trong hàng đợi giải mã
+VIDEO_EXPORT_CODEC = 'mp4v'  # FourCC dùng cho cv2.VideoWriter khi xuất video
+
+# Video playback settings
+PLAYBACK_DEFAULT_FPS = 30  # Dùng khi video không có thông tin CAP_PROP_FPS
+PLAYBACK_DROP_THRESHOLD_FRAMES = 2  # Trễ từ số frame này trở lên thì bỏ frame để bắt kịp
+PLAYBACK_INFERENCE_MAX_LAG = 0.05  # Trễ quá ngưỡng (giây) thì dùng lại kết quả nhận diện trước
+
+# Inference resolution
+INFERENCE_SHORT_SIDE = 320  # Cạnh ngắn (px) của frame camera/video dùng để tìm khuôn mặt, None để giữ nguyên; ảnh tĩnh luôn giữ độ phân giải gốc
+
+# Face detector settings
+FACE_DETECTOR_BACKEND = 'haar'  # haar, mtcnn (facenet-pytorch) hoặc dnn (OpenCV SSD)
+DNN_FACE_PROTOTXT = os.path.join(MODELS_DIR, 'deploy.prototxt')
+DNN_FACE_MODEL = os.path.join(MODELS_DIR, 'res10_300x300_ssd_iter_140000.caffemodel')
+DNN_MIN_CONFIDENCE = 0.5  # Ngưỡng tin cậy của bộ tìm khuôn mặt DNN
+MTCNN_MIN_CONFIDENCE = 0.9  # Ngưỡng tin cậy của bộ tìm khuôn mặt MTCNN
+
+# Profiling settings
+PROFILING_ENABLED = False  # Đo thời gian từng công đoạn (hoặc đặt biến môi trường EMOTION_PROFILE=1)
+PROFILING_WINDOW = 300  # Số mẫu gần nhất dùng để tính p50/p95/p99
+PROFILING_DUMP_PATH = os.path.join(BASE_DIR, 'profile_stats.json')  # Ghi thống kê khi thoát, None để tắt
+PROFILING_OVERLAY = True  # Hiển thị fps/độ trễ trên cửa sổ camera và video khi đang profiling
+PROFILING_OVERLAY_INTERVAL_MS = 500  # Chu kỳ cập nhật dòng thống kê
+
+# Result cache settings
+RESULT_CACHE_ENABLED = True  # Lưu kết quả nhận diện ảnh theo mã băm nội dung để không phân tích lại
+RESULT_CACHE_PATH = os.path.join(BASE_DIR, '.cache', 'results.sqlite3')
+RESULT_CACHE_MAX_ENTRIES = 50000  # Số ảnh tối đa trong cache, ảnh dùng lâu nhất bị xóa trước
+
+# Face crop memoization (camera/video)
+FACE_CROP_CACHE_ENABLED = True  # Dùng lại điểm cảm xúc khi crop khuôn mặt gần như không đổi
+FACE_CROP_CACHE_CAPACITY = 32  # Số crop tối đa được nhớ
+FACE_CROP_CACHE_TTL = 1.0  # Thời gian (giây) trước khi một khuôn mặt đứng yên được phân loại lại
+FACE_CROP_CACHE_MAX_DISTANCE = 2  # Khoảng cách Hamming tối đa (trên 64 bit dHash) để coi là cùng crop
+FACE_CROP_CACHE_MIN_IOU = 0.5  # Chỉ dùng lại điểm của crop có hộp chồng lên hộp hiện tại ít nhất chừng này (IoU)
+
+# Motion gate (camera)
+MOTION_GATE_ENABLED = True  # Bỏ qua nhận diện khi khung hình gần như không thay đổi
+MOTION_GATE_METHOD = 'absdiff'  # absdiff (so với frame nhận diện gần nhất) hoặc mog2 (trừ nền)
+MOTION_GATE_WIDTH = 160  # Chiều rộng ảnh thu nhỏ dùng để phát hiện chuyển động
+MOTION_PIXEL_THRESHOLD = 25  # Mức chênh lệch độ sáng để coi một điểm ảnh là thay đổi
+MOTION_MIN_CHANGED_RATIO = 0.005  # Tỉ lệ điểm ảnh thay đổi tối thiểu để chạy lại nhận diện
+MOTION_REFRESH_INTERVAL = 2.0  # Dù không có chuyển động, vẫn nhận diện lại sau số giây này
+
+# Multi-camera settings
+MULTI_CAMERA_SOURCES = "0, 1"  # Nguồn mặc định: chỉ số camera, đường dẫn file hoặc URL RTSP/HTTP, cách nhau bởi dấu phẩy
+MULTI_CAMERA_WORKERS = None  # Số worker suy luận dùng chung (None: tối đa số nguồn và số CPU)
+MULTI_CAMERA_TILE_COLUMNS = 2  # Số cột của lưới hiển thị nhiều camera
+
+# Local inference service settings
+SERVICE_HOST = '127.0.0.1'  # Chỉ lắng nghe trên máy cục bộ
+SERVICE_PORT = 8765
+SERVICE_GRPC_PORT = None  # Cổng gRPC (None: chỉ chạy HTTP)
+SERVICE_MAX_BATCH_SIZE = 8  # Số ảnh tối đa được gộp vào một lần suy luận
+SERVICE_MAX_WAIT_MS = 10  # Thời gian tối đa chờ gom thêm yêu cầu sau yêu cầu đầu tiên của batch
+SERVICE_MAX_QUEUE = 64  # Số yêu cầu chờ tối đa, vượt quá thì trả về 503
+SERVICE_MAX_INFLIGHT = 128  # Số yêu cầu /detect được xử lý đồng thời, vượt quá thì trả về 503 (lớn hơn hàng đợi + một batch để giới hạn hàng đợi có tác dụng)
+SERVICE_MAX_IMAGE_BYTES = 20 * 1024 * 1024  # Kích thước tối đa của nội dung ảnh gửi lên
+SERVICE_REQUEST_TIMEOUT = 30  # Thời gian (giây) chờ kết quả suy luận của một yêu cầu
+
+# Image view settings
+SHADOW_CACHE_SIZE = 16  # Số nền bóng đổ (theo kích thước, độ lệch, bán kính, màu) được giữ lại
+IMAGE_RESIZE_CACHE_SIZE = 8  # Số kích thước ảnh đã resize được giữ lại cho mỗi khung hiển thị
+IMAGE_RESIZE_DEBOUNCE_MS = 120  # Chỉ resize LANCZOS sau khi cửa sổ ngừng thay đổi kích thước chừng này ms
+IMAGE_PREVIEW_MAX_SIZE = 1024  # Cạnh dài tối đa của ảnh nguồn dùng cho bản xem nhanh khi đang kéo cửa sổ
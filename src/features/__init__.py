@@ -1,15 +1,28 @@
 """
 Features module for the Emotion Recognition application.
+
+Submodules pull in OpenCV, NumPy and (through the emotion engines)
+TensorFlow or onnxruntime, so they are imported lazily on first
+attribute access instead of when the package is imported.
 """
 
-from .emotion_detector import EmotionDetector
-from .camera_handler import CameraHandler
-from .video_handler import VideoHandler
-from .image_handler import ImageHandler
-
-__all__ = [
-    'EmotionDetector',
-    'CameraHandler',
-    'VideoHandler',
-    'ImageHandler'
-] 
\ No newline at end of file
+from ..lazy_loader import make_lazy_getattr
+
+_LAZY_ATTRS = {
+    'EmotionDetector': '.emotion_detector',
+    'preload_models': '.emotion_detector',
+    'create_face_detector': '.face_detectors',
+    'FaceTracker': '.face_tracker',
+    'CameraHandler': '.camera_handler',
+    'MultiCameraManager': '.multi_camera',
+    'MultiCameraHandler': '.multi_camera_handler',
+    'VideoHandler': '.video_handler',
+    'ImageHandler': '.image_handler',
+    'analyze_video': '.video_analyzer',
+    'export_annotated_video': '.video_exporter'
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+__getattr__, __dir__ = make_lazy_getattr(__name__, _LAZY_ATTRS)
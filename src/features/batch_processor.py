@@ -0,0 +1,148 @@
+"""
+Headless batch image analysis with a multiprocessing worker pool.
+
+Each worker process loads the emotion model once in its initializer and
+then scores image files independently; results are yielded as soon as a
+worker finishes so they can be streamed to disk. Results are looked up in
+the shared on-disk result cache first, so re-analysing a known dataset
+only costs hashing the files.
+"""
+
+import os
+import multiprocessing
+import cv2
+import numpy as np
+from src.config import ALLOWED_IMAGE_EXTENSIONS, FACE_DETECTOR_BACKEND, EMOTION_ENGINE, RESULT_CACHE_ENABLED
+
+# Trạng thái riêng của từng tiến trình worker
+_worker_detector = None
+_worker_annotate_dir = None
+_worker_root = None
+_worker_cache = None
+
+
+def iter_image_files(root, extensions=ALLOWED_IMAGE_EXTENSIONS):
+    """Duyệt đệ quy thư mục và trả về các file ảnh hợp lệ theo thứ tự ổn định"""
+    extensions = {ext.lower() for ext in extensions}
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            if os.path.splitext(file_name)[1].lower() in extensions:
+                yield os.path.join(dir_path, file_name)
+
+
+def decode_image(data):
+    """Giải mã ảnh từ nội dung file (mảng uint8), None nếu không hợp lệ"""
+    if data is None or data.size == 0:
+        return None
+    return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+
+def read_image(file_path):
+    """Đọc ảnh bằng imdecode để hỗ trợ cả đường dẫn có ký tự Unicode"""
+    return decode_image(np.fromfile(file_path, dtype=np.uint8))
+
+
+def write_image(file_path, image):
+    """Ghi ảnh, tự tạo thư mục cha nếu cần"""
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    ok, encoded = cv2.imencode(os.path.splitext(file_path)[1] or '.png', image)
+    if not ok:
+        raise ValueError(f"Cannot encode image '{file_path}'")
+    encoded.tofile(file_path)
+
+
+def collect_face_crops(image_dir, target_size, limit, detector=None):
+    """Cắt các khuôn mặt từ thư mục ảnh (dùng để hiệu chuẩn và so sánh model)"""
+    from src.features.emotion_classifier import extract_face_crop
+    from src.features.emotion_detector import EmotionDetector
+
+    detector = detector or EmotionDetector()
+    crops = []
+    for file_path in iter_image_files(image_dir):
+        img = read_image(file_path)
+        if img is None:
+            continue
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        for box in detector.find_faces(img):
+            crop = extract_face_crop(gray, box, target_size)
+            if crop is not None:
+                crops.append(crop)
+        if len(crops) >= limit:
+            break
+    return crops[:limit]
+
+
+def _init_worker(root, annotate_dir, backend, engine, use_cache):
+    global _worker_detector, _worker_annotate_dir, _worker_root, _worker_cache
+    from src.features.emotion_detector import EmotionDetector
+    from src.features.result_cache import get_result_cache
+
+    # Mỗi worker đã là một tiến trình riêng, tránh tranh chấp luồng bên trong OpenCV
+    cv2.setNumThreads(1)
+    _worker_detector = EmotionDetector(backend=backend, engine=engine)
+    _worker_annotate_dir = annotate_dir
+    _worker_root = root
+    _worker_cache = get_result_cache() if use_cache else None
+    # Tải model ngay khi khởi tạo worker, mỗi tiến trình chỉ tải một lần
+    _worker_detector.detector
+    _worker_detector.classifier
+
+
+def analyze_image_file(file_path, detector=None, root=None, annotate_dir=None, cache=None):
+    """Phân tích một file ảnh và trả về bản ghi kết quả"""
+    from src.features.result_cache import content_hash
+
+    root = root or os.path.dirname(file_path)
+    record = {
+        'path': os.path.relpath(file_path, root),
+        'faces': [],
+        'error': None
+    }
+    try:
+        data = np.fromfile(file_path, dtype=np.uint8)
+        digest = content_hash(data) if cache is not None else None
+        faces = cache.get(digest, detector.model_id) if cache is not None else None
+        if faces is not None and not annotate_dir:
+            # Ảnh đã phân tích trước đó: không cần giải mã
+            record['faces'] = faces
+            return record
+
+        img = decode_image(data)
+        if img is None:
+            record['error'] = "cannot decode image"
+            return record
+        if faces is None:
+            faces = detector.detect_emotions(img)
+            if cache is not None:
+                cache.put(digest, detector.model_id, faces)
+        record['faces'] = faces
+        if annotate_dir:
+            annotated = detector.draw_results(img, record['faces'])
+            write_image(os.path.join(annotate_dir, record['path']), annotated)
+    except Exception as e:
+        record['error'] = str(e)
+    return record
+
+
+def _analyze_in_worker(file_path):
+    return analyze_image_file(file_path, _worker_detector, _worker_root, _worker_annotate_dir, _worker_cache)
+
+
+def analyze_images(root, workers=None, annotate_dir=None, backend=FACE_DETECTOR_BACKEND,
+                   engine=EMOTION_ENGINE, chunksize=8, use_cache=RESULT_CACHE_ENABLED):
+    """Phân tích toàn bộ ảnh trong thư mục bằng pool tiến trình, trả về kết quả dạng stream"""
+    file_paths = iter_image_files(root)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _init_worker(root, annotate_dir, backend, engine, use_cache)
+        for file_path in file_paths:
+            yield _analyze_in_worker(file_path)
+        return
+
+    # spawn: không kế thừa trạng thái TensorFlow/OpenCV của tiến trình cha
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(workers, initializer=_init_worker, initargs=(root, annotate_dir, backend, engine, use_cache)) as pool:
+        for record in pool.imap_unordered(_analyze_in_worker, file_paths, chunksize):
+            yield record
@@ -1,18 +1,81 @@
 import cv2
 import time
 from tkinter import messagebox
+from src.config import CAMERA_DISPLAY_INTERVAL_MS, CAMERA_OVERLAY_MODE, OVERLAY_RESULT_MAX_AGE, INFERENCE_SHORT_SIDE
 from src.features.emotion_detector import EmotionDetector
-from src.utils.image_utils import resize_image, convert_cv2_to_tk
+from src.features.face_crop_cache import create_face_crop_cache
+from src.features.face_tracker import FaceTracker
+from src.features.frame_pipeline import FramePipeline, InferenceResult
+from src.features.motion_gate import create_motion_gate
+from src.features.profiler import PROFILER
+from src.utils.image_utils import resize_image, resized_shape, FrameBufferRing
 
 class CameraHandler:
-    def __init__(self):
+    def __init__(self, overlay_mode=CAMERA_OVERLAY_MODE, result_max_age=OVERLAY_RESULT_MAX_AGE):
         self.cap = None
-        self.detector = EmotionDetector()
+        self.detector = EmotionDetector(inference_short_side=INFERENCE_SHORT_SIDE, crop_cache=create_face_crop_cache())
+        self.face_tracker = FaceTracker(self.detector)
+        self.motion_gate = create_motion_gate()
+        self.last_faces = None
+        self.pipeline = None
+        self.display_height = None
+        # Buffer hiển thị dùng lại giữa các frame (resize ghi thẳng vào, kết quả được vẽ tại chỗ)
+        self.display_buffers = FrameBufferRing()
+        self.overlay_mode = overlay_mode
+        self.result_max_age = result_max_age
+        self.last_result = None
         self.update_task = None
         self.detect_closed = False
 
-    def start_camera(self, frm_mid, update_callback):
-        """Khởi động camera"""
+    def _detect_faces(self, frame):
+        """Nhận diện trên frame gốc, dùng lại kết quả trước nếu cảnh không thay đổi"""
+        if self.motion_gate is not None:
+            with PROFILER.stage('motion_gate'):
+                changed = self.motion_gate.update(frame)
+            if not changed and self.last_faces is not None:
+                PROFILER.tick('motion_skip')
+                return self.last_faces
+        self.last_faces = self.face_tracker.update(frame)
+        return self.last_faces
+
+    def _process_frame(self, frame):
+        """Xử lý frame trên luồng suy luận"""
+        # Suy luận trên frame gốc, sau đó vẽ box đã quy đổi lên frame hiển thị
+        results = self._detect_faces(frame)
+        scale = 1.0
+        if self.display_height:
+            scale = self.display_height / frame.shape[0]
+            with PROFILER.stage('resize'):
+                buffer = self.display_buffers.get(resized_shape(frame, self.display_height))
+                frame = resize_image(frame, self.display_height, dst=buffer)
+        with PROFILER.stage('draw'):
+            return self.detector.draw_results(frame, results, scale)
+
+    def _infer_frame(self, frame):
+        """Chỉ nhận diện trên luồng suy luận, việc vẽ để giao diện đảm nhiệm"""
+        timestamp = time.monotonic()
+        faces = self._detect_faces(frame)
+        return InferenceResult(faces, frame.shape[:2], timestamp)
+
+    def _overlay_frame(self, frame):
+        """Vẽ kết quả suy luận gần nhất (nếu chưa hết hạn) lên frame gốc"""
+        raw_height = frame.shape[0]
+        # Frame gốc vẫn có thể đang được luồng suy luận đọc, không vẽ trực tiếp lên nó
+        with PROFILER.stage('resize'):
+            if self.display_height:
+                buffer = self.display_buffers.get(resized_shape(frame, self.display_height))
+                frame = resize_image(frame, self.display_height, dst=buffer)
+            else:
+                frame = self.display_buffers.copy(frame)
+        result = self.last_result
+        if result is not None and not result.is_expired(self.result_max_age):
+            scale = frame.shape[0] / raw_height
+            with PROFILER.stage('draw'):
+                frame = self.detector.draw_results(frame, result.faces, scale)
+        return frame
+
+    def start_camera(self, frm_mid, update_callback, error_callback=None):
+        """Khởi động camera, error_callback được gọi khi luồng suy luận gặp lỗi và camera bị dừng"""
         if self.cap is not None:
             self.stop_camera()
 
@@ -23,39 +86,72 @@ class CameraHandler:
             messagebox.showerror("Lỗi mở camera", error_msg)
             return False
 
+        # Đọc frame và suy luận ở luồng nền, giao diện chỉ lấy kết quả để hiển thị
+        self.display_height = frm_mid.winfo_height()
+        self.last_result = None
+        self.last_faces = None
+        self.face_tracker.reset()
+        if self.motion_gate is not None:
+            self.motion_gate.reset()
+        if self.overlay_mode:
+            # Hiển thị mọi frame gốc, kết quả nhận diện được vẽ chồng bất đồng bộ
+            self.pipeline = FramePipeline(self.cap, self._infer_frame, publish_raw=True)
+        else:
+            self.pipeline = FramePipeline(self.cap, self._process_frame)
+        self.pipeline.start()
+
         def update_frame():
             if self.detect_closed:
                 self.detect_closed = False
                 return
 
-            ret, frame = self.cap.read()
-            if not ret:
+            # Luồng suy luận lỗi (tải model, detector): báo lỗi thay vì chỉ hiện frame gốc hoặc dừng im lặng
+            error = self.pipeline.error
+            if error is not None:
+                self.stop_camera()
+                error_msg = f"Lỗi: Không thể nhận diện cảm xúc\n\nChi tiết lỗi:\n{str(error)}\n\nVui lòng kiểm tra lại model hoặc camera."
+                messagebox.showerror("Lỗi nhận diện", error_msg)
+                if error_callback is not None:
+                    error_callback()
+                return
+
+            # Tk chỉ được truy cập từ luồng giao diện
+            self.display_height = frm_mid.winfo_height()
+
+            if self.overlay_mode:
+                result = self.pipeline.poll()
+                if result is not None:
+                    self.last_result = result
+                frame = self.pipeline.poll_raw()
+                if frame is not None:
+                    frame = self._overlay_frame(frame)
+            else:
+                frame = self.pipeline.poll()
+
+            if frame is not None:
+                # Update display (giao diện tự chép frame vào ảnh Tk có sẵn)
+                with PROFILER.stage('display'):
+                    update_callback(frame)
+                PROFILER.tick('display')
+            elif self.pipeline.finished:
                 self.stop_camera()
                 return
 
-            # Resize frame
-            frame = resize_image(frame, frm_mid.winfo_height())
-            
-            # Process frame
-            frame = self.detector.process_frame(frame)
-            
-            # Convert to Tkinter format
-            img_tk = convert_cv2_to_tk(frame)
-            
-            # Update display
-            update_callback(img_tk)
-            
-            # Schedule next update
-            self.update_task = frm_mid.after(20, update_frame)
+            # Schedule next poll
+            self.update_task = frm_mid.after(CAMERA_DISPLAY_INTERVAL_MS, update_frame)
 
         update_frame()
         return True
 
     def stop_camera(self):
         """Dừng camera"""
+        if self.pipeline is not None:
+            self.pipeline.stop()
+            self.pipeline = None
+        self.last_result = None
         if self.cap is not None:
             self.cap.release()
             self.cap = None
         if self.update_task is not None:
             self.update_task = None
-        self.detect_closed = True 
\ No newline at end of file
+        self.detect_closed = True
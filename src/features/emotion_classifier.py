@@ -0,0 +1,256 @@
+"""
+Batched FER2013 emotion classification.
+
+Face crops are prepared exactly like ``fer.FER.detect_emotions`` does
+(square box, fixed offsets, zero padding, grayscale, [-1, 1] scaling) but
+are stacked into one NumPy batch so a whole frame, or a window of frames,
+is classified with a single forward pass.
+
+Two engines run the same FER2013 mini-Xception network: the original
+Keras model shipped with ``fer``, and an ONNX export of it executed by
+onnxruntime (or ``cv2.dnn`` when onnxruntime is not installed), which
+avoids importing TensorFlow at all. A third engine runs an INT8
+quantized copy of the ONNX model for CPU-only machines.
+"""
+
+import importlib.util
+import os
+import cv2
+import numpy as np
+from src.config import EMOTION_BATCH_SIZE, EMOTION_ONNX_MODEL_PATH, EMOTION_INT8_MODEL_PATH
+from src.features.model_versions import file_version, package_version
+
+EMOTION_LABELS = ['angry', 'disgust', 'fear', 'happy', 'sad', 'surprise', 'neutral']
+
+# Thông số cắt khuôn mặt giống thư viện fer
+FACE_OFFSETS = (10, 10)
+FACE_PADDING = 40
+
+
+def fer_data_path(file_name):
+    """Đường dẫn tới file dữ liệu đi kèm gói fer (không cần import fer)"""
+    spec = importlib.util.find_spec('fer')
+    if spec is None or not spec.submodule_search_locations:
+        raise FileNotFoundError("The 'fer' package is not installed")
+    return os.path.join(list(spec.submodule_search_locations)[0], 'data', file_name)
+
+
+def to_square(box):
+    """Kéo dài cạnh ngắn hơn để box thành hình vuông"""
+    x, y, w, h = box
+    if h > w:
+        diff = h - w
+        x -= diff // 2
+        w += diff
+    elif w > h:
+        diff = w - h
+        y -= diff // 2
+        h += diff
+    return x, y, w, h
+
+
+def extract_face_crop(gray, box, target_size):
+    """Cắt, chuẩn hóa một khuôn mặt từ ảnh xám, trả về None nếu box không hợp lệ"""
+    x, y, w, h = to_square(tuple(int(v) for v in box))
+    x1, x2 = x - FACE_OFFSETS[0], x + w + FACE_OFFSETS[0]
+    y1, y2 = y - FACE_OFFSETS[1], y + h + FACE_OFFSETS[1]
+
+    # fer đệm ảnh bằng viền đen; chỉ đệm vùng cắt khi box vượt ra ngoài ảnh
+    height, width = gray.shape[:2]
+    x1, y1 = max(x1, -FACE_PADDING), max(y1, -FACE_PADDING)
+    x2, y2 = min(x2, width + FACE_PADDING), min(y2, height + FACE_PADDING)
+    if x2 <= x1 or y2 <= y1:
+        return None
+
+    crop = gray[max(y1, 0):max(y2, 0), max(x1, 0):max(x2, 0)]
+    if crop.size == 0:
+        return None
+    top, left = max(0, -y1), max(0, -x1)
+    bottom, right = max(0, y2 - height), max(0, x2 - width)
+    if top or left or bottom or right:
+        crop = cv2.copyMakeBorder(crop, top, bottom, left, right, cv2.BORDER_CONSTANT, value=0)
+
+    crop = cv2.resize(crop, target_size)
+    crop = crop.astype(np.float32) / 255.0
+    return (crop - 0.5) * 2.0
+
+
+def scores_to_emotions(scores):
+    """Chuyển vector xác suất thành dict cảm xúc giống định dạng của fer"""
+    return {label: round(float(score), 2) for label, score in zip(EMOTION_LABELS, scores)}
+
+
+class KerasEmotionClassifier:
+    """The FER2013 mini-Xception classifier shipped with ``fer``, run through Keras."""
+
+    name = 'keras'
+
+    def __init__(self, model_path=None):
+        from tensorflow.keras.models import load_model
+
+        self.model_path = model_path or fer_data_path('emotion_model.hdf5')
+        self.model = load_model(self.model_path, compile=False)
+        self.target_size = tuple(self.model.input_shape[1:3][::-1])
+
+    @staticmethod
+    def version():
+        return f"fer{package_version('fer')}"
+
+    def predict(self, batch):
+        """Dự đoán xác suất cảm xúc cho một batch (N, H, W, 1)"""
+        return np.asarray(self.model(batch, training=False))
+
+
+class OnnxEmotionClassifier:
+    """The FER2013 classifier exported to ONNX, run on CPU without TensorFlow."""
+
+    name = 'onnx'
+
+    convert_command = "python -m src.cli convert-model"
+
+    def __init__(self, model_path=None):
+        model_path = model_path or self.default_model_path()
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"ONNX emotion model '{model_path}' not found. "
+                f"Create it with: {self.convert_command}"
+            )
+        self.model_path = model_path
+        try:
+            import onnxruntime
+        except ImportError:
+            onnxruntime = None
+
+        if onnxruntime is not None:
+            self.session = onnxruntime.InferenceSession(model_path, providers=['CPUExecutionProvider'])
+            model_input = self.session.get_inputs()[0]
+            self.input_name = model_input.name
+            height, width = model_input.shape[1:3]
+            self.net = None
+        else:
+            # Không có onnxruntime thì dùng cv2.dnn (đã có sẵn trong OpenCV)
+            self.session = None
+            self.net = cv2.dnn.readNetFromONNX(model_path)
+            height = width = None
+        # Kích thước đầu vào của model FER2013 đi kèm fer là 64x64
+        self.target_size = (
+            width if isinstance(width, int) else 64,
+            height if isinstance(height, int) else 64
+        )
+
+    @staticmethod
+    def default_model_path():
+        return EMOTION_ONNX_MODEL_PATH
+
+    @classmethod
+    def version(cls):
+        return file_version(cls.default_model_path())
+
+    def predict(self, batch):
+        """Dự đoán xác suất cảm xúc cho một batch (N, H, W, 1)"""
+        batch = np.ascontiguousarray(batch, dtype=np.float32)
+        if self.session is not None:
+            return self.session.run(None, {self.input_name: batch})[0]
+        self.net.setInput(batch)
+        return self.net.forward().reshape(len(batch), -1)
+
+
+def export_onnx(output_path=EMOTION_ONNX_MODEL_PATH, model_path=None):
+    """Chuyển model Keras của fer sang ONNX (cần tf2onnx hoặc Keras có hỗ trợ export ONNX)"""
+    import tensorflow as tf
+    from tensorflow.keras.models import load_model
+
+    model = load_model(model_path or fer_data_path('emotion_model.hdf5'), compile=False)
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    try:
+        import tf2onnx
+    except ImportError:
+        tf2onnx = None
+
+    if tf2onnx is not None:
+        # Cố định tên đầu vào và cho phép batch động
+        spec = (tf.TensorSpec((None,) + tuple(model.input_shape[1:]), tf.float32, name="input"),)
+        tf2onnx.convert.from_keras(model, input_signature=spec, opset=13, output_path=output_path)
+    else:
+        model.export(output_path, format="onnx")
+    return output_path
+
+
+class QuantizedEmotionClassifier(OnnxEmotionClassifier):
+    """INT8 quantized copy of the ONNX classifier."""
+
+    name = 'onnx-int8'
+    convert_command = "python -m src.cli quantize-model --calibration-dir <images>"
+
+    @staticmethod
+    def default_model_path():
+        return EMOTION_INT8_MODEL_PATH
+
+
+def quantize_onnx(input_path=EMOTION_ONNX_MODEL_PATH, output_path=EMOTION_INT8_MODEL_PATH,
+                  calibration_crops=None):
+    """Lượng tử hóa model ONNX sang INT8 (cần onnxruntime)
+
+    Có calibration_crops thì lượng tử hóa tĩnh (QDQ, hiệu chuẩn trên crop khuôn mặt thật),
+    nếu không thì lượng tử hóa động chỉ trọng số.
+    """
+    from onnxruntime import InferenceSession
+    from onnxruntime.quantization import (
+        CalibrationDataReader,
+        QuantFormat,
+        QuantType,
+        quantize_dynamic,
+        quantize_static
+    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    if not calibration_crops:
+        quantize_dynamic(input_path, output_path, weight_type=QuantType.QInt8)
+        return output_path
+
+    input_name = InferenceSession(input_path, providers=['CPUExecutionProvider']).get_inputs()[0].name
+
+    class FaceCropReader(CalibrationDataReader):
+        def __init__(self, crops):
+            self._batches = iter(
+                {input_name: crop[np.newaxis, ..., np.newaxis].astype(np.float32)} for crop in crops
+            )
+
+        def get_next(self):
+            return next(self._batches, None)
+
+    quantize_static(
+        input_path, output_path, FaceCropReader(calibration_crops),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8
+    )
+    return output_path
+
+
+EMOTION_CLASSIFIERS = {
+    KerasEmotionClassifier.name: KerasEmotionClassifier,
+    OnnxEmotionClassifier.name: OnnxEmotionClassifier,
+    QuantizedEmotionClassifier.name: QuantizedEmotionClassifier
+}
+
+
+def create_emotion_classifier(engine):
+    """Tạo bộ phân loại cảm xúc theo tên engine (keras, onnx, onnx-int8)"""
+    classifier = EMOTION_CLASSIFIERS.get(engine)
+    if classifier is None:
+        raise ValueError(f"Unknown emotion engine '{engine}'. Choose from {sorted(EMOTION_CLASSIFIERS)}")
+    return classifier()
+
+
+def classify_crops(classifier, crops, batch_size=EMOTION_BATCH_SIZE):
+    """Phân loại danh sách crop theo từng batch, trả về ma trận (N, 7)"""
+    if not crops:
+        return np.zeros((0, len(EMOTION_LABELS)), dtype=np.float32)
+    batch = np.stack(crops)[..., np.newaxis]
+    if len(batch) <= batch_size:
+        return classifier.predict(batch)
+    return np.concatenate([
+        classifier.predict(batch[start:start + batch_size])
+        for start in range(0, len(batch), batch_size)
+    ])
@@ -1,13 +1,215 @@
-from fer import FER
+"""
+Emotion detector and the process-wide model registry it draws from.
+
+Face detection goes through a pluggable backend (see face_detectors.py)
+and emotion classification through the shared batched classifier.
+"""
+
+import threading
 import cv2
+from src.config import FACE_DETECTOR_BACKEND, EMOTION_ENGINE
+from src.features.emotion_classifier import (
+    EMOTION_CLASSIFIERS,
+    create_emotion_classifier,
+    classify_crops,
+    extract_face_crop,
+    scores_to_emotions
+)
+from src.features.face_detectors import FACE_DETECTORS, create_face_detector
+from src.features.profiler import PROFILER
+
+# Registry dùng chung cho toàn tiến trình: mỗi model chỉ được tải một lần
+_models = {}
+_inference_locks = {}
+_registry_lock = threading.Lock()
+_warmup_thread = None
+
+
+def get_model(key, loader):
+    """Trả về model dùng chung theo key, gọi loader ở lần sử dụng đầu tiên"""
+    model = _models.get(key)
+    if model is None:
+        with _registry_lock:
+            model = _models.get(key)
+            if model is None:
+                model = loader()
+                _inference_locks[key] = threading.Lock()
+                _models[key] = model
+    return model
+
+
+def get_inference_lock(key):
+    """Trả về lock suy luận của model tương ứng với key"""
+    return _inference_locks[key]
+
+
+def is_model_loaded(key=('detector', FACE_DETECTOR_BACKEND)):
+    """Kiểm tra model đã được tải vào bộ nhớ chưa"""
+    return key in _models
+
+
+def get_face_detector(backend=FACE_DETECTOR_BACKEND):
+    """Trả về backend tìm khuôn mặt dùng chung"""
+    return get_model(('detector', backend), lambda: create_face_detector(backend))
+
+
+def get_emotion_classifier(engine=EMOTION_ENGINE):
+    """Trả về bộ phân loại cảm xúc dùng chung theo engine"""
+    return get_model(('classifier', engine), lambda: create_emotion_classifier(engine))
+
+
+def _load_default_models():
+    get_face_detector()
+    get_emotion_classifier()
+
+
+def preload_models(background=True):
+    """Nạp trước model, mặc định chạy ở luồng nền để không chặn giao diện"""
+    global _warmup_thread
+    if not background:
+        _load_default_models()
+        return None
+
+    with _registry_lock:
+        if _warmup_thread is None or not _warmup_thread.is_alive():
+            if is_model_loaded() and is_model_loaded(('classifier', EMOTION_ENGINE)):
+                return None
+            _warmup_thread = threading.Thread(
+                target=_load_default_models, name="emotion-model-warmup", daemon=True
+            )
+            _warmup_thread.start()
+        return _warmup_thread
+
 
 class EmotionDetector:
-    def __init__(self):
-        self.detector = FER()
+    def __init__(self, backend=FACE_DETECTOR_BACKEND, engine=EMOTION_ENGINE,
+                 inference_short_side=None, crop_cache=None, shared_models=True):
+        self.backend = backend
+        self.engine = engine
+        # None: tìm khuôn mặt ở độ phân giải gốc (ảnh tĩnh); camera/video truyền INFERENCE_SHORT_SIDE
+        self.inference_short_side = inference_short_side
+        # FaceCropCache tùy chọn: dùng lại điểm cảm xúc của khuôn mặt gần như không đổi giữa các frame
+        self.crop_cache = crop_cache
+        # shared_models=False: detector giữ model riêng (worker của pool suy luận chạy song song)
+        self.shared_models = shared_models
+        self._private_models = {}
+        self._private_locks = {'detector': threading.Lock(), 'classifier': threading.Lock()}
+        self._model_id = None
+
+    @property
+    def model_id(self):
+        """Định danh backend/engine và phiên bản model, dùng làm một phần khóa cache kết quả"""
+        if self._model_id is None:
+            self._model_id = "/".join([
+                f"{self.backend}-{FACE_DETECTORS[self.backend].version()}",
+                f"{self.engine}-{EMOTION_CLASSIFIERS[self.engine].version()}",
+                f"short{self.inference_short_side}"
+            ])
+        return self._model_id
+
+    @property
+    def detector(self):
+        """Backend tìm khuôn mặt dùng chung từ registry (hoặc của riêng detector này)"""
+        if not self.shared_models:
+            if 'detector' not in self._private_models:
+                self._private_models['detector'] = create_face_detector(self.backend)
+            return self._private_models['detector']
+        return get_face_detector(self.backend)
+
+    @property
+    def classifier(self):
+        """Bộ phân loại cảm xúc dùng chung từ registry (hoặc của riêng detector này)"""
+        if not self.shared_models:
+            if 'classifier' not in self._private_models:
+                self._private_models['classifier'] = create_emotion_classifier(self.engine)
+            return self._private_models['classifier']
+        return get_emotion_classifier(self.engine)
+
+    def _inference_lock(self, kind):
+        """Lock suy luận của model detector/classifier đang dùng"""
+        if not self.shared_models:
+            return self._private_locks[kind]
+        return get_inference_lock((kind, self.backend if kind == 'detector' else self.engine))
+
+    def _inference_scale(self, frame):
+        """Tỉ lệ thu nhỏ frame về độ phân giải suy luận (1.0 nếu không cần thu nhỏ)"""
+        short_side = min(frame.shape[:2])
+        if not self.inference_short_side or short_side <= self.inference_short_side:
+            return 1.0
+        return self.inference_short_side / short_side
+
+    def downscale(self, frame):
+        """Thu nhỏ frame về độ phân giải suy luận, trả về (frame nhỏ, tỉ lệ)"""
+        scale = self._inference_scale(frame)
+        if scale < 1.0:
+            frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        return frame, scale
+
+    def find_faces(self, frame):
+        """Tìm vị trí các khuôn mặt trong frame (BGR), box theo tọa độ của frame gốc"""
+        return self.find_faces_batch([frame])[0]
+
+    def find_faces_batch(self, frames):
+        """Tìm khuôn mặt cho nhiều frame bằng một lần gọi backend"""
+        # Nhận diện trên bản thu nhỏ để chi phí không phụ thuộc kích thước cửa sổ/camera
+        with PROFILER.stage('downscale'):
+            scaled = [self.downscale(frame) for frame in frames]
+        detector = self.detector
+        with self._inference_lock('detector'), PROFILER.stage('detect'):
+            batch_boxes = detector.detect_batch([small for small, _ in scaled])
+        return [
+            [[int(round(v / scale)) for v in box] for box in boxes]
+            for boxes, (_, scale) in zip(batch_boxes, scaled)
+        ]
 
     def detect_emotions(self, frame):
-        """Nhận diện cảm xúc trong frame"""
-        return self.detector.detect_emotions(frame)
+        """Nhận diện cảm xúc trong frame (cắt khuôn mặt từ frame gốc độ phân giải đầy đủ)"""
+        return self.classify_faces(frame, self.find_faces(frame))
+
+    def classify_faces(self, frame, boxes):
+        """Chỉ phân loại cảm xúc cho các khuôn mặt đã biết vị trí"""
+        return self.classify_batch([(frame, boxes)])[0]
+
+    def classify_batch(self, items):
+        """Phân loại cảm xúc cho nhiều (frame, boxes) trong một lần gọi model"""
+        classifier = self.classifier
+        crops, owners = [], []
+        for frame_idx, (frame, boxes) in enumerate(items):
+            if len(boxes) == 0:
+                continue
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+            for box in boxes:
+                crop = extract_face_crop(gray, box, classifier.target_size)
+                if crop is not None:
+                    crops.append(crop)
+                    owners.append((frame_idx, [int(v) for v in box]))
+
+        results = [[] for _ in items]
+        if not crops:
+            return results
+
+        scores = [None] * len(crops)
+        pending = range(len(crops))
+        if self.crop_cache is not None:
+            fingerprints = [self.crop_cache.fingerprint(crop) for crop in crops]
+            for idx, fingerprint in enumerate(fingerprints):
+                scores[idx] = self.crop_cache.lookup(fingerprint, owners[idx][1])
+            pending = [idx for idx, face_scores in enumerate(scores) if face_scores is None]
+
+        if pending:
+            with self._inference_lock('classifier'), PROFILER.stage('classify'):
+                fresh = classify_crops(classifier, [crops[idx] for idx in pending])
+            for idx, face_scores in zip(pending, fresh):
+                scores[idx] = face_scores
+                if self.crop_cache is not None:
+                    self.crop_cache.store(fingerprints[idx], owners[idx][1], face_scores)
+        for (frame_idx, box), face_scores in zip(owners, scores):
+            results[frame_idx].append({'box': box, 'emotions': scores_to_emotions(face_scores)})
+        return results
+
+    def detect_emotions_batch(self, frames):
+        """Nhận diện cảm xúc cho nhiều frame, phân loại mọi khuôn mặt trong một batch"""
+        return self.classify_batch(list(zip(frames, self.find_faces_batch(frames))))
 
     def process_frame(self, frame, scale=1.0):
         """Xử lý frame và trả về kết quả nhận diện"""
@@ -24,9 +226,9 @@ class EmotionDetector:
                 percent = max(face["emotions"].values())
 
                 cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-                cv2.putText(frame, f"{top_emotion} {percent*100:.0f}%", 
+                cv2.putText(frame, f"{top_emotion} {percent*100:.0f}%",
                            (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
         else:
-            cv2.putText(frame, "No face detected", (50, 50), 
+            cv2.putText(frame, "No face detected", (50, 50),
                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-        return frame 
\ No newline at end of file
+        return frame
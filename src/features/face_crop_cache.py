@@ -0,0 +1,104 @@
+"""
+Short-lived memo of emotion scores for face crops that barely change.
+
+Each normalised face crop is fingerprinted with a difference hash (dHash)
+of a tiny downsampled copy. A crop reuses the scores of a recent entry
+only if both its hash is within a few bits of that entry's and its box
+overlaps the entry's box, so two similar-looking people in different
+places never share scores. Entries expire a fixed time after they were
+classified, so a face that sits still is still re-scored regularly.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+import cv2
+import numpy as np
+from src.config import (
+    FACE_CROP_CACHE_ENABLED,
+    FACE_CROP_CACHE_CAPACITY,
+    FACE_CROP_CACHE_TTL,
+    FACE_CROP_CACHE_MAX_DISTANCE,
+    FACE_CROP_CACHE_MIN_IOU
+)
+
+
+def dhash(crop, hash_size=8):
+    """Difference hash của ảnh xám: so sánh từng cặp điểm ảnh kề nhau trên bản thu nhỏ"""
+    small = cv2.resize(crop, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+def box_iou(a, b):
+    """Tỉ lệ giao trên hợp (IoU) của hai hộp (x, y, w, h)"""
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    inter_w = min(ax + aw, bx + bw) - max(ax, bx)
+    inter_h = min(ay + ah, by + bh) - max(ay, by)
+    if inter_w <= 0 or inter_h <= 0:
+        return 0.0
+    inter = inter_w * inter_h
+    return inter / (aw * ah + bw * bh - inter)
+
+
+class FaceCropCache:
+    """Bounded, TTL-limited map from crop fingerprints to emotion scores."""
+
+    def __init__(self, capacity=FACE_CROP_CACHE_CAPACITY, ttl=FACE_CROP_CACHE_TTL,
+                 max_distance=FACE_CROP_CACHE_MAX_DISTANCE, min_iou=FACE_CROP_CACHE_MIN_IOU):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.max_distance = max_distance
+        self.min_iou = min_iou
+        self.hits = 0
+        self.misses = 0
+        # (fingerprint, box) -> (scores, thời điểm phân loại)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    fingerprint = staticmethod(dhash)
+
+    def lookup(self, fingerprint, box, now=None):
+        """Trả về điểm cảm xúc của crop gần giống nhất tại cùng vị trí còn hiệu lực, None nếu không có"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            best_key, best_distance = None, self.max_distance + 1
+            for key, (scores, created) in list(self._entries.items()):
+                if now - created > self.ttl:
+                    del self._entries[key]
+                    continue
+                if box_iou(key[1], box) < self.min_iou:
+                    continue
+                distance = (key[0] ^ fingerprint).bit_count()
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+            if best_key is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best_key)
+            self.hits += 1
+            return self._entries[best_key][0]
+
+    def store(self, fingerprint, box, scores, now=None):
+        """Lưu điểm cảm xúc vừa phân loại cho crop, thay các mục cũ ở cùng vị trí"""
+        now = time.monotonic() if now is None else now
+        box = tuple(box)
+        with self._lock:
+            for key in [key for key in self._entries if box_iou(key[1], box) >= self.min_iou]:
+                del self._entries[key]
+            self._entries[(fingerprint, box)] = (scores, now)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def create_face_crop_cache():
+    """Tạo cache crop khuôn mặt cho luồng video/camera, None nếu bị tắt trong cấu hình"""
+    return FaceCropCache() if FACE_CROP_CACHE_ENABLED else None
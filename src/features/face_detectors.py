@@ -0,0 +1,178 @@
+"""
+Pluggable face-detector backends.
+
+Every backend returns boxes in the same format, ``[x, y, w, h]`` integer
+lists in the coordinates of the frame it was given, so the emotion
+classifier and the drawing code do not care which detector produced them.
+"""
+
+import os
+import cv2
+import numpy as np
+from src.config import (
+    DNN_FACE_PROTOTXT,
+    DNN_FACE_MODEL,
+    DNN_MIN_CONFIDENCE,
+    MTCNN_MIN_CONFIDENCE
+)
+from src.features.model_versions import file_version, package_version
+
+
+def _clip_box(x1, y1, x2, y2, width, height):
+    x1, y1 = max(0, int(x1)), max(0, int(y1))
+    x2, y2 = min(width, int(x2)), min(height, int(y2))
+    if x2 <= x1 or y2 <= y1:
+        return None
+    return [x1, y1, x2 - x1, y2 - y1]
+
+
+class FaceDetectorBackend:
+    """Base class: subclasses implement ``detect`` and may override ``detect_batch``."""
+
+    name = None
+
+    @staticmethod
+    def version():
+        """Phiên bản của model/thư viện, dùng để làm mới cache kết quả khi thay đổi"""
+        return f"cv{cv2.__version__}"
+
+    def detect(self, frame):
+        """Tìm khuôn mặt trong frame BGR, trả về danh sách [x, y, w, h]"""
+        raise NotImplementedError
+
+    def detect_batch(self, frames):
+        """Tìm khuôn mặt cho nhiều frame"""
+        return [self.detect(frame) for frame in frames]
+
+
+class HaarFaceDetector(FaceDetectorBackend):
+    """OpenCV Haar cascade with the same parameters ``fer`` uses."""
+
+    name = 'haar'
+
+    def __init__(self, scale_factor=1.1, min_neighbors=5, min_face_size=50):
+        cascade_path = os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml")
+        self.cascade = cv2.CascadeClassifier(cascade_path)
+        if self.cascade.empty():
+            raise FileNotFoundError(f"Cannot load Haar cascade '{cascade_path}'")
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.min_face_size = min_face_size
+
+    def detect(self, frame):
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        faces = self.cascade.detectMultiScale(
+            gray,
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=(self.min_face_size, self.min_face_size)
+        )
+        return [[int(v) for v in box] for box in faces]
+
+
+class MTCNNFaceDetector(FaceDetectorBackend):
+    """facenet-pytorch MTCNN; frames of equal size are detected in one batch."""
+
+    name = 'mtcnn'
+
+    def __init__(self, min_confidence=MTCNN_MIN_CONFIDENCE, device='cpu'):
+        from facenet_pytorch import MTCNN
+
+        self.mtcnn = MTCNN(keep_all=True, device=device)
+        self.min_confidence = min_confidence
+
+    @staticmethod
+    def version():
+        return f"facenet{package_version('facenet-pytorch')}"
+
+    def _to_boxes(self, boxes, probs, width, height):
+        results = []
+        if boxes is None:
+            return results
+        for (x1, y1, x2, y2), prob in zip(boxes, probs):
+            if prob is None or prob < self.min_confidence:
+                continue
+            box = _clip_box(x1, y1, x2, y2, width, height)
+            if box is not None:
+                results.append(box)
+        return results
+
+    def detect(self, frame):
+        return self.detect_batch([frame])[0]
+
+    def detect_batch(self, frames):
+        if not frames:
+            return []
+        height, width = frames[0].shape[:2]
+        if any(frame.shape[:2] != (height, width) for frame in frames):
+            return [self.detect(frame) for frame in frames]
+
+        rgb = [cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) for frame in frames]
+        boxes, probs = self.mtcnn.detect(rgb)
+        return [self._to_boxes(b, p, width, height) for b, p in zip(boxes, probs)]
+
+
+class DnnFaceDetector(FaceDetectorBackend):
+    """OpenCV DNN ResNet-10 SSD face detector (Caffe weights)."""
+
+    name = 'dnn'
+    input_size = (300, 300)
+    mean = (104.0, 177.0, 123.0)
+
+    def __init__(self, prototxt=DNN_FACE_PROTOTXT, model=DNN_FACE_MODEL, min_confidence=DNN_MIN_CONFIDENCE):
+        for path in (prototxt, model):
+            if not os.path.exists(path):
+                raise FileNotFoundError(
+                    f"DNN face detector file '{path}' not found. Download deploy.prototxt from "
+                    "opencv/samples/dnn/face_detector and res10_300x300_ssd_iter_140000.caffemodel "
+                    "from opencv_3rdparty (dnn_samples_face_detector_20170830)."
+                )
+        self.net = cv2.dnn.readNetFromCaffe(prototxt, model)
+        self.min_confidence = min_confidence
+
+    @staticmethod
+    def version():
+        return file_version(DNN_FACE_MODEL)
+
+    def _to_boxes(self, detections, width, height):
+        results = []
+        for detection in detections:
+            confidence = detection[2]
+            if confidence < self.min_confidence:
+                continue
+            x1, y1, x2, y2 = detection[3:7] * np.array([width, height, width, height])
+            box = _clip_box(x1, y1, x2, y2, width, height)
+            if box is not None:
+                results.append(box)
+        return results
+
+    def detect(self, frame):
+        return self.detect_batch([frame])[0]
+
+    def detect_batch(self, frames):
+        if not frames:
+            return []
+        blob = cv2.dnn.blobFromImages(frames, 1.0, self.input_size, self.mean, swapRB=False, crop=False)
+        self.net.setInput(blob)
+        # Đầu ra (1, 1, N, 7): [batch_id, class_id, confidence, x1, y1, x2, y2]
+        detections = self.net.forward()[0, 0]
+        results = []
+        for idx, frame in enumerate(frames):
+            height, width = frame.shape[:2]
+            results.append(self._to_boxes(detections[detections[:, 0] == idx], width, height))
+        return results
+
+
+FACE_DETECTORS = {
+    HaarFaceDetector.name: HaarFaceDetector,
+    MTCNNFaceDetector.name: MTCNNFaceDetector,
+    DnnFaceDetector.name: DnnFaceDetector
+}
+
+
+def create_face_detector(name):
+    """Tạo backend tìm khuôn mặt theo tên (haar, mtcnn, dnn)"""
+    backend = FACE_DETECTORS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown face detector '{name}'. Choose from {sorted(FACE_DETECTORS)}")
+    return backend()
@@ -0,0 +1,143 @@
+"""
+Detect-every-N-frames face tracking.
+
+Full face detection and emotion classification only run every few frames
+(or as soon as a track is lost); in between, face boxes are carried
+forward with a lightweight OpenCV tracker from opencv-contrib.
+"""
+
+import cv2
+from src.config import (
+    TRACKING_ENABLED,
+    TRACKING_DETECT_INTERVAL,
+    TRACKING_CLASSIFY_INTERVAL,
+    TRACKER_TYPE
+)
+from src.features.profiler import PROFILER
+
+_TRACKER_FACTORIES = {
+    'kcf': 'TrackerKCF_create',
+    'csrt': 'TrackerCSRT_create',
+    'mosse': 'TrackerMOSSE_create'
+}
+
+
+def create_tracker(tracker_type=TRACKER_TYPE):
+    """Tạo tracker OpenCV theo tên (kcf, csrt, mosse)"""
+    factory_name = _TRACKER_FACTORIES.get(tracker_type.lower())
+    if factory_name is None:
+        raise ValueError(f"Unknown tracker type '{tracker_type}'. Choose from {sorted(_TRACKER_FACTORIES)}")
+
+    # API legacy có đủ cả ba tracker và cùng một cách gọi init/update
+    for namespace in (getattr(cv2, 'legacy', None), cv2):
+        factory = getattr(namespace, factory_name, None) if namespace is not None else None
+        if factory is not None:
+            return factory()
+    raise RuntimeError(f"OpenCV tracker '{tracker_type}' is not available, install opencv-contrib-python")
+
+
+class FaceTrack:
+    """A tracked face with its last known box and emotion scores."""
+
+    def __init__(self, tracker, box, emotions):
+        self.tracker = tracker
+        self.box = box
+        self.emotions = emotions
+        self.frames_since_classify = 0
+
+    def to_result(self):
+        """Trả về kết quả theo định dạng của detect_emotions"""
+        return {'box': list(self.box), 'emotions': self.emotions}
+
+
+class FaceTracker:
+    """Runs the detector every N frames and tracks faces in between."""
+
+    def __init__(self, detector, detect_interval=TRACKING_DETECT_INTERVAL,
+                 classify_interval=TRACKING_CLASSIFY_INTERVAL, tracker_type=TRACKER_TYPE,
+                 enabled=TRACKING_ENABLED):
+        self.detector = detector
+        self.detect_interval = max(1, detect_interval)
+        self.classify_interval = max(1, classify_interval)
+        self.tracker_type = tracker_type
+        self.enabled = enabled
+        self.tracks = []
+        self.frames_since_detect = 0
+        self.force_detect = True
+        self._frame_shape = None
+
+    def reset(self):
+        """Xóa toàn bộ track, lần cập nhật tiếp theo sẽ chạy nhận diện đầy đủ"""
+        self.tracks = []
+        self.frames_since_detect = 0
+        self.force_detect = True
+        self._frame_shape = None
+
+    def update(self, frame):
+        """Cập nhật track với frame mới và trả về kết quả nhận diện"""
+        if not self.enabled:
+            return self.detector.detect_emotions(frame)
+
+        # Kích thước frame thay đổi (resize cửa sổ) thì các tracker không còn hợp lệ
+        if frame.shape != self._frame_shape:
+            self.reset()
+            self._frame_shape = frame.shape
+
+        self.frames_since_detect += 1
+        if self.force_detect or self.frames_since_detect >= self.detect_interval:
+            return self._detect(frame)
+        return self._track(frame)
+
+    def _detect(self, frame):
+        results = self.detector.detect_emotions(frame)
+        self.tracks = []
+        self.frames_since_detect = 0
+        self.force_detect = False
+        # Tracker chạy trên cùng bản thu nhỏ mà detector dùng, box được quy đổi qua lại theo scale
+        small, scale = self.detector.downscale(frame)
+        for face in results:
+            box = tuple(int(v) for v in face['box'])
+            try:
+                tracker = create_tracker(self.tracker_type)
+                tracker.init(small, tuple(int(round(v * scale)) for v in box))
+            except (RuntimeError, cv2.error):
+                # Không có tracker thì quay về nhận diện mỗi frame
+                self.enabled = False
+                self.tracks = []
+                break
+            self.tracks.append(FaceTrack(tracker, box, face['emotions']))
+        return results
+
+    def _track(self, frame):
+        with PROFILER.stage('downscale'):
+            small, scale = self.detector.downscale(frame)
+        height, width = small.shape[:2]
+        alive = []
+        for track in self.tracks:
+            with PROFILER.stage('track'):
+                ok, box = track.tracker.update(small)
+            x, y, w, h = (int(v) for v in box)
+            if not ok or w <= 0 or h <= 0 or x >= width or y >= height or x + w <= 0 or y + h <= 0:
+                # Mất dấu: chạy lại nhận diện ở frame kế tiếp
+                self.force_detect = True
+                continue
+            track.box = tuple(int(round(v / scale)) for v in (x, y, w, h))
+            track.frames_since_classify += 1
+            alive.append(track)
+        self.tracks = alive
+
+        # Phân loại lại cảm xúc theo chu kỳ riêng của từng track, gộp vào một lần gọi
+        due = [track for track in self.tracks if track.frames_since_classify >= self.classify_interval]
+        if due:
+            classified = self.detector.classify_faces(frame, [track.box for track in due])
+            # Khuôn mặt có crop không hợp lệ bị bỏ khỏi kết quả: ghép lại theo box, track đó giữ cảm xúc cũ
+            by_box = {tuple(face['box']): face['emotions'] for face in classified}
+            for track in due:
+                emotions = by_box.get(tuple(track.box))
+                if emotions is not None:
+                    track.emotions = emotions
+                    track.frames_since_classify = 0
+
+        if not self.tracks:
+            self.force_detect = True
+        return [track.to_result() for track in self.tracks]
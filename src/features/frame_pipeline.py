@@ -0,0 +1,150 @@
+"""
+Background capture/inference pipeline used by the camera handler.
+
+A capture thread reads frames as fast as the source delivers them, an
+inference worker processes only the newest one, and the Tk main loop
+simply polls for the latest processed frame to display.
+"""
+
+import threading
+import time
+from collections import deque
+from src.features.profiler import PROFILER
+
+
+class LatestFrameQueue:
+    """Bounded queue where the newest item wins and stale items are dropped."""
+
+    def __init__(self, maxsize=1):
+        self._items = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item):
+        """Thêm phần tử, bỏ phần tử cũ nhất nếu hàng đợi đã đầy"""
+        with self._cond:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self, timeout=None):
+        """Lấy phần tử mới nhất, trả về None nếu hết thời gian chờ"""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            item = self._items.pop()
+            self._items.clear()
+            return item
+
+    def get_nowait(self):
+        """Lấy phần tử mới nhất mà không chờ"""
+        return self.get(timeout=0)
+
+    def clear(self):
+        """Xóa toàn bộ phần tử trong hàng đợi"""
+        with self._cond:
+            self._items.clear()
+
+
+class InferenceResult:
+    """Detection result stamped with the time its source frame was captured."""
+
+    def __init__(self, faces, frame_shape, timestamp=None):
+        self.faces = faces
+        self.frame_shape = frame_shape
+        self.timestamp = time.monotonic() if timestamp is None else timestamp
+
+    def age(self, now=None):
+        """Tuổi của kết quả tính bằng giây"""
+        return (time.monotonic() if now is None else now) - self.timestamp
+
+    def is_expired(self, max_age, now=None):
+        """Kết quả đã quá cũ để vẽ lên frame hiện tại chưa"""
+        return self.age(now) > max_age
+
+
+class FramePipeline:
+    """Capture thread + inference worker connected by latest-frame-wins queues.
+
+    With ``publish_raw`` enabled every captured frame is also published to
+    ``raw_queue`` so the display can run at capture rate while inference
+    results arrive asynchronously through ``output_queue``.
+    """
+
+    def __init__(self, cap, process_fn, poll_timeout=0.1, publish_raw=False):
+        self.cap = cap
+        self.process_fn = process_fn
+        self.poll_timeout = poll_timeout
+        self.publish_raw = publish_raw
+        self.capture_queue = LatestFrameQueue()
+        self.output_queue = LatestFrameQueue()
+        self.raw_queue = LatestFrameQueue()
+        self.finished = False
+        self.error = None
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Khởi động luồng đọc frame và luồng suy luận"""
+        self._stop_event.clear()
+        self.finished = False
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="frame-capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="frame-inference", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=1.0):
+        """Dừng các luồng nền và chờ chúng kết thúc"""
+        self._stop_event.set()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+        self._threads = []
+        self.capture_queue.clear()
+        self.output_queue.clear()
+        self.raw_queue.clear()
+
+    def poll(self):
+        """Lấy kết quả xử lý mới nhất cho giao diện, None nếu chưa có"""
+        return self.output_queue.get_nowait()
+
+    def poll_raw(self):
+        """Lấy frame gốc mới nhất (chế độ hiển thị bất đồng bộ)"""
+        return self.raw_queue.get_nowait()
+
+    @property
+    def dropped_frames(self):
+        """Số frame bị bỏ qua vì luồng suy luận chưa kịp xử lý"""
+        return self.capture_queue.dropped
+
+    def _capture_loop(self):
+        while not self._stop_event.is_set():
+            with PROFILER.stage('capture'):
+                ret, frame = self.cap.read()
+            if not ret:
+                self.finished = True
+                break
+            PROFILER.tick('capture')
+            self.capture_queue.put(frame)
+            if self.publish_raw:
+                self.raw_queue.put(frame)
+
+    def _inference_loop(self):
+        while not self._stop_event.is_set():
+            frame = self.capture_queue.get(timeout=self.poll_timeout)
+            if frame is None:
+                continue
+            try:
+                with PROFILER.stage('inference'):
+                    result = self.process_fn(frame)
+                PROFILER.tick('inference')
+                self.output_queue.put(result)
+            except Exception as e:
+                self.error = e
+                self.finished = True
+                break
@@ -2,11 +2,13 @@
 Image handler for processing image files.
 """
 
+import os
 import cv2
 import numpy as np
 from PIL import Image, ImageTk
 from tkinter import messagebox
 from .emotion_detector import EmotionDetector
+from .result_cache import content_hash, get_result_cache
 from ..utils import resize_image, convert_cv2_to_tk, draw_emotion_results, add_box_shadow
 
 class ImageHandler:
@@ -21,8 +23,9 @@ class ImageHandler:
     def process_image(self, file_path, frame, callback):
         """Process an image file and detect emotions."""
         try:
-            # Read image
-            img = cv2.imread(file_path)
+            # Read image (giữ nội dung file để tra cache theo mã băm)
+            data = np.fromfile(file_path, dtype=np.uint8) if os.path.isfile(file_path) else None
+            img = cv2.imdecode(data, cv2.IMREAD_COLOR) if data is not None and data.size else None
             if img is None:
                 error_msg = f"Lỗi: Không thể đọc ảnh\n\nChi tiết lỗi:\nKhông thể đọc ảnh từ đường dẫn:\n{file_path}\n\nVui lòng kiểm tra lại đường dẫn và chọn ảnh khác."
                 messagebox.showerror("Lỗi đọc ảnh", error_msg)
@@ -31,8 +34,8 @@ class ImageHandler:
             # Store original frame
             self.original_frame = img.copy()
             
-            # Detect emotions
-            results = self.detector.detect_emotions(img)
+            # Detect emotions (ảnh đã mở trước đó được lấy lại từ cache)
+            results = self._detect_emotions(img, data)
             
             # Draw results on frame
             self.processed_frame = draw_emotion_results(img, results)
@@ -48,6 +51,15 @@ class ImageHandler:
             error_msg = f"Lỗi: Không thể xử lý ảnh\n\nChi tiết lỗi:\n{str(e)}\n\nVui lòng thử lại."
             messagebox.showerror("Lỗi xử lý ảnh", error_msg)
             
+    def _detect_emotions(self, img, data):
+        """Detect emotions, reusing cached results for previously analysed files."""
+        cache = get_result_cache()
+        if cache is None:
+            return self.detector.detect_emotions(img)
+        return cache.get_or_compute(
+            content_hash(data), self.detector.model_id, lambda: self.detector.detect_emotions(img)
+        )
+            
     def _convert_to_tk(self, frame, target_frame):
         """Convert OpenCV frame to Tkinter image with shadow effect."""
         try:
@@ -0,0 +1,28 @@
+"""
+Version fingerprints for detectors and classifiers.
+
+Backends report a version string (installed package version or model
+file size/mtime) so cached results are invalidated when a model changes.
+The helpers live here rather than in any one backend module so detectors
+and classifiers can use them without importing each other.
+"""
+
+import importlib.metadata
+import os
+
+
+def package_version(name):
+    """Phiên bản của gói đã cài, 'unknown' nếu không tìm thấy"""
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def file_version(file_path):
+    """Dấu phiên bản của file model (kích thước và thời điểm sửa)"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return 'missing'
+    return f"{stat.st_size}-{int(stat.st_mtime)}"
@@ -0,0 +1,89 @@
+"""
+Cheap change detector placed in front of face detection.
+
+Frames are shrunk to a small grayscale thumbnail and compared either with
+the thumbnail of the last frame that was actually analysed (``absdiff``)
+or with an OpenCV MOG2 background model (``mog2``). When too few pixels
+changed the caller can reuse its previous results instead of running the
+detector; a periodic refresh still re-runs it now and then so slow
+lighting drift cannot freeze the results forever.
+"""
+
+import time
+import cv2
+from src.config import (
+    MOTION_GATE_ENABLED,
+    MOTION_GATE_METHOD,
+    MOTION_GATE_WIDTH,
+    MOTION_PIXEL_THRESHOLD,
+    MOTION_MIN_CHANGED_RATIO,
+    MOTION_REFRESH_INTERVAL
+)
+
+MOTION_GATE_METHODS = ('absdiff', 'mog2')
+
+
+class MotionGate:
+    """Decide per frame whether the scene changed enough to re-run inference."""
+
+    def __init__(self, method=MOTION_GATE_METHOD, width=MOTION_GATE_WIDTH,
+                 pixel_threshold=MOTION_PIXEL_THRESHOLD, min_changed_ratio=MOTION_MIN_CHANGED_RATIO,
+                 refresh_interval=MOTION_REFRESH_INTERVAL):
+        if method not in MOTION_GATE_METHODS:
+            raise ValueError(f"Unknown motion gate method '{method}'. Choose from {list(MOTION_GATE_METHODS)}")
+        self.method = method
+        self.width = width
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_ratio = min_changed_ratio
+        self.refresh_interval = refresh_interval
+        self.changed_ratio = 0.0
+        self.skipped = 0
+        self.reset()
+
+    def reset(self):
+        """Quên frame tham chiếu và mô hình nền (khi mở lại camera)"""
+        self._reference = None
+        self._last_pass = None
+        self._subtractor = None
+        if self.method == 'mog2':
+            self._subtractor = cv2.createBackgroundSubtractorMOG2(
+                history=200, varThreshold=self.pixel_threshold, detectShadows=False
+            )
+
+    def _thumbnail(self, frame):
+        height, width = frame.shape[:2]
+        size = (self.width, max(1, round(height * self.width / width)))
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        # Làm mờ để nhiễu cảm biến không bị tính là chuyển động
+        return cv2.GaussianBlur(small, (5, 5), 0)
+
+    def _changed_ratio(self, small):
+        if self.method == 'mog2':
+            mask = self._subtractor.apply(small)
+        else:
+            if self._reference is None or self._reference.shape != small.shape:
+                return 1.0
+            _, mask = cv2.threshold(cv2.absdiff(small, self._reference), self.pixel_threshold, 255,
+                                    cv2.THRESH_BINARY)
+        return cv2.countNonZero(mask) / mask.size
+
+    def update(self, frame, now=None):
+        """Trả về True nếu cần chạy nhận diện cho frame này"""
+        now = time.monotonic() if now is None else now
+        small = self._thumbnail(frame)
+        self.changed_ratio = self._changed_ratio(small)
+        due = self._last_pass is None or now - self._last_pass >= self.refresh_interval
+        if self.changed_ratio < self.min_changed_ratio and not due:
+            self.skipped += 1
+            return False
+        # absdiff so với frame được nhận diện gần nhất, nên chuyển động chậm vẫn được cộng dồn
+        self._reference = small
+        self._last_pass = now
+        return True
+
+
+def create_motion_gate():
+    """Tạo bộ lọc chuyển động theo cấu hình, None nếu bị tắt"""
+    return MotionGate() if MOTION_GATE_ENABLED else None
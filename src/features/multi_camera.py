@@ -0,0 +1,260 @@
+"""
+Several capture sources sharing one pool of inference workers.
+
+Every source (a device index, a video file or a stream URL) has its own
+capture thread that publishes raw frames for display and offers the
+newest frame for inference. A round-robin scheduler hands those frames
+to a fixed pool of worker threads, each holding its own
+``EmotionDetector`` with private models, so sources are served fairly and
+workers never wait on each other's model lock. Results are routed back
+to the source they came from.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+import cv2
+from src.config import FACE_DETECTOR_BACKEND, EMOTION_ENGINE, MULTI_CAMERA_WORKERS, INFERENCE_SHORT_SIDE
+from src.features.emotion_detector import EmotionDetector
+from src.features.frame_pipeline import LatestFrameQueue, InferenceResult
+from src.features.motion_gate import create_motion_gate
+from src.features.profiler import PROFILER
+
+
+def parse_sources(spec):
+    """Tách chuỗi nguồn "0, 1, rtsp://..." thành danh sách (số nguyên là chỉ số camera)"""
+    if not isinstance(spec, str):
+        return list(spec)
+    sources = []
+    for item in spec.split(","):
+        item = item.strip()
+        if item:
+            sources.append(int(item) if item.isdigit() else item)
+    return sources
+
+
+class CameraSource:
+    """One capture source with its own capture thread and result slot."""
+
+    def __init__(self, source_id, source, scheduler):
+        self.source_id = source_id
+        self.source = source
+        self.scheduler = scheduler
+        self.cap = None
+        self.raw_queue = LatestFrameQueue()
+        self.result_queue = LatestFrameQueue()
+        self.last_result = None
+        self.last_faces = None
+        self.motion_gate = create_motion_gate()
+        self.frames = 0
+        self.processed = 0
+        self.finished = False
+        self.error = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def name(self):
+        return f"Camera {self.source}" if isinstance(self.source, int) else os.path.basename(str(self.source))
+
+    def open(self):
+        """Mở nguồn, trả về False nếu không mở được"""
+        self.cap = cv2.VideoCapture(self.source)
+        if not self.cap.isOpened():
+            self.cap.release()
+            self.cap = None
+            self.error = f"cannot open source {self.source!r}"
+            return False
+        return True
+
+    def start(self):
+        self._stop_event.clear()
+        self.finished = False
+        self._thread = threading.Thread(target=self._capture_loop, name=f"capture-{self.source_id}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        self.raw_queue.clear()
+        self.result_queue.clear()
+
+    def _capture_loop(self):
+        # File video được đọc theo FPS của nó, camera/stream tự giới hạn theo tốc độ thiết bị
+        interval = 0.0
+        if isinstance(self.source, str) and os.path.isfile(self.source):
+            fps = self.cap.get(cv2.CAP_PROP_FPS)
+            interval = 1.0 / fps if fps > 0 else 0.0
+        while not self._stop_event.is_set():
+            start = time.monotonic()
+            ret, frame = self.cap.read()
+            if not ret:
+                self.finished = True
+                break
+            self.frames += 1
+            self.raw_queue.put(frame)
+            self.scheduler.submit(self, frame)
+            if interval:
+                self._stop_event.wait(max(0.0, interval - (time.monotonic() - start)))
+
+    def analyze(self, detector, frame):
+        """Chạy trên worker: nhận diện (trừ khi cảnh không đổi) và chuyển kết quả về nguồn"""
+        timestamp = time.monotonic()
+        changed = self.motion_gate is None or self.motion_gate.update(frame)
+        if changed or self.last_faces is None:
+            self.last_faces = detector.detect_emotions(frame)
+        self.processed += 1
+        self.result_queue.put(InferenceResult(self.last_faces, frame.shape[:2], timestamp))
+
+
+class FairFrameScheduler:
+    """Round-robin hand-off of the newest pending frame of each source.
+
+    A source is queued at most once and is never processed by two workers
+    at the same time, so a fast source cannot starve the others and its
+    per-source state (motion gate, last faces) needs no locking.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._ready = deque()
+        self._busy = set()
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def submit(self, source, frame):
+        """Đặt frame mới nhất của nguồn, thay frame cũ chưa được xử lý"""
+        with self._cond:
+            if source in self._pending:
+                self.dropped += 1
+            elif source not in self._busy:
+                self._ready.append(source)
+                self._cond.notify()
+            self._pending[source] = frame
+
+    def next(self, timeout=None):
+        """Lấy (nguồn, frame) kế tiếp theo vòng tròn, None nếu hết thời gian chờ"""
+        with self._cond:
+            if not self._ready:
+                self._cond.wait(timeout)
+            if not self._ready:
+                return None
+            source = self._ready.popleft()
+            self._busy.add(source)
+            return source, self._pending.pop(source)
+
+    def done(self, source):
+        """Báo worker đã xử lý xong nguồn; xếp lại hàng nếu nguồn có frame mới"""
+        with self._cond:
+            self._busy.discard(source)
+            if source in self._pending:
+                self._ready.append(source)
+                self._cond.notify()
+
+    def clear(self):
+        with self._cond:
+            self._pending.clear()
+            self._ready.clear()
+
+
+class MultiCameraManager:
+    """Open N sources and analyse them on a shared inference worker pool."""
+
+    def __init__(self, sources, workers=MULTI_CAMERA_WORKERS, backend=FACE_DETECTOR_BACKEND,
+                 engine=EMOTION_ENGINE, poll_timeout=0.1):
+        self.scheduler = FairFrameScheduler()
+        self.sources = [CameraSource(idx, source, self.scheduler) for idx, source in enumerate(parse_sources(sources))]
+        self.workers = workers or max(1, min(len(self.sources), os.cpu_count() or 1))
+        self.backend = backend
+        self.engine = engine
+        self.poll_timeout = poll_timeout
+        self.error = None
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Mở mọi nguồn và khởi động pool suy luận, trả về danh sách nguồn không mở được"""
+        failed = [source for source in self.sources if not source.open()]
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._worker_loop, name=f"inference-worker-{idx}", daemon=True)
+            for idx in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        for source in self.sources:
+            if source.cap is not None:
+                source.start()
+        return failed
+
+    def stop(self, timeout=1.0):
+        """Dừng các nguồn và pool suy luận"""
+        self._stop_event.set()
+        for source in self.sources:
+            source.stop(timeout)
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+        self._threads = []
+        self.scheduler.clear()
+
+    def _worker_loop(self):
+        # Mỗi worker giữ model riêng, không tranh lock suy luận với worker khác
+        detector = EmotionDetector(backend=self.backend, engine=self.engine,
+                                   inference_short_side=INFERENCE_SHORT_SIDE, shared_models=False)
+        try:
+            detector.detector
+            detector.classifier
+        except Exception as e:
+            self.error = e
+            return
+        while not self._stop_event.is_set():
+            task = self.scheduler.next(timeout=self.poll_timeout)
+            if task is None:
+                continue
+            source, frame = task
+            try:
+                with PROFILER.stage('inference'):
+                    source.analyze(detector, frame)
+                PROFILER.tick('inference')
+            except Exception as e:
+                source.error = e
+            finally:
+                self.scheduler.done(source)
+
+    def failure(self):
+        """Mô tả lỗi khiến việc suy luận không thể tiếp tục, None nếu mọi thứ bình thường"""
+        if self.error is not None:
+            return f"Không tải được model suy luận: {self.error}"
+        for source in self.sources:
+            # Nguồn không mở được đã được báo khi khởi động, chỉ xét lỗi phân tích của nguồn đang chạy
+            if source.cap is not None and source.error is not None:
+                return f"Lỗi khi phân tích {source.name}: {source.error}"
+        if self._threads and not self._stop_event.is_set() and not any(thread.is_alive() for thread in self._threads):
+            return "Mọi worker suy luận đã dừng"
+        return None
+
+    def poll_frame(self, source_id):
+        """Frame gốc mới nhất của nguồn, None nếu chưa có"""
+        return self.sources[source_id].raw_queue.get_nowait()
+
+    def poll_result(self, source_id):
+        """Kết quả suy luận mới nhất của nguồn (đồng thời lưu vào last_result), None nếu chưa có"""
+        source = self.sources[source_id]
+        result = source.result_queue.get_nowait()
+        if result is not None:
+            source.last_result = result
+        return result
+
+    def stats(self):
+        """Số frame đọc được và đã phân tích của từng nguồn"""
+        return {
+            source.name: {'frames': source.frames, 'processed': source.processed, 'finished': source.finished}
+            for source in self.sources
+        }
@@ -0,0 +1,99 @@
+from tkinter import messagebox
+from src.config import CAMERA_DISPLAY_INTERVAL_MS, OVERLAY_RESULT_MAX_AGE, MULTI_CAMERA_WORKERS
+from src.features.multi_camera import MultiCameraManager, parse_sources
+from src.features.profiler import PROFILER
+from src.utils.image_utils import resize_image, resized_shape, draw_emotion_results, FrameBufferRing
+
+class MultiCameraHandler:
+    def __init__(self, workers=MULTI_CAMERA_WORKERS, result_max_age=OVERLAY_RESULT_MAX_AGE):
+        self.manager = None
+        self.workers = workers
+        self.result_max_age = result_max_age
+        self.update_task = None
+        self.scheduler_widget = None
+        self.display_buffers = {}
+        self.detect_closed = False
+
+    def _overlay_frame(self, source, frame, tile_width, tile_height):
+        """Thu nhỏ frame gốc của một nguồn cho vừa ô hiển thị và vẽ kết quả gần nhất của nguồn đó"""
+        raw_height, raw_width = frame.shape[:2]
+        display_height = min(tile_height, int(tile_width * raw_height / raw_width))
+        buffers = self.display_buffers.setdefault(source.source_id, FrameBufferRing(size=2))
+        if display_height > 1:
+            frame = resize_image(frame, display_height, dst=buffers.get(resized_shape(frame, display_height)))
+        else:
+            frame = buffers.copy(frame)
+        result = source.last_result
+        if result is not None and not result.is_expired(self.result_max_age):
+            frame = draw_emotion_results(frame, result.faces, frame.shape[0] / raw_height)
+        return frame
+
+    def start_cameras(self, sources, tiles, update_callback, error_callback=None):
+        """Khởi động mọi nguồn, tiles là danh sách frame Tk tương ứng với từng nguồn"""
+        if self.manager is not None:
+            self.stop_cameras()
+
+        self.detect_closed = False  # Reset the flag
+        self.manager = MultiCameraManager(parse_sources(sources), self.workers)
+        failed = self.manager.start()
+        if len(failed) == len(self.manager.sources):
+            self.stop_cameras()
+            error_msg = f"Lỗi: Không thể mở camera\n\nChi tiết lỗi:\nKhông mở được nguồn nào trong:\n{sources}\n\nVui lòng kiểm tra lại chỉ số camera, đường dẫn hoặc URL."
+            messagebox.showerror("Lỗi mở camera", error_msg)
+            return False
+        if failed:
+            names = "\n".join(f"- {source.source}" for source in failed)
+            messagebox.showwarning("Lỗi mở camera", f"Không mở được các nguồn:\n{names}")
+
+        def update_frames():
+            if self.detect_closed:
+                self.detect_closed = False
+                return
+
+            # Worker không tải được model, lỗi khi phân tích hoặc mọi worker đã dừng: báo lỗi thay vì chỉ hiện frame gốc
+            failure = self.manager.failure()
+            if failure is not None:
+                self.update_task = None
+                self.stop_cameras()
+                error_msg = f"Lỗi: Không thể nhận diện cảm xúc\n\nChi tiết lỗi:\n{failure}\n\nVui lòng kiểm tra lại model hoặc nguồn camera."
+                messagebox.showerror("Lỗi nhận diện", error_msg)
+                if error_callback is not None:
+                    error_callback()
+                return
+
+            for source, tile in zip(self.manager.sources, tiles):
+                self.manager.poll_result(source.source_id)
+                frame = self.manager.poll_frame(source.source_id)
+                if frame is None:
+                    continue
+                # Tk chỉ được truy cập từ luồng giao diện
+                frame = self._overlay_frame(source, frame, tile.winfo_width(), tile.winfo_height())
+                with PROFILER.stage('display'):
+                    update_callback(source.source_id, frame)
+                PROFILER.tick('display')
+
+            if all(source.finished or source.cap is None for source in self.manager.sources):
+                self.stop_cameras()
+                return
+
+            # Schedule next poll
+            self.update_task = tiles[0].after(CAMERA_DISPLAY_INTERVAL_MS, update_frames)
+
+        self.scheduler_widget = tiles[0]
+        update_frames()
+        return True
+
+    @property
+    def sources(self):
+        return self.manager.sources if self.manager is not None else []
+
+    def stop_cameras(self):
+        """Dừng mọi nguồn và pool suy luận"""
+        if self.manager is not None:
+            self.manager.stop()
+            self.manager = None
+        if self.update_task is not None:
+            # Hủy lần cập nhật đã hẹn để vòng lặp cũ không chạy tiếp khi mở lại
+            self.scheduler_widget.after_cancel(self.update_task)
+            self.update_task = None
+        self.detect_closed = True
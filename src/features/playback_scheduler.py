@@ -0,0 +1,82 @@
+"""
+Frame-rate-accurate playback scheduling for the video window.
+
+The clock maps wall time to the frame that should be on screen according to
+the file's ``CAP_PROP_FPS``. When processing falls behind, whole frames are
+skipped and inference is reused, so playback stays in real time instead of
+slowing down to the speed of the model.
+"""
+
+import time
+from src.config import PLAYBACK_DEFAULT_FPS, PLAYBACK_DROP_THRESHOLD_FRAMES, PLAYBACK_INFERENCE_MAX_LAG
+
+
+class PlaybackClock:
+    """Presentation clock with dropped-frame and lag counters."""
+
+    def __init__(self, fps, drop_threshold=PLAYBACK_DROP_THRESHOLD_FRAMES,
+                 inference_max_lag=PLAYBACK_INFERENCE_MAX_LAG):
+        self.fps = fps if fps and fps > 0 else PLAYBACK_DEFAULT_FPS
+        self.frame_interval = 1.0 / self.fps
+        self.drop_threshold = max(1, drop_threshold)
+        self.inference_max_lag = inference_max_lag
+        self.reset()
+
+    def reset(self, now=None):
+        """Đặt lại đồng hồ về frame đầu tiên"""
+        self.start_time = time.perf_counter() if now is None else now
+        self.next_index = 0
+        self.presented_frames = 0
+        self.dropped_frames = 0
+        self.skipped_inference = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+    def presentation_time(self, frame_index):
+        """Thời điểm (perf_counter) frame cần được hiển thị"""
+        return self.start_time + frame_index * self.frame_interval
+
+    def frames_to_drop(self, now=None):
+        """Số frame cần bỏ qua để bắt kịp đồng hồ"""
+        now = time.perf_counter() if now is None else now
+        due_index = int((now - self.start_time) * self.fps)
+        behind = due_index - self.next_index
+        return behind if behind >= self.drop_threshold else 0
+
+    def drop(self, count=1):
+        """Ghi nhận các frame bị bỏ qua"""
+        self.next_index += count
+        self.dropped_frames += count
+
+    def present(self, now=None):
+        """Ghi nhận frame tiếp theo được hiển thị, trả về độ trễ (giây)"""
+        now = time.perf_counter() if now is None else now
+        self.lag = max(0.0, now - self.presentation_time(self.next_index))
+        self.max_lag = max(self.max_lag, self.lag)
+        self.next_index += 1
+        self.presented_frames += 1
+        return self.lag
+
+    def should_infer(self):
+        """Chỉ chạy suy luận khi frame hiện tại chưa bị trễ quá ngưỡng"""
+        if self.lag > self.inference_max_lag:
+            self.skipped_inference += 1
+            return False
+        return True
+
+    def delay_ms(self, now=None):
+        """Thời gian chờ (ms) tới khi frame tiếp theo đến hạn hiển thị"""
+        now = time.perf_counter() if now is None else now
+        delay = self.presentation_time(self.next_index) - now
+        return max(1, int(delay * 1000))
+
+    def stats(self):
+        """Bộ đếm để theo dõi và tinh chỉnh việc phát video"""
+        return {
+            'fps': self.fps,
+            'presented_frames': self.presented_frames,
+            'dropped_frames': self.dropped_frames,
+            'skipped_inference': self.skipped_inference,
+            'lag_ms': round(self.lag * 1000, 1),
+            'max_lag_ms': round(self.max_lag * 1000, 1)
+        }
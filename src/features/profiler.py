@@ -0,0 +1,133 @@
+"""
+Lightweight per-stage latency instrumentation for the frame pipeline.
+
+Stages are timed with ``with PROFILER.stage('detect'):`` blocks and kept
+in rolling windows from which p50/p95/p99 are computed on demand. Event
+rates (display fps, inference fps) are tracked with ``PROFILER.tick()``.
+
+When profiling is disabled ``stage()`` returns a shared no-op context
+manager and ``tick()`` returns immediately, so the instrumentation can
+stay in the hot path.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import deque
+import numpy as np
+from src.config import PROFILING_ENABLED, PROFILING_WINDOW, PROFILING_DUMP_PATH
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class _StageTimer:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class StageProfiler:
+    """Rolling per-stage timings and event rates."""
+
+    def __init__(self, enabled=PROFILING_ENABLED, window=PROFILING_WINDOW):
+        self.enabled = enabled
+        self.window = window
+        self._timings = {}
+        self._ticks = {}
+        self._lock = threading.Lock()
+
+    def _series(self, table, name):
+        series = table.get(name)
+        if series is None:
+            with self._lock:
+                series = table.setdefault(name, deque(maxlen=self.window))
+        return series
+
+    def stage(self, name):
+        """Context manager đo thời gian của một công đoạn"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _StageTimer(self, name)
+
+    def record(self, name, seconds):
+        """Ghi nhận thời gian (giây) của một công đoạn"""
+        if self.enabled:
+            self._series(self._timings, name).append(seconds * 1000.0)
+
+    def tick(self, name):
+        """Ghi nhận một sự kiện để tính tốc độ (lần/giây)"""
+        if self.enabled:
+            self._series(self._ticks, name).append(time.perf_counter())
+
+    def reset(self):
+        """Xóa toàn bộ số liệu đã ghi"""
+        with self._lock:
+            self._timings.clear()
+            self._ticks.clear()
+
+    def rate(self, name):
+        """Tốc độ sự kiện trung bình trong cửa sổ gần nhất"""
+        ticks = list(self._ticks.get(name, ()))
+        if len(ticks) < 2 or ticks[-1] <= ticks[0]:
+            return 0.0
+        return (len(ticks) - 1) / (ticks[-1] - ticks[0])
+
+    def snapshot(self):
+        """Trả về thống kê p50/p95/p99 (ms) của từng công đoạn và tốc độ sự kiện"""
+        stages = {}
+        for name, series in list(self._timings.items()):
+            values = np.fromiter(list(series), dtype=np.float64)
+            if values.size == 0:
+                continue
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            stages[name] = {
+                'count': int(values.size),
+                'mean_ms': round(float(values.mean()), 3),
+                'p50_ms': round(float(p50), 3),
+                'p95_ms': round(float(p95), 3),
+                'p99_ms': round(float(p99), 3)
+            }
+        rates = {name: round(self.rate(name), 2) for name in list(self._ticks)}
+        return {'stages': stages, 'rates': rates}
+
+    def summary(self, stages=('detect', 'classify', 'display')):
+        """Chuỗi ngắn gọn để hiển thị fps/độ trễ trên giao diện"""
+        snapshot = self.snapshot()
+        parts = [f"{name} {value:.1f} fps" for name, value in sorted(snapshot['rates'].items())]
+        for name in stages:
+            stats = snapshot['stages'].get(name)
+            if stats is not None:
+                parts.append(f"{name} p95 {stats['p95_ms']:.1f} ms")
+        return " | ".join(parts)
+
+    def dump_json(self, file_path=PROFILING_DUMP_PATH):
+        """Ghi thống kê ra file JSON"""
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        return file_path
+
+
+# Profiler dùng chung cho toàn ứng dụng; bật bằng PROFILING_ENABLED hoặc biến môi trường EMOTION_PROFILE=1
+PROFILER = StageProfiler(enabled=PROFILING_ENABLED or os.environ.get('EMOTION_PROFILE') == '1')
+
+
+def _dump_on_exit():
+    if PROFILER.enabled and PROFILING_DUMP_PATH and PROFILER._timings:
+        PROFILER.dump_json(PROFILING_DUMP_PATH)
+
+
+atexit.register(_dump_on_exit)
@@ -0,0 +1,136 @@
+"""
+Dynamic micro-batching for concurrent inference requests.
+
+Callers submit single items and get a ``concurrent.futures.Future`` back.
+A worker thread waits for the first item, then keeps collecting until the
+batch is full or ``max_wait`` has passed since that first item, and runs
+the whole batch through one call. A bounded queue provides backpressure:
+once it is full ``submit`` raises ``BatcherOverloaded`` instead of letting
+latency grow without limit.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+
+class BatcherOverloaded(Exception):
+    """Raised when the pending queue is full."""
+
+
+class MicroBatcher:
+    """Coalesce single requests into batches with a max-wait deadline."""
+
+    def __init__(self, process_batch, max_batch_size=8, max_wait=0.01, max_queue=64, name="micro-batcher"):
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.name = name
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = None
+        # Số liệu cho /metrics
+        self.submitted = 0
+        self.rejected = 0
+        self.failed = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.max_observed_batch = 0
+        self.busy_seconds = 0.0
+
+    def start(self):
+        """Khởi động luồng gom batch"""
+        with self._cond:
+            self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Dừng luồng gom batch, các yêu cầu còn chờ nhận lỗi"""
+        with self._cond:
+            self._stopped = True
+            pending = list(self._pending)
+            self._pending.clear()
+            self._cond.notify_all()
+        for _, future in pending:
+            future.set_exception(RuntimeError("batcher stopped"))
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, item):
+        """Đưa một yêu cầu vào hàng đợi, trả về Future chứa kết quả"""
+        future = Future()
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("batcher stopped")
+            if len(self._pending) >= self.max_queue:
+                self.rejected += 1
+                raise BatcherOverloaded(f"{len(self._pending)} requests already waiting")
+            self._pending.append((item, future))
+            self.submitted += 1
+            self._cond.notify()
+        return future
+
+    @property
+    def queue_depth(self):
+        return len(self._pending)
+
+    def _next_batch(self):
+        with self._cond:
+            while not self._pending and not self._stopped:
+                self._cond.wait()
+            if self._stopped:
+                return []
+            # Chờ thêm yêu cầu tới khi đủ batch hoặc hết hạn tính từ yêu cầu đầu tiên
+            deadline = time.monotonic() + self.max_wait
+            while len(self._pending) < self.max_batch_size and not self._stopped:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            count = min(self.max_batch_size, len(self._pending))
+            return [self._pending.popleft() for _ in range(count)]
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                if self._stopped:
+                    return
+                continue
+            items = [item for item, _ in batch]
+            start = time.perf_counter()
+            try:
+                results = list(self.process_batch(items))
+                if len(results) != len(batch):
+                    # Không đủ kết quả thì không thể biết kết quả nào thuộc yêu cầu nào
+                    raise RuntimeError(f"process_batch returned {len(results)} results for {len(batch)} items")
+            except Exception as e:
+                self.failed += len(batch)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            finally:
+                self.busy_seconds += time.perf_counter() - start
+            self.batches += 1
+            self.batched_items += len(batch)
+            self.max_observed_batch = max(self.max_observed_batch, len(batch))
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def stats(self):
+        """Số liệu của bộ gom batch"""
+        return {
+            'queue_depth': self.queue_depth,
+            'submitted': self.submitted,
+            'rejected': self.rejected,
+            'failed': self.failed,
+            'batches': self.batches,
+            'mean_batch_size': round(self.batched_items / self.batches, 2) if self.batches else 0.0,
+            'max_batch_size': self.max_observed_batch,
+            'busy_seconds': round(self.busy_seconds, 3)
+        }
@@ -0,0 +1,126 @@
+"""
+Persistent cache of ``detect_emotions`` results for still images.
+
+Entries are keyed by the SHA-256 of the image file bytes together with
+``EmotionDetector.model_id`` (backend, engine and model versions), so a
+changed model never serves stale results. The cache is a single SQLite
+file shared by the GUI and the batch workers; once it holds more than
+``max_entries`` images the least recently used ones are evicted.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from src.config import RESULT_CACHE_ENABLED, RESULT_CACHE_PATH, RESULT_CACHE_MAX_ENTRIES
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def content_hash(data):
+    """Mã băm SHA-256 của nội dung file (bytes hoặc mảng uint8)"""
+    return hashlib.sha256(memoryview(data)).hexdigest()
+
+
+class ResultCache:
+    """Size-bounded LRU cache of face/emotion results stored in SQLite."""
+
+    def __init__(self, path=RESULT_CACHE_PATH, max_entries=RESULT_CACHE_MAX_ENTRIES, evict_every=64):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        # Autocommit; WAL cho phép nhiều tiến trình worker đọc/ghi cùng lúc
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "digest TEXT NOT NULL, model_id TEXT NOT NULL, faces TEXT NOT NULL, last_used REAL NOT NULL, "
+            "PRIMARY KEY (digest, model_id))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    def get(self, digest, model_id):
+        """Trả về kết quả đã lưu, None nếu chưa có"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT faces FROM results WHERE digest = ? AND model_id = ?", (digest, model_id)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE results SET last_used = ? WHERE digest = ? AND model_id = ?",
+                (time.time(), digest, model_id)
+            )
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, digest, model_id, faces):
+        """Lưu kết quả nhận diện của một ảnh"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (digest, model_id, faces, last_used) VALUES (?, ?, ?, ?)",
+                (digest, model_id, json.dumps(faces), time.time())
+            )
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict()
+
+    def get_or_compute(self, digest, model_id, compute):
+        """Lấy kết quả từ cache, nếu chưa có thì gọi compute() và lưu lại"""
+        faces = self.get(digest, model_id)
+        if faces is None:
+            faces = compute()
+            self.put(digest, model_id, faces)
+        return faces
+
+    def _evict(self):
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+
+    def evict(self):
+        """Xóa các ảnh dùng lâu nhất khi cache vượt quá giới hạn"""
+        with self._lock:
+            self._evict()
+
+    def clear(self):
+        """Xóa toàn bộ cache"""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        """Dọn dẹp và đóng kết nối"""
+        with self._lock:
+            self._evict()
+            self._conn.close()
+
+
+def get_result_cache():
+    """Cache dùng chung trong tiến trình, None nếu bị tắt hoặc không mở được file"""
+    global _shared_cache
+    if not RESULT_CACHE_ENABLED:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            try:
+                _shared_cache = ResultCache()
+            except (OSError, sqlite3.Error):
+                # Không ghi được thư mục cache thì vẫn chạy bình thường, chỉ không lưu kết quả
+                return None
+        return _shared_cache
@@ -0,0 +1,132 @@
+"""
+Offline video analysis that runs as fast as the CPU allows.
+
+Decoding happens on its own thread and feeds a bounded queue; the caller's
+thread pulls frames from it, batches them and runs emotion inference, and
+yields one timeline entry per analysed frame.
+"""
+
+import queue
+import threading
+import cv2
+from src.config import VIDEO_ANALYSIS_BATCH_SIZE, VIDEO_DECODE_QUEUE_SIZE
+from src.features.emotion_detector import EmotionDetector
+from src.utils.image_utils import rotate_frame
+
+_END_OF_STREAM = object()
+
+
+def open_video(file_path):
+    """Mở video, trả về (cap, rotation, fps); ném IOError nếu không đọc được"""
+    cap = cv2.VideoCapture(file_path)
+    if not cap.isOpened():
+        cap.release()
+        raise IOError(f"Cannot open video '{file_path}'")
+    rotation = cap.get(cv2.CAP_PROP_ORIENTATION_META)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+    return cap, rotation, fps
+
+
+class VideoDecoder:
+    """Decodes a video on a background thread into a bounded frame queue.
+
+    Items are ``(frame_index, timestamp_seconds, frame)`` tuples; only every
+    ``every``-th frame is decoded, the others are skipped with ``grab()``.
+    """
+
+    def __init__(self, file_path, every=1, queue_size=VIDEO_DECODE_QUEUE_SIZE):
+        self.cap, self.rotation, self.fps = open_video(file_path)
+        self.every = max(1, every)
+        self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._decode_loop, name="video-decode", daemon=True)
+
+    def start(self):
+        """Khởi động luồng giải mã"""
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Dừng luồng giải mã và giải phóng video"""
+        self._stop_event.set()
+        # Giải phóng chỗ trong hàng đợi để luồng giải mã không bị kẹt ở put()
+        while self._thread.is_alive():
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                pass
+            self._thread.join(0.05)
+        self.cap.release()
+
+    def __iter__(self):
+        while True:
+            item = self.frames.get()
+            if item is _END_OF_STREAM:
+                if self.error is not None:
+                    raise self.error
+                return
+            yield item
+
+    def _timestamp(self, frame_index):
+        if self.fps > 0:
+            return frame_index / self.fps
+        return self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+
+    def _put(self, item):
+        while not self._stop_event.is_set():
+            try:
+                self.frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decode_loop(self):
+        frame_index = 0
+        try:
+            while not self._stop_event.is_set():
+                if frame_index % self.every:
+                    # Bỏ qua frame không cần phân tích mà không chuyển đổi màu
+                    if not self.cap.grab():
+                        break
+                    frame_index += 1
+                    continue
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                frame = rotate_frame(frame, self.rotation)
+                if not self._put((frame_index, self._timestamp(frame_index), frame)):
+                    break
+                frame_index += 1
+        except Exception as e:
+            self.error = e
+        finally:
+            self._put(_END_OF_STREAM)
+
+
+def analyze_video(file_path, every=1, batch_size=VIDEO_ANALYSIS_BATCH_SIZE, detector=None):
+    """Phân tích video không cần giao diện, trả về dòng thời gian cảm xúc dạng stream
+
+    Mỗi phần tử: {'frame': index, 'timestamp': giây, 'faces': [{'box', 'emotions'}, ...]}
+    """
+    detector = detector or EmotionDetector()
+    decoder = VideoDecoder(file_path, every).start()
+    try:
+        batch = []
+        for item in decoder:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield from _analyze_batch(detector, batch)
+                batch = []
+        if batch:
+            yield from _analyze_batch(detector, batch)
+    finally:
+        decoder.stop()
+
+
+def _analyze_batch(detector, batch):
+    results = detector.detect_emotions_batch([frame for _, _, frame in batch])
+    for (frame_index, timestamp, _), faces in zip(batch, results):
+        yield {'frame': frame_index, 'timestamp': round(timestamp, 3), 'faces': faces}
@@ -0,0 +1,167 @@
+"""
+Annotated video export.
+
+Decoding, inference and encoding run as pipelined stages connected by
+bounded queues, so memory use stays constant however long the video is:
+
+    VideoDecoder thread -> inference (caller thread) -> encoder thread
+"""
+
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import cv2
+from src.config import VIDEO_ANALYSIS_BATCH_SIZE, VIDEO_DECODE_QUEUE_SIZE, VIDEO_EXPORT_CODEC
+from src.features.emotion_detector import EmotionDetector
+from src.features.video_analyzer import VideoDecoder
+
+_END_OF_STREAM = object()
+
+
+class VideoEncoder:
+    """Writes frames from a bounded queue to disk with ``cv2.VideoWriter``."""
+
+    def __init__(self, file_path, fps, codec=VIDEO_EXPORT_CODEC, queue_size=VIDEO_DECODE_QUEUE_SIZE):
+        self.file_path = file_path
+        self.fps = fps
+        self.codec = codec
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.frames_written = 0
+        self.error = None
+        self._writer = None
+        self._thread = threading.Thread(target=self._encode_loop, name="video-encode", daemon=True)
+
+    def start(self):
+        """Khởi động luồng mã hóa"""
+        self._thread.start()
+        return self
+
+    def put(self, frame):
+        """Đưa frame vào hàng đợi mã hóa (chặn khi hàng đợi đầy)"""
+        if self.error is not None:
+            raise self.error
+        self.frames.put(frame)
+
+    def close(self):
+        """Kết thúc stream và chờ ghi xong"""
+        self.frames.put(_END_OF_STREAM)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _open_writer(self, frame):
+        height, width = frame.shape[:2]
+        fourcc = cv2.VideoWriter_fourcc(*self.codec)
+        writer = cv2.VideoWriter(self.file_path, fourcc, self.fps, (width, height))
+        if not writer.isOpened():
+            raise IOError(f"Cannot open video writer for '{self.file_path}' (codec {self.codec})")
+        return writer
+
+    def _encode_loop(self):
+        try:
+            while True:
+                frame = self.frames.get()
+                if frame is _END_OF_STREAM:
+                    break
+                if self._writer is None:
+                    self._writer = self._open_writer(frame)
+                self._writer.write(frame)
+                self.frames_written += 1
+        except Exception as e:
+            self.error = e
+            # Tiếp tục rút hàng đợi để luồng suy luận không bị chặn ở put()
+            while self.frames.get() is not _END_OF_STREAM:
+                pass
+        finally:
+            if self._writer is not None:
+                self._writer.release()
+
+
+def mux_audio(video_path, audio_source_path, output_path):
+    """Ghép lại track âm thanh của video gốc vào video đã xuất (cần moviepy)"""
+    from moviepy.editor import VideoFileClip
+
+    source = VideoFileClip(audio_source_path)
+    try:
+        if source.audio is None:
+            shutil.copyfile(video_path, output_path)
+            return False
+        video = VideoFileClip(video_path)
+        try:
+            video = video.set_audio(source.audio)
+            video.write_videofile(output_path, codec='libx264', audio_codec='aac', logger=None)
+        finally:
+            video.close()
+        return True
+    finally:
+        source.close()
+
+
+def export_annotated_video(file_path, output_path, detector=None, analyze_every=1,
+                           batch_size=VIDEO_ANALYSIS_BATCH_SIZE, keep_audio=False,
+                           progress_callback=None, cancel_event=None):
+    """Xuất video đã vẽ kết quả nhận diện cảm xúc, trả về thống kê quá trình xuất
+
+    analyze_every > 1 chỉ suy luận mỗi k frame và dùng lại kết quả cho các frame giữa.
+    """
+    detector = detector or EmotionDetector()
+    analyze_every = max(1, analyze_every)
+    decoder = VideoDecoder(file_path).start()
+
+    # Khi cần ghép âm thanh, ghi video hình ảnh ra file tạm trước
+    temp_dir = tempfile.mkdtemp(prefix="emotion-export-") if keep_audio else None
+    video_path = os.path.join(temp_dir, "video.mp4") if keep_audio else output_path
+    encoder = VideoEncoder(video_path, decoder.fps or 30.0).start()
+
+    last_faces = []
+    batch = []
+    frames_done = 0
+    cancelled = False
+
+    def flush(batch):
+        nonlocal last_faces, frames_done
+        to_analyze = [frame for idx, _, frame in batch if idx % analyze_every == 0]
+        results = iter(detector.detect_emotions_batch(to_analyze)) if to_analyze else iter(())
+        for frame_index, _, frame in batch:
+            if frame_index % analyze_every == 0:
+                last_faces = next(results)
+            encoder.put(detector.draw_results(frame, last_faces))
+            frames_done += 1
+        if progress_callback is not None:
+            progress_callback(frames_done, decoder.frame_count)
+
+    try:
+        for item in decoder:
+            if cancel_event is not None and cancel_event.is_set():
+                cancelled = True
+                break
+            batch.append(item)
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+        if batch and not cancelled:
+            flush(batch)
+    finally:
+        decoder.stop()
+        encoder.close()
+
+    try:
+        if encoder.frames_written == 0 and not cancelled:
+            # Writer chỉ được mở ở frame đầu tiên: không có frame thì không có file video để ghép âm thanh
+            raise IOError(f"No frames decoded from '{file_path}'")
+        audio_muxed = False
+        if keep_audio and not cancelled:
+            audio_muxed = mux_audio(video_path, file_path, output_path)
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return {
+        'frames': encoder.frames_written,
+        'total_frames': decoder.frame_count,
+        'fps': decoder.fps,
+        'audio': audio_muxed,
+        'cancelled': cancelled
+    }
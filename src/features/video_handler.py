@@ -1,12 +1,21 @@
 import cv2
 from tkinter import messagebox
+from src.config import INFERENCE_SHORT_SIDE
 from src.features.emotion_detector import EmotionDetector
-from src.utils.image_utils import resize_image, convert_cv2_to_tk
+from src.features.face_crop_cache import create_face_crop_cache
+from src.features.face_tracker import FaceTracker
+from src.features.playback_scheduler import PlaybackClock
+from src.features.profiler import PROFILER
+from src.utils.image_utils import resize_image, resized_shape, rotate_frame, FrameBufferRing
 
 class VideoHandler:
     def __init__(self):
         self.cap = None
-        self.detector = EmotionDetector()
+        self.detector = EmotionDetector(inference_short_side=INFERENCE_SHORT_SIDE, crop_cache=create_face_crop_cache())
+        self.face_tracker = FaceTracker(self.detector)
+        self.clock = None
+        self.display_buffers = FrameBufferRing()
+        self.last_results = []
         self.update_task = None
         self.detect_closed = False
 
@@ -22,45 +31,69 @@ class VideoHandler:
             messagebox.showerror("Lỗi đọc video", error_msg)
             return False
 
+        self.face_tracker.reset()
+
         # Lấy thông tin xoay của frame
         rotation = self.cap.get(cv2.CAP_PROP_ORIENTATION_META)
 
+        # Đồng hồ phát theo FPS của file
+        self.clock = PlaybackClock(self.cap.get(cv2.CAP_PROP_FPS))
+        self.last_results = []
+
         def update_frame():
             if self.detect_closed:
                 self.detect_closed = False
                 return
 
-            ret, frame = self.cap.read()
+            # Bị trễ: bỏ qua các frame đã quá hạn (grab không chuyển đổi màu)
+            for _ in range(self.clock.frames_to_drop()):
+                if not self.cap.grab():
+                    self.stop_video()
+                    return
+                self.clock.drop()
+
+            with PROFILER.stage('capture'):
+                ret, frame = self.cap.read()
             if not ret:
                 self.stop_video()
                 return
+            self.clock.present()
 
             # Xử lý xoay frame nếu cần
-            if rotation == 90:
-                frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-            elif rotation == 180:
-                frame = cv2.rotate(frame, cv2.ROTATE_180)
-            elif rotation == 270:
-                frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
+            with PROFILER.stage('rotate'):
+                frame = rotate_frame(frame, rotation)
 
-            # Resize frame
-            frame = resize_image(frame, frm_mid.winfo_height())
-            
-            # Process frame
-            frame = self.detector.process_frame(frame)
-            
-            # Convert to Tkinter format
-            img_tk = convert_cv2_to_tk(frame)
+            # Process frame (nhận diện mỗi N frame, theo dấu ở các frame giữa)
+            if self.clock.should_infer():
+                with PROFILER.stage('inference'):
+                    self.last_results = self.face_tracker.update(frame)
+                PROFILER.tick('inference')
+
+            # Resize frame, box được quy đổi từ frame gốc sang frame hiển thị
+            display_height = frm_mid.winfo_height()
+            scale = display_height / frame.shape[0]
+            with PROFILER.stage('resize'):
+                buffer = self.display_buffers.get(resized_shape(frame, display_height))
+                frame = resize_image(frame, display_height, dst=buffer)
+            with PROFILER.stage('draw'):
+                frame = self.detector.draw_results(frame, self.last_results, scale)
             
-            # Update display
-            update_callback(img_tk)
+            # Update display (giao diện tự chép frame vào ảnh Tk có sẵn)
+            with PROFILER.stage('display'):
+                update_callback(frame)
+            PROFILER.tick('display')
             
-            # Schedule next update
-            self.update_task = frm_mid.after(15, update_frame)
+            # Schedule next update at the next frame's presentation time
+            self.update_task = frm_mid.after(self.clock.delay_ms(), update_frame)
 
         update_frame()
         return True
 
+    @property
+    def playback_stats(self):
+        """Bộ đếm frame bị bỏ, suy luận bị bỏ qua và độ trễ của lần phát hiện tại"""
+        return self.clock.stats() if self.clock is not None else {}
+
     def stop_video(self):
         """Dừng video"""
         if self.cap is not None:
@@ -0,0 +1,67 @@
+"""
+gRPC front end for the local inference service.
+
+Serves ``emotion.EmotionRecognition/Detect``: a unary call whose request
+is the encoded image (JPEG/PNG bytes) and whose response is the
+``detect_emotions`` JSON list encoded as UTF-8. The method is registered
+through a generic handler with raw bytes in and out, so no ``.proto``
+file has to be compiled on either side::
+
+    channel = grpc.insecure_channel('127.0.0.1:8766')
+    detect = channel.unary_unary('/emotion.EmotionRecognition/Detect')
+    faces = json.loads(detect(open('face.jpg', 'rb').read()))
+
+Requests go through the same ``InferenceService`` as the HTTP endpoints
+and therefore share its micro-batcher and in-flight limit.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+import grpc
+from werkzeug.exceptions import BadRequest
+
+from src.config import SERVICE_MAX_IMAGE_BYTES
+from src.server import decode_image_bytes
+
+SERVICE_NAME = 'emotion.EmotionRecognition'
+
+# Mã trạng thái HTTP của InferenceService.run_detection -> mã gRPC
+_STATUS_CODES = {
+    503: grpc.StatusCode.UNAVAILABLE,
+    504: grpc.StatusCode.DEADLINE_EXCEEDED
+}
+
+
+def create_detect_handler(service):
+    """Tạo generic handler cho phương thức Detect dùng chung InferenceService với HTTP"""
+
+    def detect(request, context):
+        service.requests += 1
+        if not request:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "empty request")
+        try:
+            status, payload = service.run_detection(lambda: decode_image_bytes(request))
+        except BadRequest as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.description)
+        except Exception as e:
+            service.errors += 1
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+        if status != 200:
+            context.abort(_STATUS_CODES.get(status, grpc.StatusCode.INTERNAL), payload['error'])
+        return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+    # Không truyền serializer: request và response là bytes nguyên bản
+    return grpc.method_handlers_generic_handler(SERVICE_NAME, {
+        'Detect': grpc.unary_unary_rpc_method_handler(detect)
+    })
+
+
+def create_grpc_server(service, host, port):
+    """Tạo máy chủ gRPC (chưa khởi động) phục vụ InferenceService trên host:port"""
+    server = grpc.server(
+        ThreadPoolExecutor(max_workers=service.max_inflight, thread_name_prefix="grpc"),
+        options=[('grpc.max_receive_message_length', SERVICE_MAX_IMAGE_BYTES)]
+    )
+    server.add_generic_rpc_handlers((create_detect_handler(service),))
+    server.add_insecure_port(f"{host}:{port}")
+    return server
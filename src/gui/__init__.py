@@ -1,15 +1,27 @@
 """
 GUI components for the Emotion Recognition application.
+
+Only the main window is imported eagerly; the feature windows (and the
+heavy feature modules behind them) load when they are first opened.
 """
 
+from ..lazy_loader import make_lazy_getattr
 from .main_window import MainWindow
-from .camera_window import CameraWindow
-from .video_window import VideoWindow
-from .image_window import ImageWindow
+
+_LAZY_ATTRS = {
+    'CameraWindow': '.camera_window',
+    'MultiCameraWindow': '.multi_camera_window',
+    'VideoWindow': '.video_window',
+    'ImageWindow': '.image_window'
+}
 
 __all__ = [
     'MainWindow',
     'CameraWindow',
+    'MultiCameraWindow',
     'VideoWindow',
     'ImageWindow'
-] 
\ No newline at end of file
+]
+
+
+__getattr__, __dir__ = make_lazy_getattr(__name__, _LAZY_ATTRS)
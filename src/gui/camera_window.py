@@ -5,7 +5,7 @@ Camera window for the Emotion Recognition application.
 import tkinter as tk
 import os
 import sys
-from ..utils import check_icon, on_enter, on_leave, print_error_input
+from ..utils import check_icon, on_enter, on_leave, print_error_input, FrameDisplay, attach_profiler_overlay
 from ..config import COLORS, FONTS, IMG_DIR
 from ..features import CameraHandler
 
@@ -72,12 +72,18 @@ class CameraWindow(tk.Toplevel):
         self.btn_back.bind("<Enter>", lambda e: on_enter(self.btn_back, "SystemButtonFace", "#F4A460"))
         self.btn_back.bind("<Leave>", lambda e: on_leave(self.btn_back, "SystemButtonFace", "#F4A460"))
         
+        # Profiling overlay: fps and per-stage latency
+        self.stats_lbl = attach_profiler_overlay(self, self.frm_top)
+        
         # Middle frame for camera display
         self.frm_mid = tk.Frame(master=self)
         self.frm_mid.grid(row=1, column=0, sticky="nsew", pady=(0, 20), padx=20)
         self.frm_mid.rowconfigure(0, weight=1)
         self.frm_mid.columnconfigure(0, weight=1)
         
+        # Persistent display surface reused for every frame
+        self.display = FrameDisplay(self.frm_mid)
+        
         # Display default camera image
         camera_img = check_icon(os.path.join(IMG_DIR, "frm_camera.png"))
         self.camera_lbl = tk.Label(master=self.frm_mid, image=camera_img)
@@ -116,23 +122,20 @@ class CameraWindow(tk.Toplevel):
         
     def _open_camera(self):
         """Open camera and start processing."""
-        self.camera_handler.start_camera(self.frm_mid, self._update_camera_display)
+        self.camera_handler.start_camera(self.frm_mid, self._update_camera_display, self._reset_display)
         
     def _close_camera(self):
         """Close camera and reset display."""
         self.camera_handler.stop_camera()
         self._reset_display()
         
-    def _update_camera_display(self, img_tk):
+    def _update_camera_display(self, frame):
         """Update camera display with new frame."""
-        for widget in self.frm_mid.winfo_children():
-            widget.destroy()
-        camera_label = tk.Label(master=self.frm_mid, image=img_tk)
-        camera_label.image = img_tk
-        camera_label.pack(fill="both", expand=True)
+        self.display.show(frame)
         
     def _reset_display(self):
         """Reset display to default camera image."""
+        self.display.clear()
         for widget in self.frm_mid.winfo_children():
             widget.destroy()
         camera_img = check_icon(os.path.join(IMG_DIR, "frm_camera.png"))
@@ -7,7 +7,7 @@ from tkinter import filedialog, messagebox
 import os
 import sys
 from PIL import Image, ImageTk
-from ..utils import check_icon, on_enter, on_leave, print_error_input, add_box_shadow
+from ..utils import check_icon, on_enter, on_leave, print_error_input, add_box_shadow, ScaledImageRenderer
 from ..config import COLORS, FONTS, IMG_DIR, ALLOWED_IMAGE_EXTENSIONS
 from ..features import ImageHandler
 
@@ -22,6 +22,8 @@ class ImageWindow(tk.Toplevel):
         
         # Initialize image handler
         self.image_handler = ImageHandler()
+        # Renderers of the original/processed canvases
+        self._renderers = []
         
         # Configure window
         self.title("Image")
@@ -142,6 +144,7 @@ class ImageWindow(tk.Toplevel):
     def _update_image_display(self, original_img, processed_img):
         """Update image display with original and processed images."""
         try:
+            self._cancel_renderers()
             for widget in self.frm_mid.winfo_children():
                 widget.destroy()
                 
@@ -178,62 +181,35 @@ class ImageWindow(tk.Toplevel):
             processed_canvas = tk.Canvas(master=self.frm_mid, width=target_width, height=target_height)
             processed_canvas.grid(row=1, column=1, sticky="nsew")
             
-            # Function to resize and display image
-            def resize_and_display(canvas, img, target_w, target_h):
-                try:
-                    # Convert PhotoImage to PIL Image
-                    pil_img = ImageTk.getimage(img)
-                    
-                    # Calculate aspect ratio
-                    img_ratio = pil_img.width / pil_img.height
-                    target_ratio = target_w / target_h
-                    
-                    # Calculate new dimensions while maintaining aspect ratio
-                    if img_ratio > target_ratio:
-                        # Image is wider than target
-                        new_width = target_w
-                        new_height = int(target_w / img_ratio)
-                    else:
-                        # Image is taller than target
-                        new_height = target_h
-                        new_width = int(target_h * img_ratio)
-                    
-                    # Resize image
-                    resized = pil_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    # Convert back to PhotoImage
-                    photo = ImageTk.PhotoImage(resized)
-                    
-                    # Store reference
-                    canvas.image = photo
-                    
-                    # Calculate position to center image
-                    x = (target_w - new_width) // 2
-                    y = (target_h - new_height) // 2
-                    
-                    # Display image
-                    canvas.create_image(x, y, image=photo, anchor="nw")
-                    
-                    # Bind resize event
-                    def on_resize(event):
-                        resize_and_display(canvas, img, event.width, event.height)
-                    
-                    canvas.bind("<Configure>", on_resize)
-                except Exception as e:
-                    error_msg = f"Lỗi: Không thể hiển thị ảnh\n\nChi tiết lỗi:\n{str(e)}\n\nVui lòng thử lại."
-                    messagebox.showerror("Lỗi hiển thị ảnh", error_msg)
-                    self._reset_display()
-            
-            # Display both images
-            resize_and_display(original_canvas, original_img, target_width, target_height)
-            resize_and_display(processed_canvas, processed_img, target_width, target_height)
+            # Display both images; later window resizes are debounced and cached per size
+            for canvas, img in ((original_canvas, original_img), (processed_canvas, processed_img)):
+                if not canvas.winfo_exists():
+                    # The first canvas failed and the display was reset
+                    break
+                renderer = ScaledImageRenderer(canvas, ImageTk.getimage(img), on_error=self._on_render_error)
+                renderer.render(target_width, target_height)
+                canvas.bind("<Configure>", renderer.on_configure)
+                self._renderers.append(renderer)
         except Exception as e:
             error_msg = f"Lỗi: Không thể cập nhật hiển thị\n\nChi tiết lỗi:\n{str(e)}\n\nVui lòng thử lại."
             messagebox.showerror("Lỗi cập nhật hiển thị", error_msg)
             self._reset_display()
         
+    def _on_render_error(self, e):
+        """Report a failed (re)draw of an image canvas and reset the display."""
+        error_msg = f"Lỗi: Không thể hiển thị ảnh\n\nChi tiết lỗi:\n{str(e)}\n\nVui lòng thử lại."
+        messagebox.showerror("Lỗi hiển thị ảnh", error_msg)
+        self._reset_display()
+        
+    def _cancel_renderers(self):
+        """Cancel pending debounced redraws of the image canvases."""
+        for renderer in self._renderers:
+            renderer.cancel()
+        self._renderers = []
+
     def _reset_display(self):
         """Reset display to default image."""
+        self._cancel_renderers()
         for widget in self.frm_mid.winfo_children():
             widget.destroy()
         img_img = check_icon(os.path.join(IMG_DIR, "frm_img.png"))
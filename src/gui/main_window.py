@@ -5,12 +5,13 @@ Main window for the Emotion Recognition application.
 import tkinter as tk
 from tkinter import ttk
 import os
-from PIL import Image, ImageTk
-from ..utils import check_icon, on_enter, on_leave, center_window, set_icon_window
+import logging
+import threading
+from PIL import Image
+from ..utils import check_icon, on_enter, on_leave, center_window, set_icon_window, ScaledImageRenderer
 from ..config import COLORS, FONTS, IMG_DIR, WINDOW_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT
-from .camera_window import CameraWindow
-from .video_window import VideoWindow
-from .image_window import ImageWindow
+
+logger = logging.getLogger(__name__)
 
 
 class MainWindow(tk.Tk):
@@ -31,6 +32,26 @@ class MainWindow(tk.Tk):
         self._create_left_menu()
         self._create_content_frame()
 
+        # Import feature modules and warm up the models once the menu has been drawn
+        self.after(100, self._warm_up_features)
+
+    def _warm_up_features(self):
+        """Import the heavy feature modules and load the models in the background."""
+        def warm_up():
+            try:
+                from ..features import preload_models
+                preload_models(background=False)
+            except Exception:
+                # Cửa sổ chức năng vẫn báo lỗi khi được mở, nhưng ghi lại ngay để lỗi import không bị ẩn
+                logger.exception("Feature warm-up failed")
+
+        threading.Thread(target=warm_up, name="feature-warmup", daemon=True).start()
+
+    def _open_window(self, name):
+        """Import a feature window on first use and open it."""
+        from .. import gui
+        getattr(gui, name)(self)
+
     def _create_left_menu(self):
         """Create the left menu frame."""
         self.left_frm = tk.Frame(master=self, relief=tk.RAISED, bd=2, bg=COLORS['LIGHT_GREY'])
@@ -67,7 +88,7 @@ class MainWindow(tk.Tk):
             bg=COLORS['PINK'],
             fg=COLORS['BLACK'],
             font=FONTS['button'],
-            command=lambda: ImageWindow(self),
+            command=lambda: self._open_window('ImageWindow'),
             cursor="hand2"
         )
         btn_img.bind("<Enter>", lambda e: on_enter(btn_img, COLORS['PINK'], COLORS['RED']))
@@ -83,7 +104,7 @@ class MainWindow(tk.Tk):
             bg=COLORS['LIGHT_YELLOW'],
             fg=COLORS['BLACK'],
             font=FONTS['button'],
-            command=lambda: VideoWindow(self),
+            command=lambda: self._open_window('VideoWindow'),
             cursor="hand2"
         )
         btn_vid.bind("<Enter>", lambda e: on_enter(btn_vid, COLORS['LIGHT_YELLOW'], COLORS['YELLOW']))
@@ -99,16 +120,33 @@ class MainWindow(tk.Tk):
             bg=COLORS['LIGHT_BLUE'],
             fg=COLORS['BLACK'],
             font=FONTS['button'],
-            command=lambda: CameraWindow(self),
+            command=lambda: self._open_window('CameraWindow'),
             cursor="hand2"
         )
         btn_cam.bind("<Enter>", lambda e: on_enter(btn_cam, COLORS['LIGHT_BLUE'], COLORS['BLUE']))
         btn_cam.bind("<Leave>", lambda e: on_leave(btn_cam, COLORS['LIGHT_BLUE'], COLORS['BLUE']))
 
+        # Multi-camera button
+        btn_multi = tk.Button(
+            master=btn_frm,
+            image=cam_icon,
+            compound=tk.LEFT,
+            text="Multi camera",
+            padx=10,
+            bg=COLORS['LIGHT_BLUE'],
+            fg=COLORS['BLACK'],
+            font=FONTS['button'],
+            command=lambda: self._open_window('MultiCameraWindow'),
+            cursor="hand2"
+        )
+        btn_multi.bind("<Enter>", lambda e: on_enter(btn_multi, COLORS['LIGHT_BLUE'], COLORS['BLUE']))
+        btn_multi.bind("<Leave>", lambda e: on_leave(btn_multi, COLORS['LIGHT_BLUE'], COLORS['BLUE']))
+
         # Add buttons to frame
         btn_img.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         btn_vid.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
         btn_cam.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
+        btn_multi.grid(row=3, column=0, sticky="ew", padx=10, pady=10)
 
         # Add to layout
         lbl_menu.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
@@ -129,16 +167,11 @@ class MainWindow(tk.Tk):
         canvas = tk.Canvas(master=self.content_frm, bg='white')
         canvas.grid(row=0, column=0, sticky="nsew")
 
-        # Load image
+        # Load image (scaled to the canvas by a debounced, cached renderer)
         bg_img_path = os.path.join(IMG_DIR, "bg3.png")
         self.original_img = Image.open(bg_img_path)
         self.original_width, self.original_height = self.original_img.size
-
-        # Initial image
-        resized_img = self.original_img.copy()
-        photo = ImageTk.PhotoImage(resized_img)
-        canvas.bg_image = photo
-        image_id = canvas.create_image(0, 0, anchor='center', image=photo)
+        self.bg_renderer = ScaledImageRenderer(canvas, self.original_img)
 
         # Add text
         text1_id = canvas.create_text(0, 0, text="Emotion", font=FONTS['title'], fill=COLORS['WHITE'], tags="text1")
@@ -153,15 +186,7 @@ class MainWindow(tk.Tk):
             ratio_h = canvas_height / self.original_height
             scale = min(ratio_w, ratio_h)
 
-            new_width = int(self.original_width * scale)
-            new_height = int(self.original_height * scale)
-
-            resized = self.original_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(resized)
-            canvas.bg_image = photo
-            canvas.itemconfig(image_id, image=photo)
-
-            canvas.coords(image_id, canvas_width // 2, canvas_height // 2)
+            self.bg_renderer.schedule(canvas_width, canvas_height)
 
             font_size = max(int(FONTS['title'][1] * scale), 10)
             canvas.itemconfig("text1", font=(FONTS['title'][0], font_size))
@@ -0,0 +1,204 @@
+"""
+Multi-camera window for the Emotion Recognition application.
+"""
+
+import tkinter as tk
+import math
+import os
+import sys
+from ..utils import check_icon, on_enter, on_leave, FrameDisplay, attach_profiler_overlay
+from ..config import (
+    COLORS,
+    FONTS,
+    IMG_DIR,
+    MULTI_CAMERA_SOURCES,
+    MULTI_CAMERA_TILE_COLUMNS
+)
+from ..features import MultiCameraHandler
+from ..features.multi_camera import parse_sources
+
+class MultiCameraWindow(tk.Toplevel):
+    """Window showing several camera feeds in a tiled grid."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        # Store parent window
+        self.parent = parent
+
+        # Initialize multi-camera handler
+        self.camera_handler = MultiCameraHandler()
+        self.tiles = []
+        self.displays = []
+
+        # Configure window
+        self.title("Multi camera")
+        self.configure(bg=COLORS['WHITE'])
+
+        # Save parent window info
+        self.window_width = parent.winfo_width()
+        self.window_height = parent.winfo_height()
+        self.window_x = parent.winfo_x()
+        self.window_y = parent.winfo_y()
+        self.is_maximized = parent.state() == "zoomed"
+
+        # Hide parent window
+        parent.withdraw()
+
+        # Set window geometry
+        if self.is_maximized:
+            self.state("zoomed")
+        else:
+            self.geometry(f"{self.window_width}x{self.window_height}+{self.window_x}+{self.window_y}")
+
+        # Configure grid
+        self.rowconfigure(1, weight=9)
+        self.rowconfigure(2, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        # Create frames
+        self._create_frames()
+
+        # Set window close protocol
+        self.protocol("WM_DELETE_WINDOW", self._close_window)
+
+    def _create_frames(self):
+        """Create all frames for the multi-camera window."""
+        # Top frame with back button
+        self.frm_top = tk.Frame(master=self, bg=COLORS['WHITE'])
+        self.frm_top.grid(row=0, column=0, sticky="nsew")
+
+        # Back button
+        back_img = check_icon(os.path.join(IMG_DIR, "back-button.png"))
+        self.btn_back = tk.Button(
+            master=self.frm_top,
+            image=back_img,
+            command=self._back_to_main,
+            borderwidth=0,
+            highlightthickness=0,
+            cursor="hand2"
+        )
+        self.btn_back.grid(row=0, column=0, padx=15, pady=15)
+        self.btn_back.bind("<Enter>", lambda e: on_enter(self.btn_back, "SystemButtonFace", "#F4A460"))
+        self.btn_back.bind("<Leave>", lambda e: on_leave(self.btn_back, "SystemButtonFace", "#F4A460"))
+
+        # Profiling overlay: fps and per-stage latency
+        self.stats_lbl = attach_profiler_overlay(self, self.frm_top)
+
+        # Middle frame for the camera grid
+        self.frm_mid = tk.Frame(master=self)
+        self.frm_mid.grid(row=1, column=0, sticky="nsew", pady=(0, 20), padx=20)
+        self._show_placeholder()
+
+        # Bottom frame with the source list and control buttons
+        self.frm_bottom = tk.Frame(master=self, bg=COLORS['WHITE'])
+        self.frm_bottom.grid(row=2, column=0, sticky="nsew", padx=20, pady=(0, 20))
+        self.frm_bottom.columnconfigure(0, weight=1)
+        self.frm_bottom.columnconfigure(1, weight=5)
+        self.frm_bottom.columnconfigure(2, weight=1)
+
+        # Control buttons
+        self.btn_open = tk.Button(
+            master=self.frm_bottom,
+            text="Open cameras",
+            font=FONTS['button'],
+            cursor="hand2",
+            command=self._open_cameras
+        )
+        self.btn_open.grid(row=0, column=0, sticky="nsew")
+        self.btn_open.bind("<Enter>", lambda e: on_enter(self.btn_open, "SystemButtonFace", "#F4A460"))
+        self.btn_open.bind("<Leave>", lambda e: on_leave(self.btn_open, "SystemButtonFace", "#F4A460"))
+
+        # Sources: camera indices, video files or stream URLs separated by commas
+        self.sources_var = tk.StringVar(value=MULTI_CAMERA_SOURCES)
+        self.ent_sources = tk.Entry(master=self.frm_bottom, textvariable=self.sources_var, font=FONTS['menu'])
+        self.ent_sources.grid(row=0, column=1, sticky="ew", padx=20)
+
+        self.btn_close = tk.Button(
+            master=self.frm_bottom,
+            text="Close cameras",
+            font=FONTS['button'],
+            cursor="hand2",
+            command=self._close_cameras
+        )
+        self.btn_close.grid(row=0, column=2, sticky="nsew")
+        self.btn_close.bind("<Enter>", lambda e: on_enter(self.btn_close, "SystemButtonFace", "#F4A460"))
+        self.btn_close.bind("<Leave>", lambda e: on_leave(self.btn_close, "SystemButtonFace", "#F4A460"))
+
+    def _show_placeholder(self):
+        """Show the default camera image in the middle frame."""
+        for widget in self.frm_mid.winfo_children():
+            widget.destroy()
+        for idx in range(len(self.tiles)):
+            self.frm_mid.rowconfigure(idx, weight=0, uniform="")
+            self.frm_mid.columnconfigure(idx, weight=0, uniform="")
+        self.frm_mid.rowconfigure(0, weight=1)
+        self.frm_mid.columnconfigure(0, weight=1)
+        self.tiles = []
+        self.displays = []
+        camera_img = check_icon(os.path.join(IMG_DIR, "frm_camera.png"))
+        self.camera_lbl = tk.Label(master=self.frm_mid, image=camera_img)
+        self.camera_lbl.grid(row=0, column=0, sticky="nsew")
+
+    def _create_tiles(self, count):
+        """Create one display tile per source in a grid."""
+        for widget in self.frm_mid.winfo_children():
+            widget.destroy()
+        columns = min(count, MULTI_CAMERA_TILE_COLUMNS)
+        rows = math.ceil(count / columns)
+        for row in range(rows):
+            self.frm_mid.rowconfigure(row, weight=1, uniform="tile")
+        for column in range(columns):
+            self.frm_mid.columnconfigure(column, weight=1, uniform="tile")
+
+        self.tiles = []
+        for idx in range(count):
+            tile = tk.Frame(master=self.frm_mid, bg=COLORS['BLACK'])
+            tile.grid(row=idx // columns, column=idx % columns, sticky="nsew", padx=2, pady=2)
+            tile.pack_propagate(False)
+            self.tiles.append(tile)
+        self.displays = [FrameDisplay(tile) for tile in self.tiles]
+        self.update_idletasks()
+
+    def _open_cameras(self):
+        """Open every source and start processing."""
+        sources = parse_sources(self.sources_var.get())
+        if not sources:
+            return
+        self.camera_handler.stop_cameras()
+        self._create_tiles(len(sources))
+        if not self.camera_handler.start_cameras(sources, self.tiles, self._update_camera_display, self._close_cameras):
+            self._show_placeholder()
+
+    def _close_cameras(self):
+        """Close every source and reset the display."""
+        self.camera_handler.stop_cameras()
+        for display in self.displays:
+            display.clear()
+        self._show_placeholder()
+
+    def _update_camera_display(self, source_id, frame):
+        """Update the tile of one source with a new frame."""
+        if source_id < len(self.displays):
+            self.displays[source_id].show(frame)
+
+    def _back_to_main(self):
+        """Return to main window."""
+        self.update_idletasks()
+        if self.state() == "zoomed":
+            self.parent.state("zoomed")
+        else:
+            new_width = self.winfo_width()
+            new_height = self.winfo_height()
+            new_x = self.winfo_x()
+            new_y = self.winfo_y()
+            self.parent.after(0, lambda: self.parent.geometry(f"{new_width}x{new_height}+{new_x}+{new_y}"))
+
+        self._close_cameras()
+        self.destroy()
+        self.parent.deiconify()
+
+    def _close_window(self):
+        """Handle window close event."""
+        self._close_cameras()
+        sys.exit()
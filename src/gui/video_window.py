@@ -3,12 +3,18 @@ Video window for the Emotion Recognition application.
 """
 
 import tkinter as tk
-from tkinter import filedialog
+import threading
+from tkinter import filedialog, messagebox
 import os
 import sys
-from ..utils import check_icon, on_enter, on_leave, print_error_input
-from ..config import COLORS, FONTS, IMG_DIR, ALLOWED_VIDEO_EXTENSIONS
-from ..features import VideoHandler
+from ..utils import check_icon, on_enter, on_leave, print_error_input, FrameDisplay, attach_profiler_overlay
+from ..config import (
+    COLORS,
+    FONTS,
+    IMG_DIR,
+    ALLOWED_VIDEO_EXTENSIONS
+)
+from ..features import VideoHandler, export_annotated_video
 
 class VideoWindow(tk.Toplevel):
     """Video window class for processing video files."""
@@ -21,6 +27,10 @@ class VideoWindow(tk.Toplevel):
         
         # Initialize video handler
         self.video_handler = VideoHandler()
+        self.video_path = None
+        self.export_thread = None
+        self.export_progress = (0, 0)
+        self.export_result = None
         
         # Configure window
         self.title("Video")
@@ -73,12 +83,18 @@ class VideoWindow(tk.Toplevel):
         self.btn_back.bind("<Enter>", lambda e: on_enter(self.btn_back, "SystemButtonFace", "#F4A460"))
         self.btn_back.bind("<Leave>", lambda e: on_leave(self.btn_back, "SystemButtonFace", "#F4A460"))
         
+        # Profiling overlay: fps and per-stage latency
+        self.stats_lbl = attach_profiler_overlay(self, self.frm_top)
+        
         # Middle frame for video display
         self.frm_mid = tk.Frame(master=self)
         self.frm_mid.grid(row=1, column=0, sticky="nsew", pady=(0, 20), padx=20)
         self.frm_mid.rowconfigure(0, weight=1)
         self.frm_mid.columnconfigure(0, weight=1)
         
+        # Persistent display surface reused for every frame
+        self.display = FrameDisplay(self.frm_mid)
+        
         # Display default video image
         video_img = check_icon(os.path.join(IMG_DIR, "film.png"))
         self.video_lbl = tk.Label(master=self.frm_mid, image=video_img)
@@ -104,6 +120,17 @@ class VideoWindow(tk.Toplevel):
         self.btn_add.bind("<Enter>", lambda e: on_enter(self.btn_add, "SystemButtonFace", "#F4A460"))
         self.btn_add.bind("<Leave>", lambda e: on_leave(self.btn_add, "SystemButtonFace", "#F4A460"))
         
+        self.btn_export = tk.Button(
+            master=self.frm_bottom,
+            text="Export video",
+            font=FONTS['button'],
+            cursor="hand2",
+            command=self._export_video
+        )
+        self.btn_export.grid(row=0, column=2, sticky="ns")
+        self.btn_export.bind("<Enter>", lambda e: on_enter(self.btn_export, "SystemButtonFace", "#F4A460"))
+        self.btn_export.bind("<Leave>", lambda e: on_leave(self.btn_export, "SystemButtonFace", "#F4A460"))
+        
         self.btn_delete = tk.Button(
             master=self.frm_bottom,
             text="Delete video",
@@ -124,23 +151,70 @@ class VideoWindow(tk.Toplevel):
         if not file_path:
             return
             
-        self.video_handler.start_video(file_path, self.frm_mid, self._update_video_display)
+        if self.video_handler.start_video(file_path, self.frm_mid, self._update_video_display):
+            self.video_path = file_path
         
     def _delete_video(self):
         """Stop video playback and reset display."""
         self.video_handler.stop_video()
+        self.video_path = None
         self._reset_display()
         
-    def _update_video_display(self, img_tk):
+    def _export_video(self):
+        """Export the current video with emotion annotations in the background."""
+        if self.export_thread is not None and self.export_thread.is_alive():
+            return
+        if not self.video_path:
+            messagebox.showwarning("Xuất video", "Vui lòng chọn video trước khi xuất.")
+            return
+        output_path = filedialog.asksaveasfilename(
+            defaultextension=".mp4",
+            filetypes=[("MP4 video", "*.mp4")]
+        )
+        if not output_path:
+            return
+            
+        source_path = self.video_path
+        self.export_progress = (0, 0)
+        self.export_result = None
+        
+        def export():
+            def report(done, total):
+                self.export_progress = (done, total)
+            try:
+                self.export_result = export_annotated_video(source_path, output_path, progress_callback=report)
+            except Exception as e:
+                self.export_result = e
+                
+        self.export_thread = threading.Thread(target=export, name="video-export", daemon=True)
+        self.export_thread.start()
+        self._poll_export(output_path)
+        
+    def _poll_export(self, output_path):
+        """Update export progress from the Tk main loop."""
+        if not self.winfo_exists():
+            return
+        if self.export_thread.is_alive():
+            done, total = self.export_progress
+            percent = f" {done * 100 // total}%" if total else ""
+            self.btn_export.config(text=f"Exporting{percent}")
+            self.after(200, self._poll_export, output_path)
+            return
+            
+        self.btn_export.config(text="Export video")
+        if isinstance(self.export_result, Exception):
+            error_msg = f"Lỗi: Không thể xuất video\n\nChi tiết lỗi:\n{str(self.export_result)}\n\nVui lòng thử lại."
+            messagebox.showerror("Lỗi xuất video", error_msg)
+        else:
+            messagebox.showinfo("Xuất video", f"Đã xuất video:\n{output_path}")
+        
+    def _update_video_display(self, frame):
         """Update video display with new frame."""
-        for widget in self.frm_mid.winfo_children():
-            widget.destroy()
-        video_label = tk.Label(master=self.frm_mid, image=img_tk)
-        video_label.image = img_tk
-        video_label.pack(fill="both", expand=True)
+        self.display.show(frame)
         
     def _reset_display(self):
         """Reset display to default video image."""
+        self.display.clear()
         for widget in self.frm_mid.winfo_children():
             widget.destroy()
         video_img = check_icon(os.path.join(IMG_DIR, "film.png"))
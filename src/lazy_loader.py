@@ -0,0 +1,28 @@
+"""
+PEP 562 lazy attribute loading shared by the ``src`` subpackages.
+
+Each package lists the public names that live in heavy submodules; the
+submodule is imported on first attribute access and the value is cached
+in the package namespace, so later lookups skip ``__getattr__``.
+"""
+
+import importlib
+import sys
+
+
+def make_lazy_getattr(package, mapping):
+    """Tạo (__getattr__, __dir__) cho package: mapping là {tên: module con tương đối}"""
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name):
+        module_name = mapping.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(mapping))
+
+    return __getattr__, __dir__
@@ -0,0 +1,228 @@
+"""
+Local HTTP inference service for headless emotion recognition.
+
+Endpoints:
+    POST /detect   image bytes (JPEG/PNG, or raw uint8 pixels with
+                   ``Content-Type: application/octet-stream`` plus
+                   ``?width=&height=[&channels=3]``); returns the
+                   ``detect_emotions`` JSON list
+    GET  /ready    200 once the models are loaded, 503 before
+    GET  /metrics  batching, backpressure and per-stage latency counters
+
+Concurrent requests are coalesced into micro-batches that share one
+detector/classifier call. Requests beyond the in-flight limit or the
+batch queue capacity are rejected with 503 and ``Retry-After``.
+``--grpc-port`` additionally serves the same detector over gRPC (see
+``src.grpc_server``).
+
+Usage:
+    python -m src.cli serve [--host 127.0.0.1] [--port 8765] [--grpc-port 8766]
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import cv2
+import numpy as np
+from werkzeug.exceptions import HTTPException, BadRequest, NotFound, MethodNotAllowed, RequestEntityTooLarge
+from werkzeug.routing import Map, Rule
+from werkzeug.serving import make_server
+from werkzeug.wrappers import Request, Response
+
+from src.config import (
+    FACE_DETECTOR_BACKEND,
+    EMOTION_ENGINE,
+    SERVICE_HOST,
+    SERVICE_PORT,
+    SERVICE_GRPC_PORT,
+    SERVICE_MAX_BATCH_SIZE,
+    SERVICE_MAX_WAIT_MS,
+    SERVICE_MAX_QUEUE,
+    SERVICE_MAX_INFLIGHT,
+    SERVICE_MAX_IMAGE_BYTES,
+    SERVICE_REQUEST_TIMEOUT
+)
+from src.features.emotion_detector import EmotionDetector
+from src.features.profiler import PROFILER
+from src.features.request_batcher import MicroBatcher, BatcherOverloaded
+
+RAW_CONTENT_TYPES = ('application/octet-stream', 'application/x-raw-bgr')
+
+
+class ServiceRequest(Request):
+    # Từ chối nội dung quá lớn trước khi đọc vào bộ nhớ (413)
+    max_content_length = SERVICE_MAX_IMAGE_BYTES
+
+
+def json_response(data, status=200, headers=None):
+    return Response(json.dumps(data, ensure_ascii=False), status=status, headers=headers,
+                    mimetype='application/json')
+
+
+def decode_image_bytes(data):
+    """Giải mã ảnh JPEG/PNG sang mảng BGR"""
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise BadRequest("cannot decode image (send JPEG/PNG bytes or raw pixels with width/height)")
+    return image
+
+
+def decode_request_image(request):
+    """Giải mã ảnh từ nội dung yêu cầu: JPEG/PNG hoặc mảng điểm ảnh thô BGR"""
+    data = request.get_data(cache=False)
+    if not data:
+        raise BadRequest("empty request body")
+    if request.mimetype in RAW_CONTENT_TYPES and 'width' in request.args:
+        try:
+            width = int(request.args['width'])
+            height = int(request.args['height'])
+            channels = int(request.args.get('channels', 3))
+        except (KeyError, ValueError):
+            raise BadRequest("raw images need integer width, height and optional channels")
+        if channels not in (1, 3) or len(data) != width * height * channels:
+            raise BadRequest(f"expected {width}x{height}x{channels} uint8 pixels, got {len(data)} bytes")
+        image = np.frombuffer(data, dtype=np.uint8).reshape((height, width, channels))
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR) if channels == 1 else image
+    return decode_image_bytes(data)
+
+
+class InferenceService:
+    """WSGI application wrapping one shared EmotionDetector behind a micro-batcher."""
+
+    def __init__(self, backend=FACE_DETECTOR_BACKEND, engine=EMOTION_ENGINE,
+                 max_batch_size=SERVICE_MAX_BATCH_SIZE, max_wait_ms=SERVICE_MAX_WAIT_MS,
+                 max_queue=SERVICE_MAX_QUEUE, max_inflight=SERVICE_MAX_INFLIGHT,
+                 request_timeout=SERVICE_REQUEST_TIMEOUT):
+        self.detector = EmotionDetector(backend=backend, engine=engine)
+        self.batcher = MicroBatcher(
+            self._detect_batch, max_batch_size, max_wait_ms / 1000.0, max_queue, name="service-batcher"
+        )
+        self.max_inflight = max_inflight
+        self.request_timeout = request_timeout
+        self._inflight = threading.BoundedSemaphore(max_inflight)
+        self._inflight_count = 0
+        self._count_lock = threading.Lock()
+        self.ready = False
+        self.load_error = None
+        self.started_at = time.time()
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.url_map = Map([
+            Rule('/detect', endpoint='detect', methods=['POST']),
+            Rule('/ready', endpoint='ready', methods=['GET']),
+            Rule('/metrics', endpoint='metrics', methods=['GET'])
+        ])
+
+    def start(self):
+        """Khởi động bộ gom batch và nạp model ở luồng nền"""
+        self.batcher.start()
+        threading.Thread(target=self._load_models, name="service-warmup", daemon=True).start()
+
+    def stop(self):
+        self.batcher.stop()
+
+    def _load_models(self):
+        try:
+            self.detector.detector
+            self.detector.classifier
+            self.ready = True
+        except Exception as e:
+            self.load_error = str(e)
+
+    def _detect_batch(self, frames):
+        with PROFILER.stage('service_batch'):
+            return self.detector.detect_emotions_batch(frames)
+
+    def run_detection(self, decode):
+        """Giới hạn đồng thời, giải mã ảnh (decode()) và chờ kết quả từ bộ gom batch; trả về (mã HTTP, nội dung)"""
+        if not self.ready:
+            return 503, {'error': self.load_error or "models are still loading"}
+        # Giới hạn số yêu cầu xử lý đồng thời, vượt quá thì từ chối ngay
+        if not self._inflight.acquire(blocking=False):
+            self.throttled += 1
+            return 503, {'error': "too many concurrent requests"}
+        try:
+            with self._count_lock:
+                self._inflight_count += 1
+            image = decode()
+            try:
+                future = self.batcher.submit(image)
+            except BatcherOverloaded as e:
+                self.throttled += 1
+                return 503, {'error': f"server overloaded: {e}"}
+            try:
+                return 200, future.result(timeout=self.request_timeout)
+            except FutureTimeoutError:
+                self.errors += 1
+                return 504, {'error': "inference timed out"}
+        finally:
+            with self._count_lock:
+                self._inflight_count -= 1
+            self._inflight.release()
+
+    def on_detect(self, request):
+        status, payload = self.run_detection(lambda: decode_request_image(request))
+        return json_response(payload, status, {'Retry-After': '1'} if status == 503 else None)
+
+    def on_ready(self, request):
+        status = 200 if self.ready else 503
+        return json_response({'ready': self.ready, 'error': self.load_error}, status)
+
+    def on_metrics(self, request):
+        return json_response({
+            'uptime_s': round(time.time() - self.started_at, 1),
+            'ready': self.ready,
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'errors': self.errors,
+            'inflight': self._inflight_count,
+            'max_inflight': self.max_inflight,
+            'batcher': self.batcher.stats(),
+            'profile': PROFILER.snapshot() if PROFILER.enabled else None
+        })
+
+    def dispatch(self, request):
+        adapter = self.url_map.bind_to_environ(request.environ)
+        try:
+            endpoint, values = adapter.match()
+            return getattr(self, f"on_{endpoint}")(request, **values)
+        except (NotFound, MethodNotAllowed, BadRequest, RequestEntityTooLarge) as e:
+            return json_response({'error': e.description}, e.code)
+        except HTTPException as e:
+            return e
+        except Exception as e:
+            self.errors += 1
+            return json_response({'error': str(e)}, 500)
+
+    def __call__(self, environ, start_response):
+        request = ServiceRequest(environ)
+        self.requests += 1
+        response = self.dispatch(request)
+        return response(environ, start_response)
+
+
+def serve(host=SERVICE_HOST, port=SERVICE_PORT, grpc_port=SERVICE_GRPC_PORT, **options):
+    """Chạy dịch vụ cho tới khi bị ngắt (Ctrl+C)"""
+    service = InferenceService(**options)
+    service.start()
+    server = make_server(host, port, service, threaded=True)
+    grpc_server = None
+    if grpc_port is not None:
+        from src.grpc_server import create_grpc_server
+
+        grpc_server = create_grpc_server(service, host, grpc_port)
+        grpc_server.start()
+        print(f"Serving emotion recognition over gRPC on {host}:{grpc_port}", flush=True)
+    print(f"Serving emotion recognition on http://{host}:{server.server_port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if grpc_server is not None:
+            grpc_server.stop(grace=1.0)
+        service.stop()
+    return 0
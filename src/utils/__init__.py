@@ -1,7 +1,12 @@
 """
 Utility functions for the Emotion Recognition application.
+
+Style and window helpers are light and imported eagerly; the image
+helpers depend on OpenCV and are imported on first use.
 """
 
+from ..lazy_loader import make_lazy_getattr
+
 from .style_utils import (
     check_icon,
     fade_color,
@@ -14,15 +19,22 @@ from .window_utils import (
     center_window,
     set_icon_window,
     print_error_input,
-    update_error_wrap_length
+    update_error_wrap_length,
+    attach_profiler_overlay
 )
 
-from .image_utils import (
-    resize_image,
-    convert_cv2_to_tk,
-    draw_emotion_results,
-    load_default_image
-)
+_LAZY_ATTRS = {
+    'resize_image': '.image_utils',
+    'resized_shape': '.image_utils',
+    'FrameBufferRing': '.image_utils',
+    'rotate_frame': '.image_utils',
+    'convert_cv2_to_tk': '.image_utils',
+    'draw_emotion_results': '.image_utils',
+    'load_default_image': '.image_utils',
+    'FrameDisplay': '.display_utils',
+    'ScaledImageRenderer': '.render_utils',
+    'fit_size': '.render_utils'
+}
 
 __all__ = [
     'check_icon',
@@ -34,8 +46,18 @@ __all__ = [
     'set_icon_window',
     'print_error_input',
     'update_error_wrap_length',
+    'attach_profiler_overlay',
     'resize_image',
+    'resized_shape',
+    'FrameBufferRing',
+    'rotate_frame',
     'convert_cv2_to_tk',
     'draw_emotion_results',
-    'load_default_image'
-] 
\ No newline at end of file
+    'load_default_image',
+    'FrameDisplay',
+    'ScaledImageRenderer',
+    'fit_size'
+]
+
+
+__getattr__, __dir__ = make_lazy_getattr(__name__, _LAZY_ATTRS)
@@ -0,0 +1,53 @@
+import tkinter as tk
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+
+class FrameDisplay:
+    """Bề mặt hiển thị dùng lại một Label và một PhotoImage cho mọi frame"""
+
+    def __init__(self, master):
+        self.master = master
+        self.label = None
+        self.photo = None
+        self.size = None
+        # Buffer RGBA dùng lại giữa các frame
+        self._rgba = None
+
+    def _ensure_label(self):
+        """Tạo Label hiển thị nếu chưa có (hoặc đã bị hủy khi reset giao diện)"""
+        if self.label is not None and self.label.winfo_exists():
+            return
+        # Xóa ảnh mặc định một lần duy nhất thay vì hủy widget ở mỗi frame
+        for widget in self.master.winfo_children():
+            widget.destroy()
+        self.label = tk.Label(master=self.master)
+        self.label.pack(fill="both", expand=True)
+        self.photo = None
+        self.size = None
+
+    def show(self, frame):
+        """Hiển thị frame OpenCV (BGR), chỉ cấp phát lại PhotoImage khi kích thước đổi"""
+        self._ensure_label()
+        height, width = frame.shape[:2]
+        if self._rgba is None or self._rgba.shape[:2] != (height, width):
+            self._rgba = np.empty((height, width, 4), dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA, dst=self._rgba)
+        # PIL chỉ dùng chung bộ nhớ (không chép) với buffer 4 kênh; paste() là lần chép duy nhất vào Tk
+        img = Image.frombuffer('RGBA', (width, height), self._rgba, 'raw', 'RGBA', 0, 1)
+        if self.photo is None or img.size != self.size:
+            self.photo = ImageTk.PhotoImage(image=img)
+            self.size = img.size
+            self.label.configure(image=self.photo)
+        else:
+            # Ghi đè dữ liệu điểm ảnh vào PhotoImage hiện có
+            self.photo.paste(img)
+
+    def clear(self):
+        """Hủy Label hiển thị và giải phóng PhotoImage"""
+        if self.label is not None and self.label.winfo_exists():
+            self.label.destroy()
+        self.label = None
+        self.photo = None
+        self.size = None
+        self._rgba = None
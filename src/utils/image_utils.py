@@ -4,13 +4,56 @@ from PIL import Image, ImageTk
 from src.config import IMG_DIR
 import os
 
-def resize_image(frame, target_height):
-    """Resize ảnh theo chiều cao mục tiêu"""
+def resized_shape(frame, target_height):
+    """Kích thước (shape) của ảnh sau khi resize theo chiều cao mục tiêu"""
+    height, width = frame.shape[:2]
+    new_width = int(width * target_height / height)
+    return (target_height, new_width) + frame.shape[2:]
+
+def resize_image(frame, target_height, dst=None):
+    """Resize ảnh theo chiều cao mục tiêu (ghi vào dst nếu có buffer cấp phát sẵn)"""
     height, width = frame.shape[:2]
     scale = target_height / height
     new_width = int(width * scale)
+    if dst is not None:
+        return cv2.resize(frame, (new_width, target_height), dst=dst)
     return cv2.resize(frame, (new_width, target_height))
 
+class FrameBufferRing:
+    """Vòng buffer cấp phát sẵn, dùng lại cho mỗi frame thay vì tạo mảng mới"""
+
+    def __init__(self, size=3):
+        # size >= số buffer có thể đang được dùng cùng lúc (đang ghi, chờ trong hàng đợi, đang hiển thị)
+        self.size = size
+        self._buffers = []
+        self._index = 0
+
+    def get(self, shape, dtype=np.uint8):
+        """Lấy buffer kế tiếp, chỉ cấp phát lại khi kích thước frame thay đổi"""
+        shape = tuple(shape)
+        if not self._buffers or self._buffers[0].shape != shape or self._buffers[0].dtype != dtype:
+            self._buffers = [np.empty(shape, dtype=dtype) for _ in range(self.size)]
+            self._index = 0
+        buffer = self._buffers[self._index]
+        self._index = (self._index + 1) % self.size
+        return buffer
+
+    def copy(self, frame):
+        """Chép frame vào buffer kế tiếp (thay cho frame.copy())"""
+        buffer = self.get(frame.shape, frame.dtype)
+        np.copyto(buffer, frame)
+        return buffer
+
+def rotate_frame(frame, rotation):
+    """Xoay frame theo thông tin CAP_PROP_ORIENTATION_META của video"""
+    if rotation == 90:
+        return cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+    elif rotation == 180:
+        return cv2.rotate(frame, cv2.ROTATE_180)
+    elif rotation == 270:
+        return cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
+    return frame
+
 def convert_cv2_to_tk(frame):
     """Chuyển đổi ảnh OpenCV sang định dạng Tkinter"""
     frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
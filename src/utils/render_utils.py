@@ -0,0 +1,114 @@
+"""
+Debounced, cached rendering of a PIL image scaled to fit a Tk canvas.
+
+While a canvas is being resized every ``<Configure>`` event gets a cheap
+preview resampled from a small copy of the source. A single LANCZOS pass
+runs once the size has stayed the same for ``debounce_ms``. The last few
+high-quality sizes are kept in an LRU, so maximise/restore and returning
+to an earlier size do not resample again. Failures while rendering are
+passed to an optional ``on_error`` callback instead of being lost in the
+Tk event loop.
+"""
+
+from collections import OrderedDict
+from PIL import Image, ImageTk
+from src.config import IMAGE_RESIZE_CACHE_SIZE, IMAGE_RESIZE_DEBOUNCE_MS, IMAGE_PREVIEW_MAX_SIZE
+
+def fit_size(image_size, width, height):
+    """Kích thước lớn nhất giữ nguyên tỉ lệ ảnh và nằm gọn trong khung (width, height)"""
+    scale = min(width / image_size[0], height / image_size[1])
+    return max(1, int(image_size[0] * scale)), max(1, int(image_size[1] * scale))
+
+class ScaledImageRenderer:
+    """Keep one canvas image item centred and fitted to the canvas size."""
+
+    def __init__(self, canvas, image, debounce_ms=IMAGE_RESIZE_DEBOUNCE_MS, cache_size=IMAGE_RESIZE_CACHE_SIZE,
+                 preview_max_size=IMAGE_PREVIEW_MAX_SIZE, preview_filter=Image.Resampling.NEAREST, on_error=None):
+        self.canvas = canvas
+        self.debounce_ms = debounce_ms
+        self.cache_size = cache_size
+        self.preview_max_size = preview_max_size
+        self.preview_filter = preview_filter
+        # on_error(exception): gọi khi render lỗi, None thì ném lỗi ra ngoài như bình thường
+        self.on_error = on_error
+        self.item = canvas.create_image(0, 0, anchor='center')
+        # Giữ tham chiếu tới ảnh đang hiển thị để không bị garbage collector xóa
+        self.photo = None
+        self._job = None
+        self._cache = OrderedDict()
+        self.set_image(image)
+
+    def set_image(self, image):
+        """Đổi ảnh nguồn và bỏ các kết quả đã render cho ảnh cũ"""
+        self.cancel()
+        self.image = image
+        # Bản xem nhanh được lấy mẫu từ ảnh nhỏ, chi phí không phụ thuộc kích thước ảnh gốc
+        self.preview_image = image
+        if max(image.size) > self.preview_max_size:
+            self.preview_image = image.copy()
+            self.preview_image.thumbnail((self.preview_max_size, self.preview_max_size), Image.Resampling.BILINEAR)
+        self._cache.clear()
+
+    def on_configure(self, event):
+        """Xử lý sự kiện <Configure> của canvas"""
+        self.schedule(event.width, event.height)
+
+    def schedule(self, width, height):
+        """Hiện bản xem nhanh ngay và hẹn render chất lượng cao khi ngừng thay đổi kích thước"""
+        self._guard(self._schedule, width, height)
+
+    def render(self, width, height):
+        """Render chất lượng cao (LANCZOS) cho khung (width, height), dùng lại kết quả trong cache nếu có"""
+        self._guard(self._render, width, height)
+
+    def _guard(self, step, width, height):
+        try:
+            step(width, height)
+        except Exception as e:
+            if self.on_error is None:
+                raise
+            self.cancel()
+            self.on_error(e)
+
+    def _schedule(self, width, height):
+        if width <= 1 or height <= 1:
+            return
+        self.cancel()
+        size = fit_size(self.image.size, width, height)
+        photo = self._cache.get(size)
+        if photo is not None:
+            self._cache.move_to_end(size)
+            self._show(photo, width, height)
+            return
+        if self.photo is None:
+            # Lần hiển thị đầu tiên không cần bản xem nhanh
+            self._render(width, height)
+            return
+        self._show(ImageTk.PhotoImage(self.preview_image.resize(size, self.preview_filter)), width, height)
+        self._job = self.canvas.after(self.debounce_ms, self.render, width, height)
+
+    def _render(self, width, height):
+        self._job = None
+        if not self.canvas.winfo_exists():
+            return
+        size = fit_size(self.image.size, width, height)
+        photo = self._cache.get(size)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self.image.resize(size, Image.Resampling.LANCZOS))
+            self._cache[size] = photo
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(size)
+        self._show(photo, width, height)
+
+    def cancel(self):
+        """Hủy lần render chất lượng cao đang chờ"""
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+
+    def _show(self, photo, width, height):
+        self.photo = photo
+        self.canvas.itemconfig(self.item, image=photo)
+        self.canvas.coords(self.item, width // 2, height // 2)
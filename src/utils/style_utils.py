@@ -1,5 +1,6 @@
 import tkinter as tk
-from src.config import COLORS
+from collections import OrderedDict
+from src.config import COLORS, SHADOW_CACHE_SIZE
 
 # Danh sách lưu trữ hình ảnh để tránh bị xóa bởi garbage collector
 image_reference = []
@@ -45,36 +46,72 @@ def on_leave(e, inColor, outColor):
     """Xử lý sự kiện khi hover ra"""
     fade_color(outColor, inColor, 10, e)
 
+def _nine_slice_indices(length, small_length, center):
+    """Chỉ số hàng/cột để kéo giãn ảnh nhỏ thành ảnh lớn: giữ hai mép, lặp lại hàng/cột giữa"""
+    import numpy as np
+    middle = length - small_length + 1
+    return np.concatenate([
+        np.arange(center),
+        np.full(middle, center),
+        np.arange(center + 1, small_length)
+    ])
+
+def _build_shadow(size, offset, blur_radius, shadow_color):
+    """Tạo nền bóng đổ đã làm mờ; chỉ làm mờ một ảnh nhỏ cố định rồi kéo giãn theo kiểu nine-slice"""
+    from PIL import Image, ImageFilter, ImageDraw
+    import numpy as np
+
+    width, height = size
+    pad_x = abs(offset[0]) + blur_radius * 2
+    pad_y = abs(offset[1]) + blur_radius * 2
+    # Phần mép chịu ảnh hưởng của blur; bên trong hình chữ nhật có độ mờ không đổi
+    margin = blur_radius * 4 + 2
+    small_width = min(width, margin * 2)
+    small_height = min(height, margin * 2)
+
+    mask = Image.new("L", (small_width + pad_x, small_height + pad_y), 0)
+    ImageDraw.Draw(mask).rectangle(
+        [blur_radius, blur_radius, small_width + blur_radius, small_height + blur_radius],
+        fill=shadow_color[3]
+    )
+    mask = mask.filter(ImageFilter.GaussianBlur(blur_radius))
+
+    if (small_width, small_height) != (width, height):
+        alpha = np.asarray(mask)
+        rows = _nine_slice_indices(height + pad_y, alpha.shape[0], blur_radius + small_height // 2)
+        cols = _nine_slice_indices(width + pad_x, alpha.shape[1], blur_radius + small_width // 2)
+        mask = Image.fromarray(np.ascontiguousarray(alpha[np.ix_(rows, cols)]))
+
+    shadow = Image.new("RGBA", mask.size, tuple(shadow_color[:3]) + (0,))
+    shadow.putalpha(mask)
+    return shadow
+
+# Nền bóng đổ đã tạo, theo thứ tự dùng gần nhất (LRU)
+_shadow_cache = OrderedDict()
+
+def get_box_shadow(size, offset=(2, 2), blur_radius=4, shadow_color=(0, 0, 0, 77)):
+    """Lấy nền bóng đổ từ cache, chỉ tạo mới khi kích thước hoặc kiểu bóng thay đổi"""
+    key = (tuple(size), tuple(offset), blur_radius, tuple(shadow_color))
+    shadow = _shadow_cache.get(key)
+    if shadow is None:
+        shadow = _build_shadow(key[0], offset, blur_radius, shadow_color)
+        _shadow_cache[key] = shadow
+        while len(_shadow_cache) > SHADOW_CACHE_SIZE:
+            _shadow_cache.popitem(last=False)
+    else:
+        _shadow_cache.move_to_end(key)
+    return shadow
+
 def add_box_shadow(image, offset=(2, 2), blur_radius=4, shadow_color=(0, 0, 0, 77)):
     """Thêm hiệu ứng bóng đổ cho ảnh"""
-    from PIL import Image, ImageFilter, ImageDraw
-    
     # Chuyển đổi ảnh sang RGBA nếu chưa đúng định dạng
     if image.mode != "RGBA":
         image = image.convert("RGBA")
-    
-    # Kích thước ảnh gốc
-    width, height = image.size
-
-    # Tạo ảnh nền với bóng đổ
-    shadow = Image.new(
-        "RGBA",
-        (width + abs(offset[0]) + blur_radius * 2, height + abs(offset[1]) + blur_radius * 2),
-        (0, 0, 0, 0)  # Trong suốt
-    )
 
-    shadow_draw = ImageDraw.Draw(shadow)
-
-    # Tạo hình chữ nhật tương ứng với ảnh, thêm shadow
-    shadow_draw.rectangle(
-        [blur_radius, blur_radius, width + blur_radius, height + blur_radius],
-        fill=shadow_color
-    )
-
-    # Làm mờ bóng đổ
-    shadow = shadow.filter(ImageFilter.GaussianBlur(blur_radius))
+    # Nền bóng đổ dùng chung được chép ra trước khi chèn ảnh
+    shadow = get_box_shadow(image.size, offset, blur_radius, shadow_color).copy()
 
     # Chèn ảnh gốc lên trên bóng
     shadow.paste(image, (blur_radius + offset[0], blur_radius + offset[1]), mask=image)
-    
-    return shadow 
\ No newline at end of file
+
+    return shadow
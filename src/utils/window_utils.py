@@ -51,4 +51,28 @@ def print_error_input(frm_mid, announce):
 
 def update_error_wrap_length(frm_mid, error_label):  
     """Cập nhật độ dài tối đa của text khi resize"""
-    error_label.config(wraplength=frm_mid.winfo_width() - 20) 
\ No newline at end of file
+    error_label.config(wraplength=frm_mid.winfo_width() - 20) 
+def attach_profiler_overlay(window, parent_frame, row=0, column=1):
+    """Thêm nhãn hiển thị fps và độ trễ từng công đoạn, tự cập nhật tới khi cửa sổ bị đóng (None nếu tắt)"""
+    from src.config import COLORS, FONTS, PROFILING_OVERLAY, PROFILING_OVERLAY_INTERVAL_MS
+    from src.features.profiler import PROFILER
+
+    if not (PROFILER.enabled and PROFILING_OVERLAY):
+        return None
+    label = tk.Label(
+        master=parent_frame,
+        font=FONTS['label'],
+        bg=COLORS['WHITE'],
+        fg=COLORS['DARK_GREY'],
+        anchor="w"
+    )
+    label.grid(row=row, column=column, sticky="w")
+
+    def refresh():
+        if not label.winfo_exists():
+            return
+        label.config(text=PROFILER.summary())
+        window.after(PROFILING_OVERLAY_INTERVAL_MS, refresh)
+
+    refresh()
+    return label
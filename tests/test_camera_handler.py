@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from src.features import camera_handler
+from src.features.camera_handler import CameraHandler
+
+
+class FakeCapture:
+    def __init__(self, index):
+        self.released = False
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        time.sleep(0.005)
+        return True, np.zeros((48, 64, 3), dtype=np.uint8)
+
+    def release(self):
+        self.released = True
+
+
+class FakeFrame:
+    """Stands in for the Tk frame: reports a height and records after() callbacks."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def winfo_height(self):
+        return 48
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+
+@pytest.mark.parametrize('overlay_mode', [True, False])
+def test_inference_error_stops_camera_and_is_reported(monkeypatch, overlay_mode):
+    errors = []
+    monkeypatch.setattr(camera_handler.cv2, 'VideoCapture', FakeCapture)
+    monkeypatch.setattr(camera_handler.messagebox, 'showerror', lambda title, message: errors.append(message))
+
+    handler = CameraHandler(overlay_mode=overlay_mode)
+    handler.motion_gate = None
+
+    def broken_update(frame):
+        raise RuntimeError("model failed to load")
+
+    monkeypatch.setattr(handler.face_tracker, 'update', broken_update)
+    frame, closed = FakeFrame(), []
+    assert handler.start_camera(frame, lambda image: None, lambda: closed.append(True))
+    cap = handler.cap
+
+    deadline = time.monotonic() + 2
+    while handler.pipeline.error is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    frame.scheduled[-1]()
+
+    assert len(errors) == 1 and "model failed to load" in errors[0]
+    assert closed == [True]
+    assert handler.pipeline is None and cap.released
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("tensorflow")
+pytest.importorskip("fer")
+
+from src.config import EMOTION_ONNX_MODEL_PATH
+
+if not os.path.exists(EMOTION_ONNX_MODEL_PATH):
+    pytest.skip("ONNX model not converted (python -m src.cli convert-model)", allow_module_level=True)
+
+from benchmarks.compare_emotion_engines import compare, synthetic_crops
+from src.features.emotion_classifier import create_emotion_classifier
+
+# Cùng ngưỡng mặc định với benchmarks.compare_emotion_engines
+TOLERANCE = 0.01
+
+
+@pytest.fixture(scope="module")
+def engines():
+    return create_emotion_classifier('keras'), create_emotion_classifier('onnx')
+
+
+def test_onnx_matches_keras(engines):
+    keras_engine, onnx_engine = engines
+    assert onnx_engine.target_size == keras_engine.target_size
+    crops = synthetic_crops(keras_engine.target_size, 32)
+    report = compare(keras_engine, onnx_engine, crops, batch_size=8, repeat=1)
+    assert report['max_abs_diff'] <= TOLERANCE
+    # Điểm gần bằng nhau có thể đổi thứ hạng trong phạm vi sai số
+    assert report['top1_agreement'] >= 0.95
@@ -0,0 +1,65 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from src.features.face_crop_cache import FaceCropCache, box_iou, dhash
+
+BOX = (100, 100, 50, 50)
+SCORES = [0.1, 0.9]
+
+
+def gradient(reverse=False):
+    crop = np.tile(np.arange(0, 240, 5, dtype=np.uint8), (48, 1))
+    return crop[:, ::-1].copy() if reverse else crop
+
+
+def test_box_iou():
+    assert box_iou(BOX, BOX) == 1.0
+    assert box_iou(BOX, (200, 200, 10, 10)) == 0.0
+    assert box_iou((0, 0, 10, 10), (5, 0, 10, 10)) == pytest.approx(50 / 150)
+
+
+def test_dhash_is_stable_and_discriminative():
+    assert dhash(gradient()) == dhash(gradient())
+    assert (dhash(gradient()) ^ dhash(gradient(reverse=True))).bit_count() > 32
+
+
+def test_hit_requires_similar_crop_at_same_position():
+    cache = FaceCropCache(ttl=10, max_distance=2, min_iou=0.5)
+    fingerprint = dhash(gradient())
+    cache.store(fingerprint, BOX, SCORES, now=0)
+    assert cache.lookup(fingerprint ^ 0b1, (105, 102, 50, 50), now=1) == SCORES
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_same_looking_face_elsewhere_is_a_miss():
+    cache = FaceCropCache(ttl=10, min_iou=0.5)
+    fingerprint = dhash(gradient())
+    cache.store(fingerprint, BOX, SCORES, now=0)
+    assert cache.lookup(fingerprint, (400, 100, 50, 50), now=1) is None
+
+
+def test_different_crop_at_same_position_is_a_miss():
+    cache = FaceCropCache(ttl=10, max_distance=2)
+    cache.store(dhash(gradient()), BOX, SCORES, now=0)
+    assert cache.lookup(dhash(gradient(reverse=True)), BOX, now=1) is None
+
+
+def test_entries_expire_after_ttl():
+    cache = FaceCropCache(ttl=1.0)
+    fingerprint = dhash(gradient())
+    cache.store(fingerprint, BOX, SCORES, now=0)
+    assert cache.lookup(fingerprint, BOX, now=1.5) is None
+    assert len(cache) == 0
+
+
+def test_store_replaces_entry_at_same_position_and_respects_capacity():
+    cache = FaceCropCache(capacity=2, ttl=10)
+    cache.store(1, BOX, [1], now=0)
+    cache.store(2, (102, 100, 50, 50), [2], now=0)
+    assert len(cache) == 1
+    cache.store(3, (300, 0, 50, 50), [3], now=0)
+    cache.store(4, (0, 300, 50, 50), [4], now=0)
+    assert len(cache) == 2
+    assert cache.lookup(2, BOX, now=1) is None
@@ -0,0 +1,88 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from src.features import face_tracker
+from src.features.face_tracker import FaceTracker
+
+HAPPY = {'happy': 1.0}
+SAD = {'sad': 1.0}
+
+
+class FakeCvTracker:
+    """Moves its box 5 px right per update and records the frame size it saw."""
+
+    def __init__(self):
+        self.shapes = []
+
+    def init(self, frame, box):
+        self.shapes.append(frame.shape)
+        self.box = box
+
+    def update(self, frame):
+        self.shapes.append(frame.shape)
+        x, y, w, h = self.box
+        self.box = (x + 5, y, w, h)
+        return True, self.box
+
+
+class FakeDetector:
+    """Half-resolution inference; classify_faces drops the boxes listed in ``invalid``."""
+
+    def __init__(self, faces):
+        self.faces = faces
+        self.invalid = set()
+        self.classified = []
+
+    def downscale(self, frame):
+        return frame[::2, ::2], 0.5
+
+    def detect_emotions(self, frame):
+        return [dict(face) for face in self.faces]
+
+    def classify_faces(self, frame, boxes):
+        self.classified.append(list(boxes))
+        return [{'box': list(box), 'emotions': SAD} for box in boxes if tuple(box) not in self.invalid]
+
+
+@pytest.fixture
+def trackers(monkeypatch):
+    created = []
+
+    def create(tracker_type):
+        created.append(FakeCvTracker())
+        return created[-1]
+
+    monkeypatch.setattr(face_tracker, 'create_tracker', create)
+    return created
+
+
+def frame():
+    return np.zeros((480, 640, 3), dtype=np.uint8)
+
+
+def test_trackers_run_on_the_downscaled_frame(trackers):
+    detector = FakeDetector([{'box': [100, 100, 40, 40], 'emotions': HAPPY}])
+    tracker = FaceTracker(detector, detect_interval=10, classify_interval=10)
+    tracker.update(frame())
+    results = tracker.update(frame())
+
+    assert trackers[0].shapes == [(240, 320, 3), (240, 320, 3)]
+    # 5 px at half resolution is 10 px on the full frame
+    assert results == [{'box': [110, 100, 40, 40], 'emotions': HAPPY}]
+
+
+def test_dropped_crop_does_not_block_other_faces(trackers):
+    detector = FakeDetector([
+        {'box': [100, 100, 40, 40], 'emotions': HAPPY},
+        {'box': [300, 100, 40, 40], 'emotions': HAPPY}
+    ])
+    tracker = FaceTracker(detector, detect_interval=10, classify_interval=1)
+    tracker.update(frame())
+    detector.invalid = {(310, 100, 40, 40)}
+    results = tracker.update(frame())
+
+    assert detector.classified == [[(110, 100, 40, 40), (310, 100, 40, 40)]]
+    assert [face['emotions'] for face in results] == [SAD, HAPPY]
+    assert [track.frames_since_classify for track in tracker.tracks] == [0, 1]
@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+# frame_pipeline dùng profiler (NumPy) cho các chỉ số độ trễ
+pytest.importorskip("numpy")
+
+from src.features.frame_pipeline import LatestFrameQueue, InferenceResult
+
+
+def test_newest_item_wins_and_drops_are_counted():
+    queue = LatestFrameQueue()
+    queue.put(1)
+    queue.put(2)
+    queue.put(3)
+    assert queue.get_nowait() == 3
+    assert queue.dropped == 2
+    assert queue.get_nowait() is None
+
+
+def test_get_returns_newest_and_empties_larger_queue():
+    queue = LatestFrameQueue(maxsize=3)
+    for item in range(3):
+        queue.put(item)
+    assert queue.get_nowait() == 2
+    assert queue.get_nowait() is None
+    assert queue.dropped == 0
+
+
+def test_get_times_out_with_none():
+    assert LatestFrameQueue().get(timeout=0.01) is None
+
+
+def test_get_wakes_up_on_put():
+    queue = LatestFrameQueue()
+    threading.Timer(0.02, queue.put, args=("frame",)).start()
+    assert queue.get(timeout=1) == "frame"
+
+
+def test_clear():
+    queue = LatestFrameQueue()
+    queue.put(1)
+    queue.clear()
+    assert queue.get_nowait() is None
+
+
+def test_inference_result_expiry():
+    result = InferenceResult([], (480, 640), timestamp=10.0)
+    assert result.age(now=10.5) == 0.5
+    assert not result.is_expired(1.0, now=10.5)
+    assert result.is_expired(1.0, now=11.5)
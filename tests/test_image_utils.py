@@ -0,0 +1,43 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("PIL")
+
+from src.utils.image_utils import FrameBufferRing, resize_image, resized_shape
+
+
+def test_ring_cycles_through_preallocated_buffers():
+    ring = FrameBufferRing(size=3)
+    buffers = [ring.get((4, 6, 3)) for _ in range(4)]
+    assert len({id(buffer) for buffer in buffers[:3]}) == 3
+    assert buffers[3] is buffers[0]
+
+
+def test_ring_reallocates_when_shape_or_dtype_changes():
+    ring = FrameBufferRing(size=2)
+    first = ring.get((4, 6, 3))
+    resized = ring.get((8, 12, 3))
+    assert resized.shape == (8, 12, 3)
+    assert resized is not first
+    assert ring.get((8, 12, 3), np.float32).dtype == np.float32
+
+
+def test_ring_copy_does_not_alias_source():
+    ring = FrameBufferRing()
+    frame = np.arange(24, dtype=np.uint8).reshape(2, 4, 3)
+    copy = ring.copy(frame)
+    assert np.array_equal(copy, frame)
+    frame[:] = 0
+    assert copy.any()
+
+
+def test_resize_into_preallocated_buffer():
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    shape = resized_shape(frame, 240)
+    assert shape == (240, 320, 3)
+    buffer = FrameBufferRing(size=1).get(shape)
+    result = resize_image(frame, 240, dst=buffer)
+    assert result.shape == shape
+    assert np.shares_memory(result, buffer)
+    assert np.array_equal(result, resize_image(frame, 240))
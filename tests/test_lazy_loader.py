@@ -0,0 +1,37 @@
+import sys
+import types
+
+import pytest
+
+from src.lazy_loader import make_lazy_getattr
+
+
+@pytest.fixture
+def package(monkeypatch):
+    module = types.ModuleType("lazy_pkg")
+    monkeypatch.setitem(sys.modules, "lazy_pkg", module)
+    monkeypatch.setitem(sys.modules, "lazy_pkg.heavy", types.SimpleNamespace(Thing="thing"))
+    module.__getattr__, module.__dir__ = make_lazy_getattr("lazy_pkg", {'Thing': '.heavy'})
+    return module
+
+
+def test_attribute_is_loaded_and_cached(package):
+    assert package.Thing == "thing"
+    assert package.__dict__['Thing'] == "thing"
+
+
+def test_unknown_attribute(package):
+    with pytest.raises(AttributeError, match="has no attribute 'Other'"):
+        package.Other
+
+
+def test_dir_lists_lazy_names(package):
+    assert 'Thing' in dir(package)
+
+
+def test_real_packages_use_the_loader():
+    import src.features
+    import src.utils
+
+    assert 'EmotionDetector' in dir(src.features)
+    assert 'FrameDisplay' in dir(src.utils)
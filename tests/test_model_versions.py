@@ -0,0 +1,19 @@
+import os
+
+from src.features.model_versions import file_version, package_version
+
+
+def test_package_version():
+    assert package_version('pytest') != 'unknown'
+    assert package_version('no-such-package-installed') == 'unknown'
+
+
+def test_file_version_follows_size_and_mtime(tmp_path):
+    path = tmp_path / "model.onnx"
+    assert file_version(str(path)) == 'missing'
+    path.write_bytes(b"1234")
+    os.utime(path, (1000, 1000))
+    assert file_version(str(path)) == "4-1000"
+    path.write_bytes(b"123456")
+    os.utime(path, (2000, 2000))
+    assert file_version(str(path)) == "6-2000"
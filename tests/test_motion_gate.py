@@ -0,0 +1,66 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from src.features.motion_gate import MotionGate
+
+
+def frame(value=0, square=None):
+    image = np.full((240, 320, 3), value, dtype=np.uint8)
+    if square is not None:
+        x, y = square
+        image[y:y + 60, x:x + 60] = 255
+    return image
+
+
+def make_gate(**kwargs):
+    options = dict(method='absdiff', width=160, pixel_threshold=25, min_changed_ratio=0.005, refresh_interval=2.0)
+    options.update(kwargs)
+    return MotionGate(**options)
+
+
+def test_first_frame_always_passes():
+    assert make_gate().update(frame(), now=0)
+
+
+def test_static_scene_is_skipped_until_refresh():
+    gate = make_gate()
+    assert gate.update(frame(), now=0)
+    assert not gate.update(frame(), now=0.5)
+    assert not gate.update(frame(), now=1.9)
+    assert gate.skipped == 2
+    assert gate.update(frame(), now=2.0)
+
+
+def test_motion_passes():
+    gate = make_gate()
+    gate.update(frame(square=(20, 20)), now=0)
+    assert gate.update(frame(square=(200, 120)), now=0.1)
+    assert gate.changed_ratio > 0.005
+
+
+def test_slow_drift_accumulates_against_last_passed_frame():
+    gate = make_gate(min_changed_ratio=0.01)
+    gate.update(frame(square=(100, 100)), now=0)
+    passed = [gate.update(frame(square=(100 + step, 100)), now=step * 0.01) for step in range(1, 40)]
+    assert any(passed)
+
+
+def test_reset_forgets_reference():
+    gate = make_gate()
+    gate.update(frame(), now=0)
+    gate.reset()
+    assert gate.update(frame(), now=0.1)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        MotionGate(method='optical-flow')
+
+
+def test_mog2_detects_new_object():
+    gate = make_gate(method='mog2')
+    for step in range(30):
+        gate.update(frame(), now=step * 0.01)
+    assert gate.update(frame(square=(100, 100)), now=0.5)
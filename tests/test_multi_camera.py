@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from src.features.multi_camera import FairFrameScheduler, parse_sources
+
+
+def test_parse_sources():
+    assert parse_sources("0, 1, rtsp://cam/stream , clip.mp4,") == [0, 1, "rtsp://cam/stream", "clip.mp4"]
+    assert parse_sources("") == []
+    assert parse_sources([0, "a.mp4"]) == [0, "a.mp4"]
+
+
+def test_newest_frame_replaces_pending_one():
+    scheduler = FairFrameScheduler()
+    scheduler.submit("a", 1)
+    scheduler.submit("a", 2)
+    assert scheduler.next(timeout=0) == ("a", 2)
+    assert scheduler.dropped == 1
+    assert scheduler.next(timeout=0) is None
+
+
+def test_sources_are_served_round_robin():
+    scheduler = FairFrameScheduler()
+    for frame in range(3):
+        scheduler.submit("fast", frame)
+    scheduler.submit("slow", 0)
+    order = []
+    for _ in range(2):
+        source, _ = scheduler.next(timeout=0)
+        order.append(source)
+        scheduler.done(source)
+    assert order == ["fast", "slow"]
+
+
+def test_busy_source_is_not_handed_out_twice():
+    scheduler = FairFrameScheduler()
+    scheduler.submit("a", 1)
+    assert scheduler.next(timeout=0) == ("a", 1)
+    scheduler.submit("a", 2)
+    assert scheduler.next(timeout=0) is None
+    scheduler.done("a")
+    assert scheduler.next(timeout=0) == ("a", 2)
+
+
+def test_next_wakes_up_on_submit():
+    scheduler = FairFrameScheduler()
+    threading.Timer(0.02, scheduler.submit, args=("a", 1)).start()
+    assert scheduler.next(timeout=1) == ("a", 1)
+
+
+def test_clear_drops_pending_frames():
+    scheduler = FairFrameScheduler()
+    scheduler.submit("a", 1)
+    scheduler.clear()
+    assert scheduler.next(timeout=0) is None
+
+
+def test_manager_failure_reports_worker_and_source_errors():
+    from src.features.multi_camera import MultiCameraManager
+
+    manager = MultiCameraManager([0, 1], workers=1)
+    assert manager.failure() is None
+    manager.sources[0].error = "cannot open source 0"
+    # Nguồn không mở được (cap là None) đã được báo khi khởi động
+    assert manager.failure() is None
+    manager.sources[1].cap = object()
+    manager.sources[1].error = ValueError("bad frame")
+    assert "bad frame" in manager.failure()
+    manager.error = RuntimeError("no model")
+    assert "no model" in manager.failure()
+
+
+def test_manager_failure_when_all_workers_exited():
+    from src.features.multi_camera import MultiCameraManager
+
+    manager = MultiCameraManager([0], workers=1)
+    worker = threading.Thread(target=lambda: None)
+    worker.start()
+    worker.join()
+    manager._threads = [worker]
+    assert manager.failure() is not None
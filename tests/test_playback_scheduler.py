@@ -0,0 +1,42 @@
+from src.features.playback_scheduler import PlaybackClock
+
+
+def test_invalid_fps_falls_back_to_default():
+    from src.config import PLAYBACK_DEFAULT_FPS
+
+    assert PlaybackClock(0).fps == PLAYBACK_DEFAULT_FPS
+    assert PlaybackClock(None).fps == PLAYBACK_DEFAULT_FPS
+
+
+def test_presentation_schedule_follows_fps():
+    clock = PlaybackClock(25)
+    clock.reset(now=100.0)
+    assert clock.presentation_time(0) == 100.0
+    assert clock.presentation_time(25) == 101.0
+    assert clock.delay_ms(now=100.0) == 1
+    clock.present(now=100.0)
+    assert clock.delay_ms(now=100.0) == 40
+
+
+def test_frames_are_dropped_only_past_threshold():
+    clock = PlaybackClock(10, drop_threshold=3)
+    clock.reset(now=0.0)
+    assert clock.frames_to_drop(now=0.25) == 0
+    assert clock.frames_to_drop(now=0.55) == 5
+    clock.drop(5)
+    assert clock.next_index == 5
+    assert clock.stats()['dropped_frames'] == 5
+
+
+def test_inference_is_skipped_when_lagging():
+    clock = PlaybackClock(10, inference_max_lag=0.05)
+    clock.reset(now=0.0)
+    assert clock.present(now=0.01) == 0.01
+    assert clock.should_infer()
+    # Frame thứ hai đến hạn ở 0.1 s nhưng chỉ được hiển thị ở 0.2 s
+    assert round(clock.present(now=0.2), 6) == 0.1
+    assert not clock.should_infer()
+    stats = clock.stats()
+    assert stats['presented_frames'] == 2
+    assert stats['skipped_inference'] == 1
+    assert stats['max_lag_ms'] == 100.0
@@ -0,0 +1,78 @@
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from src.utils import render_utils
+from src.utils.render_utils import ScaledImageRenderer, fit_size
+
+
+class FakeCanvas:
+    """The few Tk canvas calls the renderer makes, without a display."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.image = None
+
+    def create_image(self, x, y, anchor):
+        return 1
+
+    def itemconfig(self, item, image):
+        self.image = image
+
+    def coords(self, item, x, y):
+        pass
+
+    def after(self, delay, callback, *args):
+        job = f"after#{len(self.jobs)}"
+        self.jobs[job] = (callback, args)
+        return job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def winfo_exists(self):
+        return True
+
+
+class BrokenImage:
+    size = (400, 300)
+
+    def resize(self, size, resample):
+        raise OSError("truncated image")
+
+
+@pytest.fixture(autouse=True)
+def no_tk_photo(monkeypatch):
+    monkeypatch.setattr(render_utils.ImageTk, 'PhotoImage', lambda image: image)
+
+
+def test_fit_size_keeps_aspect_ratio():
+    assert fit_size((400, 300), 200, 200) == (200, 150)
+    assert fit_size((300, 400), 200, 200) == (150, 200)
+
+
+def test_resize_is_debounced_and_cached():
+    canvas = FakeCanvas()
+    renderer = ScaledImageRenderer(canvas, Image.new('RGB', (400, 300)))
+    renderer.render(200, 150)
+    renderer.schedule(100, 75)
+    assert canvas.image.size == (100, 75)
+    assert len(canvas.jobs) == 1
+    renderer.schedule(200, 150)
+    # Size already rendered: shown from the cache, pending job dropped
+    assert canvas.jobs == {}
+    assert canvas.image.size == (200, 150)
+
+
+def test_render_errors_go_to_on_error():
+    errors = []
+    renderer = ScaledImageRenderer(FakeCanvas(), BrokenImage(), on_error=errors.append)
+    renderer.render(200, 150)
+    renderer.schedule(100, 75)
+    assert [str(e) for e in errors] == ["truncated image", "truncated image"]
+
+
+def test_render_errors_raise_without_on_error():
+    renderer = ScaledImageRenderer(FakeCanvas(), BrokenImage())
+    with pytest.raises(OSError):
+        renderer.render(200, 150)
@@ -0,0 +1,109 @@
+import threading
+import time
+
+import pytest
+
+from src.features.request_batcher import MicroBatcher, BatcherOverloaded
+
+
+def make_batcher(process_batch=None, **kwargs):
+    calls = []
+
+    def record(items):
+        calls.append(list(items))
+        return process_batch(items) if process_batch else [item * 2 for item in items]
+
+    batcher = MicroBatcher(record, **kwargs)
+    return batcher, calls
+
+
+def test_single_item_is_flushed_at_deadline():
+    batcher, calls = make_batcher(max_batch_size=8, max_wait=0.05)
+    batcher.start()
+    try:
+        start = time.monotonic()
+        future = batcher.submit(21)
+        assert future.result(timeout=1) == 42
+        assert time.monotonic() - start >= 0.04
+        assert calls == [[21]]
+    finally:
+        batcher.stop()
+
+
+def test_full_batch_does_not_wait_for_deadline():
+    batcher, calls = make_batcher(max_batch_size=3, max_wait=5.0)
+    batcher.start()
+    try:
+        futures = [batcher.submit(i) for i in range(3)]
+        assert [f.result(timeout=1) for f in futures] == [0, 2, 4]
+        assert calls == [[0, 1, 2]]
+    finally:
+        batcher.stop()
+
+
+def test_requests_beyond_max_batch_are_split():
+    gate = threading.Event()
+
+    def slow(items):
+        gate.wait(1)
+        return items
+
+    batcher, calls = make_batcher(slow, max_batch_size=2, max_wait=0.01)
+    # Xếp hàng trước khi khởi động để mọi yêu cầu có sẵn khi gom batch
+    futures = [batcher.submit(i) for i in range(5)]
+    batcher.start()
+    gate.set()
+    try:
+        assert [f.result(timeout=1) for f in futures] == list(range(5))
+        assert [len(batch) for batch in calls] == [2, 2, 1]
+        assert batcher.stats()['max_batch_size'] == 2
+    finally:
+        batcher.stop()
+
+
+def test_submit_rejects_when_queue_is_full():
+    batcher, _ = make_batcher(max_queue=2)
+    batcher.submit(1)
+    batcher.submit(2)
+    with pytest.raises(BatcherOverloaded):
+        batcher.submit(3)
+    assert batcher.stats()['rejected'] == 1
+    batcher.stop()
+
+
+def test_stop_fails_pending_futures():
+    batcher, _ = make_batcher()
+    future = batcher.submit(1)
+    batcher.stop()
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
+    with pytest.raises(RuntimeError):
+        batcher.submit(2)
+
+
+def test_process_errors_fail_the_whole_batch():
+    def broken(items):
+        raise ValueError("boom")
+
+    batcher, _ = make_batcher(broken, max_batch_size=2, max_wait=0.01)
+    futures = [batcher.submit(i) for i in range(2)]
+    batcher.start()
+    try:
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=1)
+        assert batcher.stats()['failed'] == 2
+    finally:
+        batcher.stop()
+
+
+def test_short_result_list_fails_every_future():
+    batcher, _ = make_batcher(lambda items: items[:-1], max_batch_size=3, max_wait=0.01)
+    futures = [batcher.submit(i) for i in range(3)]
+    batcher.start()
+    try:
+        for future in futures:
+            with pytest.raises(RuntimeError, match="2 results for 3 items"):
+                future.result(timeout=1)
+    finally:
+        batcher.stop()
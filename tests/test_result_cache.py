@@ -0,0 +1,72 @@
+import pytest
+
+from src.features.result_cache import ResultCache, content_hash
+
+FACES = [{'box': [1, 2, 3, 4], 'emotions': {'happy': 0.75}}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), max_entries=3, evict_every=1)
+    yield cache
+    cache.close()
+
+
+def test_content_hash_is_stable():
+    assert content_hash(b"abc") == content_hash(bytearray(b"abc"))
+    assert content_hash(b"abc") != content_hash(b"abd")
+
+
+def test_round_trip_and_counters(cache):
+    assert cache.get("d1", "model-a") is None
+    cache.put("d1", "model-a", FACES)
+    assert cache.get("d1", "model-a") == FACES
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_results_are_keyed_by_model(cache):
+    cache.put("d1", "model-a", FACES)
+    assert cache.get("d1", "model-b") is None
+
+
+def test_get_or_compute_only_computes_once(cache):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return FACES
+
+    assert cache.get_or_compute("d1", "m", compute) == FACES
+    assert cache.get_or_compute("d1", "m", compute) == FACES
+    assert len(calls) == 1
+
+
+def test_least_recently_used_entries_are_evicted(cache, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr("src.features.result_cache.time.time", lambda: next(clock))
+    for digest in ("a", "b", "c"):
+        cache.put(digest, "m", [])
+    # "a" được dùng lại nên "b" là mục cũ nhất
+    cache.get("a", "m")
+    cache.put("d", "m", [])
+    assert len(cache) == 3
+    assert cache.get("b", "m") is None
+    assert cache.get("a", "m") == []
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    first = ResultCache(path)
+    first.put("d1", "m", FACES)
+    first.close()
+    second = ResultCache(path)
+    try:
+        assert second.get("d1", "m") == FACES
+    finally:
+        second.close()
+
+
+def test_clear(cache):
+    cache.put("d1", "m", FACES)
+    cache.clear()
+    assert len(cache) == 0
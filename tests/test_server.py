@@ -0,0 +1,144 @@
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("werkzeug")
+
+from werkzeug.exceptions import BadRequest
+from werkzeug.test import Client
+
+from src import server
+from src.features.request_batcher import MicroBatcher
+from src.server import InferenceService, decode_image_bytes
+
+FACE = {'box': [0, 0, 1, 1], 'emotions': {'happy': 1.0}}
+
+
+@pytest.fixture
+def service():
+    svc = InferenceService(max_batch_size=4, max_wait_ms=1, max_queue=4, max_inflight=8, request_timeout=1)
+    svc.seen = []
+
+    def fake_batch(frames):
+        svc.seen.extend(frame.shape for frame in frames)
+        return [[FACE] for _ in frames]
+
+    svc.batcher.process_batch = fake_batch
+    svc.ready = True
+    svc.batcher.start()
+    yield svc
+    svc.stop()
+
+
+def post_jpeg(client, image=None):
+    image = np.zeros((8, 8, 3), dtype=np.uint8) if image is None else image
+    data = cv2.imencode('.jpg', image)[1].tobytes()
+    return client.post('/detect', data=data, content_type='image/jpeg')
+
+
+def test_decode_image_bytes_rejects_garbage():
+    with pytest.raises(BadRequest):
+        decode_image_bytes(b'not an image')
+
+
+def test_detect_jpeg(service):
+    response = post_jpeg(Client(service))
+    assert response.status_code == 200
+    assert response.get_json() == [FACE]
+    assert service.seen == [(8, 8, 3)]
+
+
+def test_detect_raw_pixels(service):
+    data = bytes(2 * 3 * 3)
+    response = Client(service).post('/detect?width=3&height=2', data=data, content_type='application/octet-stream')
+    assert response.status_code == 200
+    assert service.seen == [(2, 3, 3)]
+
+
+def test_detect_raw_gray_pixels_are_converted(service):
+    response = Client(service).post('/detect?width=3&height=2&channels=1', data=bytes(6),
+                                    content_type='application/octet-stream')
+    assert response.status_code == 200
+    assert service.seen == [(2, 3, 3)]
+
+
+@pytest.mark.parametrize("query, size", [
+    ("width=3&height=2", 5),
+    ("width=3&height=x", 18),
+    ("width=3&height=2&channels=4", 24)
+])
+def test_detect_raw_pixels_bad_shape(service, query, size):
+    response = Client(service).post(f'/detect?{query}', data=bytes(size), content_type='application/octet-stream')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_detect_undecodable_image(service):
+    response = Client(service).post('/detect', data=b'garbage', content_type='image/jpeg')
+    assert response.status_code == 400
+
+
+def test_detect_empty_body(service):
+    response = Client(service).post('/detect', data=b'', content_type='image/jpeg')
+    assert response.status_code == 400
+
+
+def test_detect_body_too_large(service, monkeypatch):
+    monkeypatch.setattr(server.ServiceRequest, 'max_content_length', 10)
+    response = Client(service).post('/detect', data=bytes(100), content_type='image/jpeg')
+    assert response.status_code == 413
+
+
+def test_detect_before_models_are_ready(service):
+    service.ready = False
+    response = post_jpeg(Client(service))
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+    assert Client(service).get('/ready').status_code == 503
+
+
+def test_detect_over_inflight_limit(service):
+    for _ in range(service.max_inflight):
+        service._inflight.acquire()
+    try:
+        response = post_jpeg(Client(service))
+    finally:
+        for _ in range(service.max_inflight):
+            service._inflight.release()
+    assert response.status_code == 503
+    assert service.throttled == 1
+
+
+def test_detect_when_batch_queue_is_full(service):
+    # Bộ gom batch chưa chạy nên hàng đợi không được tiêu thụ
+    service.batcher.stop()
+    service.batcher = MicroBatcher(lambda frames: frames, max_queue=1)
+    service.batcher.submit(None)
+    response = post_jpeg(Client(service))
+    assert response.status_code == 503
+    assert 'overloaded' in response.get_json()['error']
+
+
+def test_detect_timeout(service):
+    release = threading.Event()
+
+    def stuck(frames):
+        release.wait(2)
+        return [[] for _ in frames]
+
+    service.batcher.process_batch = stuck
+    service.request_timeout = 0.05
+    try:
+        response = post_jpeg(Client(service))
+    finally:
+        release.set()
+    assert response.status_code == 504
+
+
+def test_metrics_and_unknown_route(service):
+    post_jpeg(Client(service))
+    metrics = Client(service).get('/metrics').get_json()
+    assert metrics['batcher']['submitted'] == 1
+    assert Client(service).get('/nope').status_code == 404
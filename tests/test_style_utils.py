@@ -0,0 +1,56 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from src.utils import style_utils
+from src.utils.style_utils import _build_shadow, _nine_slice_indices, add_box_shadow, get_box_shadow
+
+
+def full_blur_alpha(size, offset, blur_radius, alpha):
+    """Bóng đổ làm mờ trên toàn bộ ảnh (cách làm trước khi có nine-slice)"""
+    width, height = size
+    mask = Image.new("L", (width + abs(offset[0]) + blur_radius * 2, height + abs(offset[1]) + blur_radius * 2), 0)
+    ImageDraw.Draw(mask).rectangle([blur_radius, blur_radius, width + blur_radius, height + blur_radius], fill=alpha)
+    return np.asarray(mask.filter(ImageFilter.GaussianBlur(blur_radius)), dtype=np.int16)
+
+
+def test_nine_slice_indices_repeat_centre():
+    indices = _nine_slice_indices(8, 5, 2)
+    assert indices.tolist() == [0, 1, 2, 2, 2, 2, 3, 4]
+    assert _nine_slice_indices(5, 5, 2).tolist() == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("size", [(300, 200), (37, 500), (20, 20)])
+def test_nine_slice_shadow_matches_full_blur(size):
+    shadow = _build_shadow(size, (2, 2), 4, (0, 0, 0, 77))
+    expected = full_blur_alpha(size, (2, 2), 4, 77)
+    alpha = np.asarray(shadow.getchannel("A"), dtype=np.int16)
+    assert alpha.shape == expected.shape
+    assert np.abs(alpha - expected).max() <= 1
+
+
+def test_shadow_keeps_colour():
+    shadow = _build_shadow((50, 40), (2, 2), 4, (10, 20, 30, 77))
+    assert shadow.mode == "RGBA"
+    assert shadow.getpixel((25, 20))[:3] == (10, 20, 30)
+
+
+def test_shadows_are_cached_per_key(monkeypatch):
+    monkeypatch.setattr(style_utils, "_shadow_cache", style_utils.OrderedDict())
+    monkeypatch.setattr(style_utils, "SHADOW_CACHE_SIZE", 2)
+    first = get_box_shadow((10, 10))
+    assert get_box_shadow((10, 10)) is first
+    get_box_shadow((20, 10))
+    get_box_shadow((30, 10))
+    assert get_box_shadow((10, 10)) is not first
+
+
+def test_add_box_shadow_does_not_modify_cached_shadow():
+    image = Image.new("RGB", (40, 30), (255, 0, 0))
+    result = add_box_shadow(image)
+    assert result.size == (40 + 2 + 8, 30 + 2 + 8)
+    assert result.getpixel((20, 15)) == (255, 0, 0, 255)
+    assert get_box_shadow((40, 30)).getpixel((20, 15))[:3] == (0, 0, 0)
@@ -0,0 +1,76 @@
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from src.features import video_exporter
+from src.features.video_exporter import export_annotated_video, mux_audio
+
+
+class FakeClip:
+    def __init__(self, path, opened, fail_paths):
+        if path in fail_paths:
+            raise OSError(f"cannot read '{path}'")
+        self.path = path
+        self.audio = object()
+        self.closed = False
+        opened.append(self)
+
+    def set_audio(self, audio):
+        return self
+
+    def write_videofile(self, output_path, **kwargs):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def moviepy(monkeypatch):
+    opened, fail_paths = [], set()
+    editor = types.ModuleType('moviepy.editor')
+    editor.VideoFileClip = lambda path: FakeClip(path, opened, fail_paths)
+    monkeypatch.setitem(sys.modules, 'moviepy', types.ModuleType('moviepy'))
+    monkeypatch.setitem(sys.modules, 'moviepy.editor', editor)
+    return opened, fail_paths
+
+
+def test_mux_audio_closes_both_clips(moviepy):
+    opened, _ = moviepy
+    assert mux_audio('video.mp4', 'source.mp4', 'out.mp4')
+    assert [clip.closed for clip in opened] == [True, True]
+
+
+def test_mux_audio_closes_source_when_video_fails_to_open(moviepy):
+    opened, fail_paths = moviepy
+    fail_paths.add('video.mp4')
+    with pytest.raises(OSError):
+        mux_audio('video.mp4', 'source.mp4', 'out.mp4')
+    assert [(clip.path, clip.closed) for clip in opened] == [('source.mp4', True)]
+
+
+class EmptyDecoder:
+    fps = 25.0
+    frame_count = 0
+
+    def __init__(self, file_path):
+        pass
+
+    def start(self):
+        return self
+
+    def stop(self):
+        pass
+
+    def __iter__(self):
+        return iter(())
+
+
+def test_export_without_frames_fails_clearly(monkeypatch, tmp_path):
+    monkeypatch.setattr(video_exporter, 'VideoDecoder', EmptyDecoder)
+    with pytest.raises(IOError, match="No frames decoded"):
+        export_annotated_video('empty.mp4', str(tmp_path / "out.mp4"), detector=object(), keep_audio=True)